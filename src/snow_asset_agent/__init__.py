@@ -7,7 +7,7 @@ Asset Management tables.
 
 from __future__ import annotations
 
-from snow_asset_agent.client import ServiceNowClient
+from snow_asset_agent.client import BatchOp, BatchResult, ServiceNowClient
 from snow_asset_agent.config import AssetAgentConfig, get_config
 from snow_asset_agent.exceptions import (
     ServiceNowAPIError,
@@ -36,6 +36,8 @@ __all__ = [
     "AssetContract",
     "AssetHealthMetric",
     "AssetLifecycle",
+    "BatchOp",
+    "BatchResult",
     "HardwareAsset",
     "ServiceNowAPIError",
     "ServiceNowAuthError",
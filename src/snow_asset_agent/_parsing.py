@@ -0,0 +1,124 @@
+"""Field parsers applied to raw ServiceNow values.
+
+These run once per field on every scanned record, so they are kept in
+their own module: free of pydantic, fully annotated and limited to the
+subset of Python that mypyc compiles, so the module can be built as a C
+extension without changing callers.
+"""
+
+from __future__ import annotations
+
+import functools
+from datetime import date, datetime
+from typing import Any
+
+# A raw reference column: a sys_id string, or a ``{"value", "display_value"}``
+# dict when the API is asked for display values.
+RefValue = str | dict[str, str] | None
+
+
+def _parse_date(value: str | date | None) -> date | None:
+    """Best-effort parse of a ServiceNow date string."""
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    return _parse_date_text(str(value)[:10])
+
+
+def _parse_date_iso(value: str | date | None) -> str | None:
+    """:func:`_parse_date` rendered as ``YYYY-MM-DD``, as pydantic's JSON mode does."""
+    parsed = _parse_date(value)
+    return parsed.isoformat() if parsed else None
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_date_text(text: str) -> date | None:
+    """Parse a ``YYYY-MM-DD`` prefix; cached because scans repeat the same dates."""
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        try:
+            return date(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+        except ValueError:
+            pass
+    # Slow path for non-padded forms such as ``2024-6-5``.
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _parse_float(value: str | float | None) -> float | None:
+    """Best-effort parse of a numeric string from ServiceNow."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, float):
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_int(value: str | float | None) -> int | None:
+    """Best-effort parse of an integer string from ServiceNow."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
+    try:
+        return int(float(value))
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _safe_float(value: str | int | float | None) -> float:
+    """Parse a ServiceNow numeric value, defaulting to 0.0.
+
+    Dispatches on the exact type first so the common cases never enter a
+    ``try`` block; only unusual strings reach :func:`_slow_safe_float`.
+    """
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
+    if value is None or value == "":
+        return 0.0
+    return _slow_safe_float(value)
+
+
+def _slow_safe_float(value: str | float) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _safe_int(value: str | int | float | None) -> int:
+    """Parse a ServiceNow integer value, truncating decimals and defaulting to 0."""
+    if type(value) is int:
+        return value
+    if type(value) is str and value.isdecimal():
+        return int(value)
+    if value is None or value == "":
+        return 0
+    try:
+        return int(_slow_safe_float(value))
+    except (ValueError, OverflowError):
+        # "nan", "inf" and out-of-range exponents parse as non-finite floats.
+        return 0
+
+
+def _ref(record: dict[str, Any], key: str, sub: str = "display_value") -> Any:
+    """Return a field value, unwrapping ``{"value", "display_value"}`` reference dicts."""
+    value = record.get(key)
+    return value.get(sub) if isinstance(value, dict) else value
+
+
+def _display(value: RefValue) -> str | None:
+    """Unwrap a reference dict to its ``display_value``."""
+    return value.get("display_value") if isinstance(value, dict) else value
+
+
+def _value(value: RefValue) -> str | None:
+    """Unwrap a reference dict to its ``value`` (the referenced sys_id)."""
+    return value.get("value") if isinstance(value, dict) else value
@@ -0,0 +1,120 @@
+"""In-process TTL cache for snow-asset-agent.
+
+Provides a small thread-safe cache with per-entry expiry and LRU
+eviction, used to avoid repeated ServiceNow round-trips for data that
+rarely changes between calls.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from snow_asset_agent.config import get_config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+F = TypeVar("F", bound="Callable[..., dict[str, Any]]")
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire *ttl* seconds after insertion.
+
+    Least-recently-used entries are evicted once *maxsize* is exceeded.
+    All operations hold a lock so one instance can be shared across
+    worker threads.
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for *key*, or *default* if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store *value* under *key* for *ttl* seconds (default: the cache TTL)."""
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard_if(self, predicate: Callable[[Any], bool]) -> None:
+        """Remove every entry whose key satisfies *predicate*."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+_tool_results = TTLCache(maxsize=256)
+
+
+def ttl_cached(ttl: float | None = None) -> Callable[[F], F]:
+    """Memoise a keyword-only tool function for *ttl* seconds.
+
+    *ttl* defaults to ``tool_cache_ttl_seconds`` from the active config,
+    read on each call; a TTL of 0 disables caching.  Results are keyed on
+    the function name, its keyword arguments and today's date, so
+    date-relative tools never serve yesterday's answer.  Calls that inject
+    their own ``client`` bypass the cache, as do results carrying an
+    ``"error"`` key.  Cached dicts are shared between callers and must be
+    treated as read-only.
+    """
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(**kwargs: Any) -> dict[str, Any]:
+            lifetime = get_config().tool_cache_ttl_seconds if ttl is None else ttl
+            if kwargs.get("client") is not None or lifetime <= 0:
+                return fn(**kwargs)
+            try:
+                key: Hashable = (fn.__name__, date.today(), frozenset(kwargs.items()))
+                hash(key)
+            except TypeError:
+                return fn(**kwargs)
+            cached = _tool_results.get(key)
+            if cached is not None:
+                return cached  # type: ignore[no-any-return]
+            result = fn(**kwargs)
+            if "error" not in result:
+                _tool_results.set(key, result, lifetime)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def clear_tool_cache() -> int:
+    """Drop every memoised tool result and return how many were removed."""
+    count = len(_tool_results)
+    _tool_results.clear()
+    return count
@@ -7,26 +7,122 @@ mapping to the custom exception hierarchy.
 
 from __future__ import annotations
 
+import base64
+import json
 import logging
+import threading
 import time
-from typing import Any
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self, TypeVar, cast
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+from snow_asset_agent.cache import TTLCache
 from snow_asset_agent.config import AssetAgentConfig, get_config
 from snow_asset_agent.exceptions import (
     ServiceNowAPIError,
     ServiceNowAuthError,
     ServiceNowConnectionError,
+    ServiceNowError,
     ServiceNowNotFoundError,
     ServiceNowPermissionError,
     ServiceNowRateLimitError,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from snow_asset_agent.models import SnowRecordModel
+
+M = TypeVar("M", bound="SnowRecordModel")
+
 logger = logging.getLogger(__name__)
 
+# ServiceNow truncates encoded queries beyond this length, so batched
+# ``sys_idIN`` lookups are split on joined length as well as id count.
+_MAX_QUERY_LENGTH = 1024
+
+# HTTP status -> (exception class, message template) for _raise_for_status.
+_STATUS_MAP: dict[int, tuple[type[ServiceNowError], str]] = {
+    401: (ServiceNowAuthError, "Authentication failed for table '{table}': {detail}"),
+    403: (ServiceNowPermissionError, "Permission denied for table '{table}': {detail}"),
+    404: (ServiceNowNotFoundError, "Not found on table '{table}': {detail}"),
+    429: (ServiceNowRateLimitError, "Rate-limited on table '{table}': {detail}"),
+}
+_DEFAULT_STATUS_ERROR: tuple[type[ServiceNowError], str] = (
+    ServiceNowAPIError,
+    "API error {status} on table '{table}': {detail}",
+)
+
+# ServiceNow caps the number of sub-requests in one Batch API call.
+_MAX_BATCH_SIZE = 100
+
+# Headers sent with every Batch API sub-request.
+_BATCH_HEADERS = [
+    {"name": "Accept", "value": "application/json"},
+    {"name": "Content-Type", "value": "application/json"},
+]
+
+# Upper bound on single-record lookups kept by :meth:`ServiceNowClient.get_record`.
+_RECORD_CACHE_SIZE = 4096
+
+
+def _with_sys_id_tiebreak(query: str) -> str:
+    """Append ``ORDERBYsys_id`` so offset pages see a total, stable order.
+
+    It goes after any caller ordering: a sort key such as ``ends`` is not
+    unique, and ties would otherwise shift between concurrent pages.
+    """
+    return f"{query}^ORDERBYsys_id" if query else "ORDERBYsys_id"
+
+
+def _status_error(status: int, table: str, detail: str) -> ServiceNowError:
+    """Build the typed exception for an error *status* on *table*."""
+    exc_cls, template = _STATUS_MAP.get(status, _DEFAULT_STATUS_ERROR)
+    return exc_cls(
+        template.format(status=status, table=table, detail=detail),
+        status_code=status,
+        table_name=table,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class BatchOp:
+    """One write request sent through :meth:`ServiceNowClient.batch`.
+
+    *method* is ``"POST"`` (create, no *sys_id*), ``"PATCH"`` or
+    ``"DELETE"``.
+    """
+
+    method: str
+    table: str
+    sys_id: str | None = None
+    data: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """Outcome of one :class:`BatchOp`; *error* is set instead of raised."""
+
+    op: BatchOp
+    status_code: int
+    result: dict[str, Any] | None = None
+    error: ServiceNowError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 class ServiceNowClient:
     """Low-level REST client for the ServiceNow Table API.
@@ -40,7 +136,38 @@ class ServiceNowClient:
     def __init__(self, config: AssetAgentConfig | None = None) -> None:
         self._config = config or get_config()
         self._base_url = self._config.base_url
+        self._timeout = self._config.servicenow_timeout
         self._session = self._build_session()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._config.servicenow_max_workers,
+            thread_name_prefix="snow-asset-agent",
+        )
+        self._record_cache = TTLCache(maxsize=_RECORD_CACHE_SIZE, ttl=self._config.cache_ttl_seconds)
+        self._inflight: dict[tuple[Any, ...], Future[list[dict[str, Any]]]] = {}
+        self._inflight_lock = threading.Lock()
+        if self._config.servicenow_warm_up:
+            # Pay the TCP/TLS handshake off the caller's path so the first
+            # real request reuses a pooled socket; ping() never raises.
+            self._pool.submit(self.ping)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Shut down the worker pool and release pooled connections.
+
+        Queued calls that have not started are cancelled; running calls
+        are allowed to finish first.
+        """
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Session helpers
@@ -53,19 +180,44 @@ class ServiceNowClient:
             {
                 "Accept": "application/json",
                 "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
             }
         )
+        # Jittered backoff keeps concurrent workers from retrying in lock-step
+        # against rate limits, and Retry-After is honoured on 429/503.  Once
+        # retries are exhausted the last response is returned so that
+        # _raise_for_status maps it to a typed exception.
         retry = Retry(
             total=self._config.servicenow_max_retries,
-            backoff_factor=0.5,
+            backoff_factor=1.0,
+            backoff_jitter=0.5,
+            respect_retry_after_header=True,
+            raise_on_status=False,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST", "PATCH", "PUT", "DELETE"],
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # Size the pool for concurrent fan-out; urllib3 otherwise discards
+        # sockets beyond its default of 10 and re-handshakes TLS.
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_maxsize=self._config.servicenow_pool_size,
+            pool_block=False,
+        )
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         return session
 
+    def run_concurrently(self, *calls: Callable[[], Any]) -> list[Any]:
+        """Run independent zero-argument *calls* on the client's thread pool.
+
+        Lets a tool overlap several table queries so wall time is the
+        slowest call rather than the sum.  Results are returned in argument
+        order; the first failure (in argument order) is re-raised.
+        """
+        futures = [self._pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
     # ------------------------------------------------------------------
     # Error mapping
     # ------------------------------------------------------------------
@@ -78,40 +230,12 @@ class ServiceNowClient:
 
         status = response.status_code
         try:
-            body = response.json()
+            body = _json_loads(response.content)
             detail = body.get("error", {}).get("message", response.text[:300])
         except Exception:
             detail = response.text[:300]
 
-        if status == 401:
-            raise ServiceNowAuthError(
-                f"Authentication failed for table '{table}': {detail}",
-                status_code=status,
-                table_name=table,
-            )
-        if status == 403:
-            raise ServiceNowPermissionError(
-                f"Permission denied for table '{table}': {detail}",
-                status_code=status,
-                table_name=table,
-            )
-        if status == 404:
-            raise ServiceNowNotFoundError(
-                f"Not found on table '{table}': {detail}",
-                status_code=status,
-                table_name=table,
-            )
-        if status == 429:
-            raise ServiceNowRateLimitError(
-                f"Rate-limited on table '{table}': {detail}",
-                status_code=status,
-                table_name=table,
-            )
-        raise ServiceNowAPIError(
-            f"API error {status} on table '{table}': {detail}",
-            status_code=status,
-            table_name=table,
-        )
+        raise _status_error(status, table, detail)
 
     # ------------------------------------------------------------------
     # Public CRUD methods
@@ -130,13 +254,50 @@ class ServiceNowClient:
         """Fetch multiple records from *table*.
 
         Returns a list of dicts (the ``result`` array from the ServiceNow
-        response envelope).
+        response envelope).  Concurrent calls with identical arguments are
+        coalesced into one HTTP request; every caller gets its own list,
+        but the record dicts are shared and must not be mutated.
         """
+        key = (table, query, tuple(fields) if fields else None, limit, offset, display_value)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return list(future.result())
+
+        try:
+            records = self._fetch_records(
+                table, query=query, fields=fields, limit=limit, offset=offset, display_value=display_value
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(records)
+            return records
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _fetch_records(
+        self,
+        table: str,
+        *,
+        query: str,
+        fields: list[str] | None,
+        limit: int,
+        offset: int,
+        display_value: str,
+    ) -> list[dict[str, Any]]:
+        """Issue the Table API request behind :meth:`get_records`."""
         url = f"{self._base_url}/table/{table}"
         params: dict[str, Any] = {
             "sysparm_limit": limit,
             "sysparm_offset": offset,
             "sysparm_display_value": display_value,
+            "sysparm_exclude_reference_link": "true",
         }
         if query:
             params["sysparm_query"] = query
@@ -146,7 +307,7 @@ class ServiceNowClient:
         logger.debug("GET %s params=%s", url, {k: v for k, v in params.items()})
 
         try:
-            resp = self._session.get(url, params=params, timeout=self._config.servicenow_timeout)
+            resp = self._session.get(url, params=params, timeout=self._timeout)
         except requests.ConnectionError as exc:
             raise ServiceNowConnectionError(
                 f"Connection error reaching '{table}': {exc}",
@@ -159,9 +320,319 @@ class ServiceNowClient:
             ) from exc
 
         self._raise_for_status(resp, table)
-        data = resp.json()
+        data = _json_loads(resp.content)
         return data.get("result", [])
 
+    def get_records_paged(
+        self,
+        table: str,
+        *,
+        query: str = "",
+        fields: list[str] | None = None,
+        limit: int = 100,
+        page_size: int | None = None,
+        display_value: str = "false",
+    ) -> list[dict[str, Any]]:
+        """Fetch up to *limit* records, splitting large limits into concurrent pages.
+
+        Limits up to *page_size* (default ``servicenow_page_size``) are a
+        single :meth:`get_records` call.  Larger limits are fetched as
+        ``sysparm_offset`` pages on up to ``servicenow_max_workers`` threads,
+        ordered by any ``ORDERBY`` in the query and then by ``sys_id``, and
+        concatenated up to the first short page.
+        """
+        page_size = page_size or self._config.servicenow_page_size
+        if limit <= page_size:
+            return self.get_records(table, query=query, fields=fields, limit=limit, display_value=display_value)
+        return list(
+            self.iter_records_paged(
+                table, query=query, fields=fields, limit=limit, page_size=page_size, display_value=display_value
+            )
+        )
+
+    def iter_records_paged(
+        self,
+        table: str,
+        *,
+        query: str = "",
+        fields: list[str] | None = None,
+        limit: int = 100,
+        page_size: int | None = None,
+        display_value: str = "false",
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily yield up to *limit* records, fetched as concurrent pages.
+
+        The streaming form of :meth:`get_records_paged`: pages are requested
+        with at most ``servicenow_max_workers`` in flight and yielded in
+        order, so a consumer that reduces each record as it arrives never
+        holds the full result set.  Iteration stops at the first short page.
+        """
+        page_size = page_size or self._config.servicenow_page_size
+        if limit <= page_size:
+            yield from self.get_records(table, query=query, fields=fields, limit=limit, display_value=display_value)
+            return
+        query = _with_sys_id_tiebreak(query)
+        max_workers = self._config.servicenow_max_workers
+
+        pending: deque[tuple[int, Future[list[dict[str, Any]]]]] = deque()
+        # A private pool, as in iter_all_records: callers may be running on
+        # ``self._pool`` already.
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                offsets = iter(range(0, limit, page_size))
+                while True:
+                    for offset in offsets:
+                        size = min(page_size, limit - offset)
+                        pending.append(
+                            (
+                                size,
+                                pool.submit(
+                                    self.get_records,
+                                    table,
+                                    query=query,
+                                    fields=fields,
+                                    limit=size,
+                                    offset=offset,
+                                    display_value=display_value,
+                                ),
+                            )
+                        )
+                        if len(pending) >= max_workers:
+                            break
+                    if not pending:
+                        return
+                    size, future = pending.popleft()
+                    page = future.result()
+                    yield from page
+                    if len(page) < size:
+                        return
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def get_records_for_model(
+        self,
+        model: type[M],
+        table: str,
+        *,
+        query: str = "",
+        fields: list[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        display_value: str = "false",
+    ) -> list[M]:
+        """Fetch records from *table* and build *model* instances from them.
+
+        When *fields* is omitted only the columns *model* reads are requested,
+        which keeps wide tables such as ``alm_hardware`` cheap to transfer.
+        """
+        records = self.get_records(
+            table,
+            query=query,
+            fields=fields or model.snow_fields(),
+            limit=limit,
+            offset=offset,
+            display_value=display_value,
+        )
+        return model.from_snow_records(records)
+
+    def iter_records_for_model(
+        self,
+        model: type[M],
+        table: str,
+        *,
+        query: str = "",
+        fields: list[str] | None = None,
+        limit: int = 100,
+        display_value: str = "false",
+    ) -> Iterator[M]:
+        """Lazily yield *model* instances for up to *limit* records.
+
+        Built on :meth:`iter_records_paged`, so only the page in flight is
+        held as raw rows; callers that dump each instance as it arrives keep
+        one list of results instead of a raw copy alongside it.
+        """
+        records = self.iter_records_paged(
+            table,
+            query=query,
+            fields=fields or model.snow_fields(),
+            limit=limit,
+            display_value=display_value,
+        )
+        build = model.from_snow_record
+        for record in records:
+            yield build(record)
+
+    def get_stats(
+        self,
+        table: str,
+        *,
+        query: str = "",
+        group_by: list[str] | None = None,
+        having: str = "",
+        sum_fields: list[str] | None = None,
+        display_value: str = "false",
+    ) -> list[dict[str, Any]]:
+        """Aggregate *table* server-side via the Aggregate API (``/stats/{table}``).
+
+        Returns one entry per group (a single entry when *group_by* is
+        omitted), each shaped ``{"count": int, "sum": {field: float},
+        "group": {field: value}}``.  No rows are transferred.
+        """
+        url = f"{self._base_url}/stats/{table}"
+        params: dict[str, Any] = {"sysparm_count": "true", "sysparm_display_value": display_value}
+        if query:
+            params["sysparm_query"] = query
+        if group_by:
+            params["sysparm_group_by"] = ",".join(group_by)
+        if having:
+            params["sysparm_having"] = having
+        if sum_fields:
+            params["sysparm_sum_fields"] = ",".join(sum_fields)
+
+        logger.debug("GET %s params=%s", url, params)
+
+        try:
+            resp = self._session.get(url, params=params, timeout=self._timeout)
+        except requests.ConnectionError as exc:
+            raise ServiceNowConnectionError(
+                f"Connection error aggregating '{table}': {exc}",
+                table_name=table,
+            ) from exc
+        except requests.Timeout as exc:
+            raise ServiceNowConnectionError(
+                f"Timeout aggregating '{table}': {exc}",
+                table_name=table,
+            ) from exc
+
+        self._raise_for_status(resp, table)
+        result = _json_loads(resp.content).get("result", {})
+        groups = result if isinstance(result, list) else [result]
+        return [_normalize_stats_group(g) for g in groups]
+
+    def count_records(self, table: str, *, query: str = "") -> int:
+        """Return the number of records in *table* matching *query*.
+
+        Uses the Aggregate API (``/stats/{table}``) so no rows are transferred.
+        An empty stats result counts as zero.
+        """
+        groups = self.get_stats(table, query=query)
+        return int(groups[0]["count"]) if groups else 0
+
+    def iter_records(
+        self,
+        table: str,
+        *,
+        query: str = "",
+        fields: list[str] | None = None,
+        page_size: int = 500,
+        display_value: str = "false",
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily yield every record in *table* matching *query*, one page at a time.
+
+        Pages are fetched serially and only when the consumer has drained the
+        previous one, so at most one page is held in memory.  Iteration stops
+        at the first short page; no up-front count is issued.
+        """
+        offset = 0
+        while True:
+            page = self.get_records(
+                table,
+                query=query,
+                fields=fields,
+                limit=page_size,
+                offset=offset,
+                display_value=display_value,
+            )
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def iter_all_records(
+        self,
+        table: str,
+        *,
+        query: str = "",
+        fields: list[str] | None = None,
+        page_size: int = 500,
+        max_workers: int | None = None,
+        display_value: str = "false",
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every record in *table* matching *query*.
+
+        The matching row count is fetched first, then pages are requested
+        concurrently over the pooled session with at most *max_workers*
+        (default ``servicenow_max_workers``) in flight.  Records are yielded in page order; the query is
+        ordered by any ``ORDERBY`` it has and then by ``sys_id`` so that
+        concurrent offsets see a stable ordering.
+        """
+        max_workers = max_workers or self._config.servicenow_max_workers
+        total = self.count_records(table, query=query)
+        query = _with_sys_id_tiebreak(query)
+
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+        # A private pool: callers may already be running on ``self._pool``,
+        # and waiting on it from one of its own workers can deadlock.
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                for offset in range(0, total, page_size):
+                    if len(pending) >= max_workers:
+                        yield from pending.popleft().result()
+                    pending.append(
+                        pool.submit(
+                            self.get_records,
+                            table,
+                            query=query,
+                            fields=fields,
+                            limit=page_size,
+                            offset=offset,
+                            display_value=display_value,
+                        )
+                    )
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def get_records_by_ids(
+        self,
+        table: str,
+        sys_ids: Iterable[str],
+        *,
+        fields: list[str] | None = None,
+        chunk_size: int = 100,
+        display_value: str = "false",
+    ) -> list[dict[str, Any]]:
+        """Fetch the records for *sys_ids* with one ``sys_idIN`` query per chunk.
+
+        Empty and duplicate ids are skipped.  Records are returned in the
+        order ServiceNow yields them, not the order of *sys_ids*.
+        """
+        records: list[dict[str, Any]] = []
+        for chunk in _chunk_ids(sys_ids, chunk_size):
+            records.extend(
+                self.get_records(
+                    table,
+                    query="sys_idIN" + ",".join(chunk),
+                    fields=fields,
+                    limit=len(chunk),
+                    display_value=display_value,
+                )
+            )
+        return records
+
+    def clear_record_cache(self) -> int:
+        """Drop every record cached by :meth:`get_record`; return how many were removed."""
+        count = len(self._record_cache)
+        self._record_cache.clear()
+        return count
+
+    def _invalidate_record(self, table: str, sys_id: str) -> None:
+        """Drop every cached view of ``table/sys_id``."""
+        self._record_cache.discard_if(lambda key: key[0] == table and key[1] == sys_id)
+
     def get_record(
         self,
         table: str,
@@ -169,17 +640,35 @@ class ServiceNowClient:
         *,
         fields: list[str] | None = None,
         display_value: str = "false",
+        cache: bool = False,
     ) -> dict[str, Any]:
-        """Fetch a single record by *sys_id*."""
+        """Fetch a single record by *sys_id*.
+
+        With *cache*, the result is kept per client for
+        ``cache_ttl_seconds`` so repeated reference lookups (models,
+        vendors, locations) cost one GET per id; a cached dict is shared
+        and must not be mutated.  Only this client's own writes invalidate
+        it, so leave *cache* off for rows that change elsewhere, such as
+        assets.
+        """
+        cache_key = (table, sys_id, tuple(fields) if fields else None, display_value)
+        if cache:
+            cached = self._record_cache.get(cache_key)
+            if cached is not None:
+                return cast("dict[str, Any]", cached)
+
         url = f"{self._base_url}/table/{table}/{sys_id}"
-        params: dict[str, Any] = {"sysparm_display_value": display_value}
+        params: dict[str, Any] = {
+            "sysparm_display_value": display_value,
+            "sysparm_exclude_reference_link": "true",
+        }
         if fields:
             params["sysparm_fields"] = ",".join(fields)
 
         logger.debug("GET %s", url)
 
         try:
-            resp = self._session.get(url, params=params, timeout=self._config.servicenow_timeout)
+            resp = self._session.get(url, params=params, timeout=self._timeout)
         except requests.ConnectionError as exc:
             raise ServiceNowConnectionError(
                 f"Connection error reaching '{table}/{sys_id}': {exc}",
@@ -194,8 +683,11 @@ class ServiceNowClient:
             ) from exc
 
         self._raise_for_status(resp, table)
-        data = resp.json()
-        return data.get("result", {})
+        data = _json_loads(resp.content)
+        record = data.get("result", {})
+        if cache:
+            self._record_cache.set(cache_key, record)
+        return record
 
     def create_record(
         self,
@@ -207,7 +699,7 @@ class ServiceNowClient:
         logger.debug("POST %s", url)
 
         try:
-            resp = self._session.post(url, json=data, timeout=self._config.servicenow_timeout)
+            resp = self._session.post(url, json=data, timeout=self._timeout)
         except requests.ConnectionError as exc:
             raise ServiceNowConnectionError(
                 f"Connection error creating record in '{table}': {exc}",
@@ -220,7 +712,7 @@ class ServiceNowClient:
             ) from exc
 
         self._raise_for_status(resp, table)
-        return resp.json().get("result", {})
+        return _json_loads(resp.content).get("result", {})
 
     def update_record(
         self,
@@ -233,7 +725,7 @@ class ServiceNowClient:
         logger.debug("PATCH %s", url)
 
         try:
-            resp = self._session.patch(url, json=data, timeout=self._config.servicenow_timeout)
+            resp = self._session.patch(url, json=data, timeout=self._timeout)
         except requests.ConnectionError as exc:
             raise ServiceNowConnectionError(
                 f"Connection error updating '{table}/{sys_id}': {exc}",
@@ -247,8 +739,9 @@ class ServiceNowClient:
                 sys_id=sys_id,
             ) from exc
 
+        self._invalidate_record(table, sys_id)
         self._raise_for_status(resp, table)
-        return resp.json().get("result", {})
+        return _json_loads(resp.content).get("result", {})
 
     def delete_record(
         self,
@@ -260,7 +753,7 @@ class ServiceNowClient:
         logger.debug("DELETE %s", url)
 
         try:
-            resp = self._session.delete(url, timeout=self._config.servicenow_timeout)
+            resp = self._session.delete(url, timeout=self._timeout)
         except requests.ConnectionError as exc:
             raise ServiceNowConnectionError(
                 f"Connection error deleting '{table}/{sys_id}': {exc}",
@@ -274,9 +767,81 @@ class ServiceNowClient:
                 sys_id=sys_id,
             ) from exc
 
+        self._invalidate_record(table, sys_id)
         self._raise_for_status(resp, table)
         return True
 
+    # ------------------------------------------------------------------
+    # Batch API
+    # ------------------------------------------------------------------
+
+    def batch(self, ops: Sequence[BatchOp]) -> list[BatchResult]:
+        """Send *ops* through the Batch API, up to 100 per HTTP call.
+
+        Results are returned in the order of *ops*.  A failed sub-request is
+        reported on its :class:`BatchResult` using the same exception types
+        as the single-record methods; only a failure of the batch call
+        itself raises.
+        """
+        results: list[BatchResult] = []
+        for start in range(0, len(ops), _MAX_BATCH_SIZE):
+            results.extend(self._send_batch(ops[start : start + _MAX_BATCH_SIZE]))
+        return results
+
+    def _send_batch(self, ops: Sequence[BatchOp]) -> list[BatchResult]:
+        rest_requests: list[dict[str, Any]] = []
+        for index, op in enumerate(ops):
+            path = f"/api/now/table/{op.table}"
+            if op.sys_id:
+                path = f"{path}/{op.sys_id}"
+            sub: dict[str, Any] = {"id": str(index), "method": op.method, "url": path, "headers": _BATCH_HEADERS}
+            if op.data is not None:
+                sub["body"] = base64.b64encode(json.dumps(op.data).encode()).decode()
+            rest_requests.append(sub)
+
+        url = f"{self._base_url}/v1/batch"
+        logger.debug("POST %s (%d requests)", url, len(ops))
+
+        try:
+            resp = self._session.post(
+                url,
+                json={"batch_request_id": uuid.uuid4().hex, "rest_requests": rest_requests},
+                timeout=self._timeout,
+            )
+        except requests.ConnectionError as exc:
+            raise ServiceNowConnectionError(f"Connection error sending batch: {exc}") from exc
+        except requests.Timeout as exc:
+            raise ServiceNowConnectionError(f"Timeout sending batch: {exc}") from exc
+
+        self._raise_for_status(resp, "batch")
+        serviced = {r.get("id"): r for r in _json_loads(resp.content).get("serviced_requests", [])}
+
+        results: list[BatchResult] = []
+        for index, op in enumerate(ops):
+            if op.sys_id:
+                self._invalidate_record(op.table, op.sys_id)
+            sub_resp = serviced.get(str(index))
+            if sub_resp is None:
+                error = ServiceNowAPIError(
+                    f"Batch request was not serviced for table '{op.table}'",
+                    table_name=op.table,
+                    sys_id=op.sys_id,
+                )
+                results.append(BatchResult(op, 0, error=error))
+                continue
+            status = int(sub_resp.get("status_code") or 0)
+            raw = base64.b64decode(sub_resp["body"]) if sub_resp.get("body") else b""
+            try:
+                body = _json_loads(raw) if raw else {}
+            except ValueError:
+                body = {"error": {"message": raw[:300].decode(errors="replace")}}
+            if 200 <= status < 300:
+                results.append(BatchResult(op, status, result=body.get("result", {})))
+            else:
+                detail = body.get("error", {}).get("message", "")
+                results.append(BatchResult(op, status, error=_status_error(status, op.table, detail)))
+        return results
+
     # ------------------------------------------------------------------
     # Convenience: health ping
     # ------------------------------------------------------------------
@@ -293,5 +858,31 @@ class ServiceNowClient:
             return {"status": "error", "error": str(exc), "response_time_s": elapsed}
 
 
-# Re-export for convenience
-ServiceNowError = ServiceNowConnectionError.__bases__[0]
+def _normalize_stats_group(group: dict[str, Any]) -> dict[str, Any]:
+    """Flatten one Aggregate API result entry into count / sum / group."""
+    stats = group.get("stats", {})
+    return {
+        "count": int(stats.get("count") or 0),
+        "sum": {field: float(value or 0) for field, value in stats.get("sum", {}).items()},
+        "group": {
+            f["field"]: f.get("display_value", f.get("value"))
+            for f in group.get("groupby_fields", [])
+        },
+    }
+
+
+def _chunk_ids(sys_ids: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    """Split *sys_ids* into chunks bounded by count and ``sys_idIN`` query length."""
+    chunk: list[str] = []
+    length = len("sys_idIN")
+    for sys_id in dict.fromkeys(s for s in sys_ids if s):
+        added = len(sys_id) + (1 if chunk else 0)
+        if chunk and (len(chunk) >= chunk_size or length + added > _MAX_QUERY_LENGTH):
+            yield chunk
+            chunk = []
+            length = len("sys_idIN")
+            added = len(sys_id)
+        chunk.append(sys_id)
+        length += added
+    if chunk:
+        yield chunk
@@ -9,10 +9,14 @@ from __future__ import annotations
 
 import functools
 import logging
+from typing import TYPE_CHECKING, Any, Self
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,6 +54,36 @@ class AssetAgentConfig(BaseSettings):
         alias="SERVICENOW_MAX_RETRIES",
         description="Max retry attempts for transient errors",
     )
+    servicenow_max_workers: int = Field(
+        8,
+        alias="SERVICENOW_MAX_WORKERS",
+        description="Max concurrent requests a client issues for fan-out queries",
+    )
+    servicenow_pool_size: int = Field(
+        32,
+        alias="SERVICENOW_POOL_SIZE",
+        description="Max keep-alive connections pooled per ServiceNow host",
+    )
+    servicenow_page_size: int = Field(
+        100,
+        alias="SERVICENOW_PAGE_SIZE",
+        description="Rows per request when a large limit is split into concurrent pages",
+    )
+    servicenow_warm_up: bool = Field(
+        False,
+        alias="SERVICENOW_WARM_UP",
+        description="Open a pooled connection in the background when a client is created",
+    )
+    cache_ttl_seconds: int = Field(
+        300,
+        alias="CACHE_TTL_SECONDS",
+        description="Seconds a cached ServiceNow lookup stays valid",
+    )
+    tool_cache_ttl_seconds: int = Field(
+        30,
+        alias="TOOL_CACHE_TTL_SECONDS",
+        description="Seconds a memoised read-only tool result is reused (0 disables)",
+    )
     log_level: str = Field(
         "INFO",
         alias="LOG_LEVEL",
@@ -60,37 +94,50 @@ class AssetAgentConfig(BaseSettings):
     # Derived helpers
     # ------------------------------------------------------------------
 
-    @property
+    # Computed once per instance; treat the config as read-only once built.
+
+    @functools.cached_property
     def base_url(self) -> str:
         """Return the REST API base URL."""
         return self.servicenow_instance.rstrip("/") + "/api/now"
 
-    @property
+    @functools.cached_property
     def auth(self) -> tuple[str, str]:
         """Return (username, password) tuple for requests basic auth."""
         return (self.servicenow_username, self.servicenow_password)
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the config, dropping derived values so they follow *update*."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("base_url", None)
+        copied.__dict__.pop("auth", None)
+        return copied
+
 
 # Optional config reference used by tools when config is not injected.
 _override_config: AssetAgentConfig | None = None
 
+# The resolved singleton returned by get_config().
+_cfg: AssetAgentConfig | None = None
+
 
 def set_config(config: AssetAgentConfig) -> None:
     """Override the singleton config (useful for testing)."""
-    global _override_config
+    global _override_config, _cfg
     _override_config = config
+    _cfg = config
 
 
 def reset_config() -> None:
     """Clear the override and cached config."""
-    global _override_config
+    global _override_config, _cfg
     _override_config = None
-    get_config.cache_clear()
+    _cfg = None
 
 
-@functools.lru_cache(maxsize=1)
 def get_config() -> AssetAgentConfig:
     """Return the (cached) configuration singleton."""
-    if _override_config is not None:
-        return _override_config
-    return AssetAgentConfig()  # type: ignore[call-arg]
+    global _cfg
+    if _cfg is None:
+        _cfg = _override_config or AssetAgentConfig()  # type: ignore[call-arg]
+    return _cfg
@@ -40,7 +40,7 @@ class ServiceNowConnectionError(ServiceNowError):
 
 
 class ServiceNowAuthError(ServiceNowError):
-    """Authentication or authorisation failure (HTTP 401/403)."""
+    """Authentication failure (HTTP 401)."""
 
 
 class ServiceNowNotFoundError(ServiceNowError):
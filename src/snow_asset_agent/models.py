@@ -5,58 +5,100 @@ ServiceNow records can be represented without validation errors.
 Each model exposes a ``from_snow_record`` classmethod that accepts
 a raw ``dict`` from the ServiceNow REST API and returns a model
 instance.
+
+``from_snow_record`` builds instances with ``model_construct``, which
+skips pydantic validation: values are already coerced by the
+``_parse_*`` helpers and the REST API is trusted to return strings for
+the remaining fields.  Construct models directly (``Model(...)``) when
+validating untrusted input.
 """
 
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Any
+import functools
+from dataclasses import dataclass
+from datetime import date  # noqa: TC003 - pydantic resolves field annotations at runtime
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 from pydantic import BaseModel, Field
 
+from snow_asset_agent._parsing import (  # noqa: F401 - _ref re-exported for callers
+    _display,
+    _parse_date,
+    _parse_date_iso,
+    _parse_float,
+    _parse_int,
+    _ref,
+    _value,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
 # ---------------------------------------------------------------------------
-# Helpers
+# Base
 # ---------------------------------------------------------------------------
 
+# (model field, ServiceNow key, transform or None)
+FieldPlan = tuple[tuple[str, str, "Callable[[Any], Any] | None"], ...]
 
-def _parse_date(value: Any) -> date | None:
-    """Best-effort parse of a ServiceNow date string."""
-    if not value:
-        return None
-    if isinstance(value, date):
-        return value
-    try:
-        return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
-    except (ValueError, TypeError):
-        return None
 
+class SnowRecordModel(BaseModel):
+    """Base for models built from raw ServiceNow records.
 
-def _parse_float(value: Any) -> float | None:
-    """Best-effort parse of a numeric string from ServiceNow."""
-    if value is None or value == "":
-        return None
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
+    Subclasses declare ``_SNOW_FIELDS``, an extraction plan that the shared
+    :meth:`from_snow_record` walks once per record.
+    """
 
+    _SNOW_FIELDS: ClassVar[FieldPlan] = ()
 
-def _parse_int(value: Any) -> int | None:
-    """Best-effort parse of an integer string from ServiceNow."""
-    if value is None or value == "":
-        return None
-    try:
-        return int(float(value))
-    except (ValueError, TypeError):
-        return None
+    @classmethod
+    def snow_fields(cls) -> list[str]:
+        """Return the ServiceNow columns this model reads, for ``sysparm_fields``."""
+        return [src for _dest, src, _fn in cls._SNOW_FIELDS]
 
+    @classmethod
+    def from_snow_record(cls, record: dict[str, Any], **extra: Any) -> Self:
+        get = record.get
+        values = {dest: fn(get(src)) if fn else get(src) for dest, src, fn in cls._SNOW_FIELDS}
+        values.update(extra)
+        return cls.model_construct(**values)
 
-# ---------------------------------------------------------------------------
-# Base
-# ---------------------------------------------------------------------------
+    @classmethod
+    def from_snow_records(cls, records: Iterable[dict[str, Any]]) -> list[Self]:
+        """Bulk form of :meth:`from_snow_record` for large result pages.
+
+        The plan and constructor are bound once for the whole batch rather
+        than looked up again for every record.
+        """
+        plan = cls._SNOW_FIELDS
+        construct = cls.model_construct
+        return [
+            construct(**{dest: fn(rec.get(src)) if fn else rec.get(src) for dest, src, fn in plan})
+            for rec in records
+        ]
+
+    @classmethod
+    def dump_snow_records(cls, records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Shape raw records straight into ``model_dump(mode="json")`` dicts.
 
+        For tools that only re-emit records: no instances are built and
+        nothing is serialised afterwards, the plan renders dates as ISO
+        strings itself.  Only valid for models whose plan lists every field
+        in declaration order, which ``HardwareAsset`` and ``SoftwareLicense``
+        do.
+        """
+        plan = _json_plan(cls._SNOW_FIELDS)
+        return [{dest: fn(rec.get(src)) if fn else rec.get(src) for dest, src, fn in plan} for rec in records]
 
-class AssetBase(BaseModel):
+
+@functools.cache
+def _json_plan(plan: FieldPlan) -> FieldPlan:
+    """Return *plan* with date parsing swapped for its JSON-mode equivalent."""
+    return tuple((dest, src, _parse_date_iso if fn is _parse_date else fn) for dest, src, fn in plan)
+
+
+class AssetBase(SnowRecordModel):
     """Minimal fields shared by all asset types."""
 
     sys_id: str | None = None
@@ -73,31 +115,21 @@ class AssetBase(BaseModel):
     sys_created_on: str | None = None
     sys_updated_on: str | None = None
 
-    @classmethod
-    def from_snow_record(cls, record: dict[str, Any]) -> AssetBase:
-        return cls(
-            sys_id=record.get("sys_id"),
-            asset_tag=record.get("asset_tag"),
-            display_name=record.get("display_name"),
-            model=record.get("model", {}).get("display_value")
-            if isinstance(record.get("model"), dict)
-            else record.get("model"),
-            model_category=record.get("model_category", {}).get("display_value")
-            if isinstance(record.get("model_category"), dict)
-            else record.get("model_category"),
-            install_status=record.get("install_status"),
-            substatus=record.get("substatus"),
-            assigned_to=record.get("assigned_to", {}).get("display_value")
-            if isinstance(record.get("assigned_to"), dict)
-            else record.get("assigned_to"),
-            location=record.get("location", {}).get("display_value")
-            if isinstance(record.get("location"), dict)
-            else record.get("location"),
-            cost=_parse_float(record.get("cost")),
-            purchase_date=_parse_date(record.get("purchase_date")),
-            sys_created_on=record.get("sys_created_on"),
-            sys_updated_on=record.get("sys_updated_on"),
-        )
+    _SNOW_FIELDS: ClassVar[FieldPlan] = (
+        ("sys_id", "sys_id", None),
+        ("asset_tag", "asset_tag", None),
+        ("display_name", "display_name", None),
+        ("model", "model", _display),
+        ("model_category", "model_category", _display),
+        ("install_status", "install_status", None),
+        ("substatus", "substatus", None),
+        ("assigned_to", "assigned_to", _display),
+        ("location", "location", _display),
+        ("cost", "cost", _parse_float),
+        ("purchase_date", "purchase_date", _parse_date),
+        ("sys_created_on", "sys_created_on", None),
+        ("sys_updated_on", "sys_updated_on", None),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -105,7 +137,7 @@ class AssetBase(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class HardwareAsset(BaseModel):
+class HardwareAsset(SnowRecordModel):
     """Represents a record from the ``alm_hardware`` table."""
 
     sys_id: str | None = None
@@ -124,33 +156,23 @@ class HardwareAsset(BaseModel):
     ci: str | None = None
     sys_updated_on: str | None = None
 
-    @classmethod
-    def from_snow_record(cls, record: dict[str, Any]) -> HardwareAsset:
-        return cls(
-            sys_id=record.get("sys_id"),
-            asset_tag=record.get("asset_tag"),
-            display_name=record.get("display_name"),
-            model=record.get("model", {}).get("display_value")
-            if isinstance(record.get("model"), dict)
-            else record.get("model"),
-            model_category=record.get("model_category", {}).get("display_value")
-            if isinstance(record.get("model_category"), dict)
-            else record.get("model_category"),
-            serial_number=record.get("serial_number"),
-            assigned_to=record.get("assigned_to", {}).get("display_value")
-            if isinstance(record.get("assigned_to"), dict)
-            else record.get("assigned_to"),
-            location=record.get("location", {}).get("display_value")
-            if isinstance(record.get("location"), dict)
-            else record.get("location"),
-            install_status=record.get("install_status"),
-            substatus=record.get("substatus"),
-            cost=_parse_float(record.get("cost")),
-            purchase_date=_parse_date(record.get("purchase_date")),
-            warranty_expiration=_parse_date(record.get("warranty_expiration")),
-            ci=record.get("ci", {}).get("value") if isinstance(record.get("ci"), dict) else record.get("ci"),
-            sys_updated_on=record.get("sys_updated_on"),
-        )
+    _SNOW_FIELDS: ClassVar[FieldPlan] = (
+        ("sys_id", "sys_id", None),
+        ("asset_tag", "asset_tag", None),
+        ("display_name", "display_name", None),
+        ("model", "model", _display),
+        ("model_category", "model_category", _display),
+        ("serial_number", "serial_number", None),
+        ("assigned_to", "assigned_to", _display),
+        ("location", "location", _display),
+        ("install_status", "install_status", None),
+        ("substatus", "substatus", None),
+        ("cost", "cost", _parse_float),
+        ("purchase_date", "purchase_date", _parse_date),
+        ("warranty_expiration", "warranty_expiration", _parse_date),
+        ("ci", "ci", _value),
+        ("sys_updated_on", "sys_updated_on", None),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -158,7 +180,7 @@ class HardwareAsset(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class SoftwareLicense(BaseModel):
+class SoftwareLicense(SnowRecordModel):
     """Represents a record from the ``alm_license`` table."""
 
     sys_id: str | None = None
@@ -174,26 +196,20 @@ class SoftwareLicense(BaseModel):
     end_date: date | None = None
     sys_updated_on: str | None = None
 
-    @classmethod
-    def from_snow_record(cls, record: dict[str, Any]) -> SoftwareLicense:
-        return cls(
-            sys_id=record.get("sys_id"),
-            asset_tag=record.get("asset_tag"),
-            display_name=record.get("display_name"),
-            product=record.get("software_model", {}).get("display_value")
-            if isinstance(record.get("software_model"), dict)
-            else record.get("software_model"),
-            vendor=record.get("vendor", {}).get("display_value")
-            if isinstance(record.get("vendor"), dict)
-            else record.get("vendor"),
-            license_key=record.get("license_key"),
-            rights=_parse_int(record.get("rights")),
-            allocated=_parse_int(record.get("allocated")),
-            cost=_parse_float(record.get("cost")),
-            start_date=_parse_date(record.get("start_date")),
-            end_date=_parse_date(record.get("end_date")),
-            sys_updated_on=record.get("sys_updated_on"),
-        )
+    _SNOW_FIELDS: ClassVar[FieldPlan] = (
+        ("sys_id", "sys_id", None),
+        ("asset_tag", "asset_tag", None),
+        ("display_name", "display_name", None),
+        ("product", "software_model", _display),
+        ("vendor", "vendor", _display),
+        ("license_key", "license_key", None),
+        ("rights", "rights", _parse_int),
+        ("allocated", "allocated", _parse_int),
+        ("cost", "cost", _parse_float),
+        ("start_date", "start_date", _parse_date),
+        ("end_date", "end_date", _parse_date),
+        ("sys_updated_on", "sys_updated_on", None),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -201,7 +217,7 @@ class SoftwareLicense(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class AssetContract(BaseModel):
+class AssetContract(SnowRecordModel):
     """Represents a record from the ``ast_contract`` table."""
 
     sys_id: str | None = None
@@ -215,22 +231,63 @@ class AssetContract(BaseModel):
     state: str | None = None
     sys_updated_on: str | None = None
 
+    _SNOW_FIELDS: ClassVar[FieldPlan] = (
+        ("sys_id", "sys_id", None),
+        ("contract_number", "number", None),
+        ("short_description", "short_description", None),
+        ("vendor", "vendor", _display),
+        ("starts", "starts", _parse_date),
+        ("ends", "ends", _parse_date),
+        ("cost", "cost", _parse_float),
+        ("payment_amount", "payment_amount", _parse_float),
+        ("state", "state", None),
+        ("sys_updated_on", "sys_updated_on", None),
+    )
+
+
+@dataclass(slots=True)
+class _AssetContractRow:
+    """Slotted, unvalidated mirror of :class:`AssetContract` for read-only scans.
+
+    Building and dumping a pydantic model per row dominates the contract
+    tools on large limits; this row type takes the same extraction plan
+    but skips the per-instance ``__dict__`` and the serializer.  Field
+    order matches ``AssetContract._SNOW_FIELDS`` so rows are built
+    positionally.
+    """
+
+    sys_id: str | None = None
+    contract_number: str | None = None
+    short_description: str | None = None
+    vendor: str | None = None
+    starts: date | None = None
+    ends: date | None = None
+    cost: float | None = None
+    payment_amount: float | None = None
+    state: str | None = None
+    sys_updated_on: str | None = None
+
     @classmethod
-    def from_snow_record(cls, record: dict[str, Any]) -> AssetContract:
-        return cls(
-            sys_id=record.get("sys_id"),
-            contract_number=record.get("number"),
-            short_description=record.get("short_description"),
-            vendor=record.get("vendor", {}).get("display_value")
-            if isinstance(record.get("vendor"), dict)
-            else record.get("vendor"),
-            starts=_parse_date(record.get("starts")),
-            ends=_parse_date(record.get("ends")),
-            cost=_parse_float(record.get("cost")),
-            payment_amount=_parse_float(record.get("payment_amount")),
-            state=record.get("state"),
-            sys_updated_on=record.get("sys_updated_on"),
-        )
+    def from_snow_records(cls, records: Iterable[dict[str, Any]]) -> list[_AssetContractRow]:
+        plan = AssetContract._SNOW_FIELDS
+        return [cls(*[fn(rec.get(src)) if fn else rec.get(src) for _dest, src, fn in plan]) for rec in records]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the same dict as ``AssetContract.model_dump(mode="json")``."""
+        starts = self.starts
+        ends = self.ends
+        return {
+            "sys_id": self.sys_id,
+            "contract_number": self.contract_number,
+            "short_description": self.short_description,
+            "vendor": self.vendor,
+            "starts": starts.isoformat() if starts else None,
+            "ends": ends.isoformat() if ends else None,
+            "cost": self.cost,
+            "payment_amount": self.payment_amount,
+            "state": self.state,
+            "sys_updated_on": self.sys_updated_on,
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -238,8 +295,12 @@ class AssetContract(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class AssetLifecycle(BaseModel):
-    """Lifecycle stage information for an asset."""
+class AssetLifecycle(SnowRecordModel):
+    """Lifecycle stage information for an asset.
+
+    ``stage`` and ``days_in_stage`` are derived by the caller and passed to
+    :meth:`from_snow_record` as keyword arguments.
+    """
 
     sys_id: str | None = None
     asset_tag: str | None = None
@@ -253,23 +314,17 @@ class AssetLifecycle(BaseModel):
     sys_updated_on: str | None = None
     days_in_stage: int | None = None
 
-    @classmethod
-    def from_snow_record(
-        cls, record: dict[str, Any], *, stage: str | None = None, days_in_stage: int | None = None
-    ) -> AssetLifecycle:
-        return cls(
-            sys_id=record.get("sys_id"),
-            asset_tag=record.get("asset_tag"),
-            display_name=record.get("display_name"),
-            stage=stage,
-            install_status=record.get("install_status"),
-            substatus=record.get("substatus"),
-            install_date=_parse_date(record.get("install_date")),
-            retired_date=_parse_date(record.get("retired_date")),
-            disposal_date=_parse_date(record.get("disposal_date")),
-            sys_updated_on=record.get("sys_updated_on"),
-            days_in_stage=days_in_stage,
-        )
+    _SNOW_FIELDS: ClassVar[FieldPlan] = (
+        ("sys_id", "sys_id", None),
+        ("asset_tag", "asset_tag", None),
+        ("display_name", "display_name", None),
+        ("install_status", "install_status", None),
+        ("substatus", "substatus", None),
+        ("install_date", "install_date", _parse_date),
+        ("retired_date", "retired_date", _parse_date),
+        ("disposal_date", "disposal_date", _parse_date),
+        ("sys_updated_on", "sys_updated_on", None),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 """FastMCP server entry point for snow-asset-agent.
 
-Registers all 13 asset-management tools plus a health-check endpoint.
+Registers all 13 asset-management tools plus health-check and
+cache-clear endpoints.
 Start with: ``python -m snow_asset_agent``
 """
 
@@ -11,8 +12,9 @@ from typing import Any
 
 from fastmcp import FastMCP
 
-from snow_asset_agent.client import ServiceNowClient
+from snow_asset_agent.cache import clear_tool_cache
 from snow_asset_agent.config import get_config
+from snow_asset_agent.tools._client import _clear_default_client_cache, _default_client
 from snow_asset_agent.tools.compliance import check_license_compliance
 from snow_asset_agent.tools.contracts import get_asset_contracts
 from snow_asset_agent.tools.costs import calculate_asset_costs
@@ -47,8 +49,7 @@ def health_check() -> dict[str, Any]:
     from snow_asset_agent import __version__
 
     cfg = get_config()
-    client = ServiceNowClient(cfg)
-    ping = client.ping()
+    ping = _default_client().ping()
     return {
         "server": "snow-asset-agent",
         "version": __version__,
@@ -57,6 +58,12 @@ def health_check() -> dict[str, Any]:
     }
 
 
+@mcp.tool()
+def clear_cache() -> dict[str, Any]:
+    """Discard memoised tool results and cached records so the next calls query ServiceNow afresh."""
+    return {"cleared": clear_tool_cache() + _clear_default_client_cache()}
+
+
 # ------------------------------------------------------------------
 # Hardware / Software queries
 # ------------------------------------------------------------------
@@ -163,12 +170,21 @@ def tool_check_license_compliance(
     product: str | None = None,
     vendor: str | None = None,
     limit: int = 100,
+    detail: bool = True,
+    include_unknown: bool = False,
 ) -> dict[str, Any]:
-    """Check software licence compliance (installed vs licensed)."""
+    """Check software licence compliance (installed vs licensed).
+
+    Set ``detail`` to false for summary counts only, aggregated server-side
+    over every matching licence.  Licences with no entitlements are skipped
+    unless ``include_unknown`` is true.
+    """
     return check_license_compliance(
         product=product,
         vendor=vendor,
         limit=limit,
+        detail=detail,
+        include_unknown=include_unknown,
     )
 
 
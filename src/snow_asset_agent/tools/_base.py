@@ -0,0 +1,48 @@
+"""Shared error handling for the MCP tool functions.
+
+Tools raise ServiceNow exceptions freely; :func:`_sn_tool` converts them
+into the ``{"error": ..., "error_code": ...}`` envelope every tool
+returns, and logs them against the tool's own module logger.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from snow_asset_agent.exceptions import (
+    ServiceNowAuthError,
+    ServiceNowError,
+    ServiceNowRateLimitError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+F = TypeVar("F", bound="Callable[..., dict[str, Any]]")
+
+
+def _sn_tool(fn: F) -> F:
+    """Wrap a tool so ServiceNow failures come back as an error envelope."""
+    name = fn.__name__
+    logger = logging.getLogger(fn.__module__)
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        try:
+            return fn(*args, **kwargs)
+        except ServiceNowAuthError as exc:
+            logger.exception("%s failed: auth error", name)
+            return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
+        except ServiceNowRateLimitError as exc:
+            logger.exception("%s failed: rate limited", name)
+            return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
+        except ServiceNowError as exc:
+            logger.exception("%s failed", name)
+            return {"error": str(exc), "error_code": getattr(exc, "error_code", None) or "SN_QUERY_ERROR"}
+        except Exception as exc:
+            logger.exception("%s failed", name)
+            return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+
+    return wrapper  # type: ignore[return-value]
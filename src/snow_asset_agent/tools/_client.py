@@ -0,0 +1,45 @@
+"""Shared ServiceNowClient for tools called without an injected client.
+
+Building a client per tool call re-creates the HTTP session, so every
+call paid a fresh TCP/TLS handshake.  Tools instead share one client per
+configuration, keeping pooled connections alive between MCP calls.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from snow_asset_agent.client import ServiceNowClient
+from snow_asset_agent.config import AssetAgentConfig, get_config
+
+_lock = threading.Lock()
+_default: tuple[AssetAgentConfig, ServiceNowClient] | None = None
+
+
+def _default_client() -> ServiceNowClient:
+    """Return the shared client, rebuilding it when the config singleton changes.
+
+    A replaced client is closed so its worker threads do not outlive it.
+    """
+    global _default
+    config = get_config()
+    current = _default
+    if current is None or current[0] is not config:
+        stale = None
+        with _lock:
+            current = _default
+            if current is None or current[0] is not config:
+                stale = current
+                current = _default = (config, ServiceNowClient(config))
+        if stale is not None:
+            stale[1].close()
+    return current[1]
+
+
+def _clear_default_client_cache() -> int:
+    """Empty the shared client's record cache, if a client has been built.
+
+    Returns the number of cached records dropped.
+    """
+    current = _default
+    return current[1].clear_record_cache() if current is not None else 0
@@ -6,27 +6,42 @@ to identify over-allocated or under-utilised licences.
 
 from __future__ import annotations
 
-import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
+from snow_asset_agent._parsing import _ref, _safe_int
+from snow_asset_agent.cache import ttl_cached
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 LICENSE_TABLE = "alm_license"
 
+# Columns read from each licence row.
+LICENSE_FIELDS = ["sys_id", "software_model", "rights", "allocated"]
 
+
+def _classify(rights: int, allocated: int) -> str:
+    """Return the compliance status for a licence's rights vs. allocations."""
+    if rights == 0:
+        return "unknown"
+    if allocated > rights:
+        return "over-allocated"
+    if allocated < rights * 0.5:
+        return "under-utilised"
+    return "compliant"
+
+
+@_sn_tool
+@ttl_cached()
 def check_license_compliance(
     *,
     product: str | None = None,
     vendor: str | None = None,
     limit: int = 100,
+    detail: bool = True,
+    include_unknown: bool = False,
     client: ServiceNowClient | None = None,
 ) -> dict[str, Any]:
     """Check software licence compliance.
@@ -34,84 +49,87 @@ def check_license_compliance(
     Compares ``rights`` (entitlements) against ``allocated`` for each
     licence record and categorises as compliant, over-allocated, or
     under-utilised.
+
+    With ``detail=False`` only the summary counts are returned.  They are
+    computed from one Aggregate API call grouped by ``rights`` and
+    ``allocated``, cover every matching licence (``limit`` does not
+    apply) and no licence rows are transferred.
+
+    Licences without entitlements (status ``unknown``) are filtered out
+    server-side with ``rights>0`` unless *include_unknown* is True.
     """
     if limit < 1:
         return {"error": "limit must be >= 1", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
-
-        parts: list[str] = []
-        if product:
-            parts.append(f"software_modelLIKE{product}")
-        if vendor:
-            parts.append(f"vendorLIKE{vendor}")
-        query = "^".join(parts)
-
-        records = _client.get_records(LICENSE_TABLE, query=query, limit=limit)
-
-        results: list[dict[str, Any]] = []
-        compliant = 0
-        non_compliant = 0
-        under_utilised = 0
-
-        for rec in records:
-            rights = _safe_int(rec.get("rights"))
-            allocated = _safe_int(rec.get("allocated"))
-
-            if rights == 0:
-                status = "unknown"
-            elif allocated > rights:
-                status = "over-allocated"
-                non_compliant += 1
-            elif allocated < rights * 0.5:
-                status = "under-utilised"
-                under_utilised += 1
-                compliant += 1
-            else:
-                status = "compliant"
-                compliant += 1
-
-            gap = allocated - rights
-
-            results.append(
-                {
-                    "sys_id": rec.get("sys_id"),
-                    "product": rec.get("software_model")
-                    if isinstance(rec.get("software_model"), str)
-                    else (rec.get("software_model", {}) or {}).get("display_value"),
-                    "rights": rights,
-                    "allocated": allocated,
-                    "gap": gap,
-                    "status": status,
-                }
-            )
-
-        return {
-            "compliance_results": results,
-            "count": len(results),
-            "compliant": compliant,
-            "non_compliant": non_compliant,
-            "under_utilised": under_utilised,
-        }
-    except ServiceNowAuthError as exc:
-        logger.exception("check_license_compliance failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("check_license_compliance failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("check_license_compliance failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("check_license_compliance failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
-
-
-def _safe_int(val: Any) -> int:
-    if val is None or val == "":
-        return 0
-    try:
-        return int(float(val))
-    except (ValueError, TypeError):
-        return 0
+    _client = client or _default_client()
+
+    query = "^".join(
+        filter(
+            None,
+            (
+                product and f"software_modelLIKE{product}",
+                vendor and f"vendorLIKE{vendor}",
+                None if include_unknown else "rights>0",
+            ),
+        )
+    )
+
+    if not detail:
+        return _summarise(_client, query)
+
+    results: list[dict[str, Any]] = []
+    compliant = 0
+    non_compliant = 0
+    under_utilised = 0
+
+    for rec in _client.iter_records_paged(LICENSE_TABLE, query=query, fields=LICENSE_FIELDS, limit=limit):
+        rights = _safe_int(rec.get("rights"))
+        allocated = _safe_int(rec.get("allocated"))
+
+        status = _classify(rights, allocated)
+        if status == "over-allocated":
+            non_compliant += 1
+        elif status == "under-utilised":
+            under_utilised += 1
+            compliant += 1
+        elif status == "compliant":
+            compliant += 1
+
+        gap = allocated - rights
+
+        results.append(
+            {
+                "sys_id": rec.get("sys_id"),
+                "product": _ref(rec, "software_model"),
+                "rights": rights,
+                "allocated": allocated,
+                "gap": gap,
+                "status": status,
+            }
+        )
+
+    return {
+        "compliance_results": results,
+        "count": len(results),
+        "compliant": compliant,
+        "non_compliant": non_compliant,
+        "under_utilised": under_utilised,
+    }
+
+
+def _summarise(client: ServiceNowClient, query: str) -> dict[str, Any]:
+    """Compute the compliance counts from (rights, allocated) groups."""
+    groups = client.get_stats(LICENSE_TABLE, query=query, group_by=["rights", "allocated"])
+    by_status: dict[str, int] = {}
+    total = 0
+    for g in groups:
+        status = _classify(_safe_int(g["group"].get("rights")), _safe_int(g["group"].get("allocated")))
+        by_status[status] = by_status.get(status, 0) + g["count"]
+        total += g["count"]
+    return {
+        "compliance_results": [],
+        "count": total,
+        "compliant": by_status.get("compliant", 0) + by_status.get("under-utilised", 0),
+        "non_compliant": by_status.get("over-allocated", 0),
+        "under_utilised": by_status.get("under-utilised", 0),
+    }
@@ -5,19 +5,14 @@ Retrieves contracts linked to an asset from the ``ast_contract`` table.
 
 from __future__ import annotations
 
-import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
-from snow_asset_agent.models import AssetContract
+from snow_asset_agent.models import AssetContract, _AssetContractRow
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 TABLE = "ast_contract"
 
@@ -28,16 +23,19 @@ def _build_query(
     vendor: str | None = None,
     state: str | None = None,
 ) -> str:
-    parts: list[str] = []
-    if asset_sys_id:
-        parts.append(f"asset={asset_sys_id}")
-    if vendor:
-        parts.append(f"vendorLIKE{vendor}")
-    if state:
-        parts.append(f"state={state}")
-    return "^".join(parts)
-
-
+    return "^".join(
+        filter(
+            None,
+            (
+                asset_sys_id and f"asset={asset_sys_id}",
+                vendor and f"vendorLIKE{vendor}",
+                state and f"state={state}",
+            ),
+        )
+    )
+
+
+@_sn_tool
 def get_asset_contracts(
     *,
     asset_sys_id: str | None = None,
@@ -50,21 +48,8 @@ def get_asset_contracts(
     if limit < 1:
         return {"error": "limit must be >= 1", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
-        query = _build_query(asset_sys_id=asset_sys_id, vendor=vendor, state=state)
-        records = _client.get_records(TABLE, query=query, limit=limit)
-        contracts = [AssetContract.from_snow_record(r).model_dump(mode="json") for r in records]
-        return {"contracts": contracts, "count": len(contracts)}
-    except ServiceNowAuthError as exc:
-        logger.exception("get_asset_contracts failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("get_asset_contracts failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("get_asset_contracts failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("get_asset_contracts failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+    _client = client or _default_client()
+    query = _build_query(asset_sys_id=asset_sys_id, vendor=vendor, state=state)
+    records = _client.get_records(TABLE, query=query, fields=AssetContract.snow_fields(), limit=limit)
+    contracts = [row.to_dict() for row in _AssetContractRow.from_snow_records(records)]
+    return {"contracts": contracts, "count": len(contracts)}
@@ -6,22 +6,23 @@ purchase date and category-specific useful-life defaults.
 
 from __future__ import annotations
 
-import logging
 from datetime import date
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
+from snow_asset_agent._parsing import _parse_date, _ref, _safe_float
+from snow_asset_agent.cache import ttl_cached
+from snow_asset_agent.tools import _depr_kernel
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 TABLE = "alm_hardware"
 
+# Columns read from each asset row.
+FIELDS = ["sys_id", "asset_tag", "cost", "purchase_date", "model_category"]
+
 # Default useful-life (years) by model category.
 DEFAULT_USEFUL_LIFE: dict[str, int] = {
     "Computer": 3,
@@ -31,24 +32,8 @@ DEFAULT_USEFUL_LIFE: dict[str, int] = {
 FALLBACK_USEFUL_LIFE = 4
 
 
-def _safe_float(val: Any) -> float:
-    if val is None or val == "":
-        return 0.0
-    try:
-        return float(val)
-    except (ValueError, TypeError):
-        return 0.0
-
-
-def _parse_date(val: Any) -> date | None:
-    if not val:
-        return None
-    try:
-        return date.fromisoformat(str(val)[:10])
-    except (ValueError, TypeError):
-        return None
-
-
+@_sn_tool
+@ttl_cached()
 def track_asset_depreciation(
     *,
     model_category: str | None = None,
@@ -63,63 +48,61 @@ def track_asset_depreciation(
     if limit < 1:
         return {"error": "limit must be >= 1", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
-
-        query = f"model_category={model_category}" if model_category else ""
-        records = _client.get_records(TABLE, query=query, limit=limit)
-
-        today = date.today()
-        items: list[dict[str, Any]] = []
-        total_depreciation = 0.0
-
-        for rec in records:
-            cost = _safe_float(rec.get("cost"))
-            purchase_date = _parse_date(rec.get("purchase_date"))
-
-            if purchase_date is None or cost <= 0:
-                continue
-
-            cat = rec.get("model_category", "")
-            if isinstance(cat, dict):
-                cat = cat.get("display_value", "")
-            life = useful_life_years or DEFAULT_USEFUL_LIFE.get(cat, FALLBACK_USEFUL_LIFE)
-            years_owned = (today - purchase_date).days / 365.25
-            annual_dep = cost / life
-            accumulated = min(cost, annual_dep * years_owned)
-            current_value = max(0.0, cost - accumulated)
-            remaining_life = max(0.0, life - years_owned)
-
-            total_depreciation += accumulated
-            items.append(
-                {
-                    "sys_id": rec.get("sys_id"),
-                    "asset_tag": rec.get("asset_tag"),
-                    "cost": round(cost, 2),
-                    "purchase_date": purchase_date.isoformat(),
-                    "useful_life_years": life,
-                    "years_owned": round(years_owned, 2),
-                    "annual_depreciation": round(annual_dep, 2),
-                    "accumulated_depreciation": round(accumulated, 2),
-                    "current_value": round(current_value, 2),
-                    "remaining_useful_life_years": round(remaining_life, 2),
-                }
-            )
-
-        return {
-            "assets": items,
-            "count": len(items),
-            "total_accumulated_depreciation": round(total_depreciation, 2),
+    _client = client or _default_client()
+
+    # Rows without a purchase date or cost cannot be depreciated; filter
+    # them server-side so they are never transferred.
+    query = "purchase_dateISNOTEMPTY^cost>0"
+    if model_category:
+        query = f"model_category={model_category}^{query}"
+    records = _client.get_records(TABLE, query=query, fields=FIELDS, limit=limit)
+
+    # Gather the valid rows into columns, then run the fused kernel over
+    # them rather than interleaving parsing and arithmetic per row.
+    # Dates are parsed in one pass up front through the shared memoised
+    # parser: scans repeat the same purchase dates, and its fast path
+    # avoids raising on every malformed value.
+    parsed = [_parse_date(rec.get("purchase_date")) for rec in records]
+
+    rows: list[dict[str, Any]] = []
+    costs: list[float] = []
+    purchases: list[date] = []
+    lives: list[int] = []
+    for rec, purchase_date in zip(records, parsed, strict=True):
+        if purchase_date is None:
+            continue
+        cost = _safe_float(rec.get("cost"))
+        if cost <= 0:
+            continue
+        cat = _ref(rec, "model_category") or ""
+        rows.append(rec)
+        costs.append(cost)
+        purchases.append(purchase_date)
+        lives.append(useful_life_years or DEFAULT_USEFUL_LIFE.get(cat, FALLBACK_USEFUL_LIFE))
+
+    years_owned, annual_dep, accumulated, current_value, remaining_life = _depr_kernel.compute(
+        costs, [p.toordinal() for p in purchases], lives, date.today().toordinal()
+    )
+    total_depreciation = sum(accumulated)
+
+    items = [
+        {
+            "sys_id": rec.get("sys_id"),
+            "asset_tag": rec.get("asset_tag"),
+            "cost": costs[i],
+            "purchase_date": purchases[i].isoformat(),
+            "useful_life_years": lives[i],
+            "years_owned": round(years_owned[i], 2),
+            "annual_depreciation": round(annual_dep[i], 2),
+            "accumulated_depreciation": round(accumulated[i], 2),
+            "current_value": round(current_value[i], 2),
+            "remaining_useful_life_years": round(remaining_life[i], 2),
         }
-    except ServiceNowAuthError as exc:
-        logger.exception("track_asset_depreciation failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("track_asset_depreciation failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("track_asset_depreciation failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("track_asset_depreciation failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+        for i, rec in enumerate(rows)
+    ]
+
+    return {
+        "assets": items,
+        "count": len(items),
+        "total_accumulated_depreciation": round(total_depreciation, 2),
+    }
@@ -5,23 +5,19 @@ Retrieves full details for a single asset by ``sys_id`` or ``asset_tag``.
 
 from __future__ import annotations
 
-import logging
-from typing import Any
-
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
+from typing import TYPE_CHECKING, Any
+
 from snow_asset_agent.models import AssetBase
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 TABLE = "alm_asset"
 
 
+@_sn_tool
 def get_asset_details(
     *,
     sys_id: str | None = None,
@@ -35,28 +31,15 @@ def get_asset_details(
     if not sys_id and not asset_tag:
         return {"error": "Provide either sys_id or asset_tag", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
-
-        if sys_id:
-            record = _client.get_record(TABLE, sys_id)
-        else:
-            records = _client.get_records(TABLE, query=f"asset_tag={asset_tag}", limit=1)
-            if not records:
-                return {"error": f"Asset not found: asset_tag={asset_tag}", "error_code": "SN_NOT_FOUND"}
-            record = records[0]
-
-        asset = AssetBase.from_snow_record(record).model_dump(mode="json")
-        return {"asset": asset}
-    except ServiceNowAuthError as exc:
-        logger.exception("get_asset_details failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("get_asset_details failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("get_asset_details failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("get_asset_details failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+    _client = client or _default_client()
+
+    if sys_id:
+        record = _client.get_record(TABLE, sys_id, fields=AssetBase.snow_fields())
+    else:
+        records = _client.get_records(TABLE, query=f"asset_tag={asset_tag}", fields=AssetBase.snow_fields(), limit=1)
+        if not records:
+            return {"error": f"Asset not found: asset_tag={asset_tag}", "error_code": "SN_NOT_FOUND"}
+        record = records[0]
+
+    asset = AssetBase.from_snow_record(record).model_dump(mode="json")
+    return {"asset": asset}
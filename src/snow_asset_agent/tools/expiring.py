@@ -6,36 +6,33 @@ categorised by urgency level.
 
 from __future__ import annotations
 
-import logging
+from bisect import bisect_right
 from datetime import date, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
-from snow_asset_agent.models import AssetContract
+from snow_asset_agent.cache import ttl_cached
+from snow_asset_agent.models import AssetContract, _AssetContractRow
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 TABLE = "ast_contract"
 
 
+# Lower bound (inclusive) of each urgency band after "expired":
+# <0 expired, 0-30 critical, 31-60 warning, 61-90 notice, >90 info.
+_URGENCY_BOUNDS = (0, 31, 61, 91)
+_URGENCY_LABELS = ("expired", "critical", "warning", "notice", "info")
+
+
 def _urgency(days_remaining: int) -> str:
-    if days_remaining < 0:
-        return "expired"
-    if days_remaining <= 30:
-        return "critical"
-    if days_remaining <= 60:
-        return "warning"
-    if days_remaining <= 90:
-        return "notice"
-    return "info"
+    return _URGENCY_LABELS[bisect_right(_URGENCY_BOUNDS, days_remaining)]
 
 
+@_sn_tool
+@ttl_cached()
 def find_expiring_contracts(
     *,
     days_ahead: int = 90,
@@ -54,58 +51,39 @@ def find_expiring_contracts(
     if days_ahead < 1:
         return {"error": "days_ahead must be >= 1", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
-
-        today = date.today()
-        future = today + timedelta(days=days_ahead)
-        parts: list[str] = []
-
-        if include_expired:
-            past = today - timedelta(days=30)
-            parts.append(f"ends>={past.isoformat()}")
-        else:
-            parts.append(f"ends>={today.isoformat()}")
-        parts.append(f"ends<={future.isoformat()}")
-
-        if vendor:
-            parts.append(f"vendorLIKE{vendor}")
-
-        query = "^".join(parts)
-        records = _client.get_records(TABLE, query=query, limit=limit)
-
-        items: list[dict[str, Any]] = []
-        total_value = 0.0
-
-        for rec in records:
-            contract = AssetContract.from_snow_record(rec)
-            days_remaining = (contract.ends - today).days if contract.ends else None
-            urgency = _urgency(days_remaining) if days_remaining is not None else "unknown"
-            cost = contract.cost or 0.0
-            total_value += cost
-
-            entry = contract.model_dump(mode="json")
-            entry["days_remaining"] = days_remaining
-            entry["urgency"] = urgency
-            items.append(entry)
-
-        # Sort by days remaining ascending (soonest first)
-        items.sort(key=lambda x: x.get("days_remaining") if x.get("days_remaining") is not None else 9999)
-
-        return {
-            "contracts": items,
-            "count": len(items),
-            "total_value_at_risk": round(total_value, 2),
-        }
-    except ServiceNowAuthError as exc:
-        logger.exception("find_expiring_contracts failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("find_expiring_contracts failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("find_expiring_contracts failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("find_expiring_contracts failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+    _client = client or _default_client()
+
+    today = date.today()
+    future = today + timedelta(days=days_ahead)
+    start = today - timedelta(days=30) if include_expired else today
+    query = f"ends>={start.isoformat()}^ends<={future.isoformat()}"
+    if vendor:
+        query += f"^vendorLIKE{vendor}"
+    # Let ServiceNow order by end date so *limit* keeps the soonest
+    # expiries rather than an arbitrary subset.
+    query += "^ORDERBYends"
+    records = _client.get_records_paged(TABLE, query=query, fields=AssetContract.snow_fields(), limit=limit)
+
+    contracts = _AssetContractRow.from_snow_records(records)
+    remaining = [(c.ends - today).days if c.ends else None for c in contracts]
+    total_value = sum(c.cost or 0.0 for c in contracts)
+
+    # Sort by days remaining ascending (soonest first).  Rows already arrive
+    # in end-date order, so this is a linear pass that only moves undated
+    # contracts to the end; keys are plain ints.
+    sort_keys = [d if d is not None else 9999 for d in remaining]
+    order = sorted(range(len(contracts)), key=sort_keys.__getitem__)
+
+    items: list[dict[str, Any]] = []
+    for i in order:
+        days_remaining = remaining[i]
+        entry = contracts[i].to_dict()
+        entry["days_remaining"] = days_remaining
+        entry["urgency"] = _urgency(days_remaining) if days_remaining is not None else "unknown"
+        items.append(entry)
+
+    return {
+        "contracts": items,
+        "count": len(items),
+        "total_value_at_risk": round(total_value, 2),
+    }
@@ -5,22 +5,22 @@ Searches and filters hardware assets from the ``alm_hardware`` table.
 
 from __future__ import annotations
 
-import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
+from snow_asset_agent.cache import ttl_cached
 from snow_asset_agent.models import HardwareAsset
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 TABLE = "alm_hardware"
 
+# ``^`` separates encoded-query clauses; one inside a filter value would
+# split it into extra (possibly unindexed) conditions, so it is dropped.
+_ESC = str.maketrans({"^": None})
+
 
 def _build_query(
     *,
@@ -32,22 +32,23 @@ def _build_query(
     location: str | None = None,
 ) -> str:
     """Build an encoded ServiceNow query string from filter parameters."""
-    parts: list[str] = []
-    if status:
-        parts.append(f"install_status={status}")
-    if department:
-        parts.append(f"department={department}")
-    if model:
-        parts.append(f"modelLIKE{model}")
-    if model_category:
-        parts.append(f"model_category={model_category}")
-    if assigned_to:
-        parts.append(f"assigned_toLIKE{assigned_to}")
-    if location:
-        parts.append(f"locationLIKE{location}")
-    return "^".join(parts)
+    return "^".join(
+        filter(
+            None,
+            (
+                status and f"install_status={status.translate(_ESC)}",
+                department and f"department={department.translate(_ESC)}",
+                model and f"modelLIKE{model.translate(_ESC)}",
+                model_category and f"model_category={model_category.translate(_ESC)}",
+                assigned_to and f"assigned_toLIKE{assigned_to.translate(_ESC)}",
+                location and f"locationLIKE{location.translate(_ESC)}",
+            ),
+        )
+    )
 
 
+@_sn_tool
+@ttl_cached()
 def query_hardware_assets(
     *,
     status: str | None = None,
@@ -67,28 +68,15 @@ def query_hardware_assets(
     if limit < 1:
         return {"error": "limit must be >= 1", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
-        query = _build_query(
-            status=status,
-            department=department,
-            model=model,
-            model_category=model_category,
-            assigned_to=assigned_to,
-            location=location,
-        )
-        records = _client.get_records(TABLE, query=query, limit=limit)
-        assets = [HardwareAsset.from_snow_record(r).model_dump(mode="json") for r in records]
-        return {"assets": assets, "count": len(assets)}
-    except ServiceNowAuthError as exc:
-        logger.exception("query_hardware_assets failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("query_hardware_assets failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("query_hardware_assets failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("query_hardware_assets failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+    _client = client or _default_client()
+    query = _build_query(
+        status=status,
+        department=department,
+        model=model,
+        model_category=model_category,
+        assigned_to=assigned_to,
+        location=location,
+    )
+    records = _client.iter_records_paged(TABLE, query=query, fields=HardwareAsset.snow_fields(), limit=limit)
+    assets = HardwareAsset.dump_snow_records(records)
+    return {"assets": assets, "count": len(assets)}
@@ -6,34 +6,35 @@ overdue items, and expiring contracts.
 
 from __future__ import annotations
 
-import logging
+import functools
+import math
+from collections import Counter
 from datetime import date, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
+from snow_asset_agent.cache import ttl_cached
 from snow_asset_agent.models import AssetHealthMetric
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 ASSET_TABLE = "alm_asset"
 CONTRACT_TABLE = "ast_contract"
 
-
-def _safe_float(val: Any) -> float:
-    if val is None or val == "":
-        return 0.0
-    try:
-        return float(val)
-    except (ValueError, TypeError):
-        return 0.0
+# Dashboard bucket for each (lower-cased) install_status label.
+STATUS_BUCKETS: dict[str, str] = {
+    "in use": "active",
+    "installed": "active",
+    "retired": "retired",
+    "missing": "missing",
+    "in stock": "in_stock",
+}
 
 
+@_sn_tool
+@ttl_cached()
 def get_asset_health_metrics(
     *,
     location: str | None = None,
@@ -41,63 +42,40 @@ def get_asset_health_metrics(
     client: ServiceNowClient | None = None,
 ) -> dict[str, Any]:
     """Return aggregate asset health metrics."""
-    try:
-        _client = client or ServiceNowClient(get_config())
-
-        # Build base query for scoping
-        parts: list[str] = []
-        if location:
-            parts.append(f"locationLIKE{location}")
-        if model_category:
-            parts.append(f"model_category={model_category}")
-        base_q = "^".join(parts)
-
-        all_assets = _client.get_records(ASSET_TABLE, query=base_q, limit=500)
-
-        total = len(all_assets)
-        active = 0
-        retired = 0
-        missing = 0
-        in_stock = 0
-        total_value = 0.0
-
-        for a in all_assets:
-            status = (a.get("install_status") or "").lower()
-            if status in ("in use", "installed"):
-                active += 1
-            elif status == "retired":
-                retired += 1
-            elif status == "missing":
-                missing += 1
-            elif status == "in stock":
-                in_stock += 1
-            total_value += _safe_float(a.get("cost"))
-
-        # Expiring contracts within 30 days
-        today = date.today().isoformat()
-        future30 = (date.today() + timedelta(days=30)).isoformat()
-        contract_q = f"ends>={today}^ends<={future30}"
-        expiring = _client.get_records(CONTRACT_TABLE, query=contract_q, limit=500)
-
-        metrics = AssetHealthMetric(
-            total_assets=total,
-            active_assets=active,
-            retired_assets=retired,
-            missing_assets=missing,
-            in_stock_assets=in_stock,
-            expiring_contracts_30d=len(expiring),
-            total_asset_value=round(total_value, 2),
-        )
-        return {"metrics": metrics.model_dump(mode="json")}
-    except ServiceNowAuthError as exc:
-        logger.exception("get_asset_health_metrics failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("get_asset_health_metrics failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("get_asset_health_metrics failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("get_asset_health_metrics failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+    _client = client or _default_client()
+
+    # Build base query for scoping
+    base_q = "^".join(
+        filter(None, (location and f"locationLIKE{location}", model_category and f"model_category={model_category}"))
+    )
+
+    # Expiring contracts within 30 days
+    # One date.today() per call, so both window ends agree across midnight.
+    today = date.today()
+    contract_q = f"ends>={today.isoformat()}^ends<={(today + timedelta(days=30)).isoformat()}"
+
+    # Both figures are aggregated server-side; no asset or contract rows
+    # are transferred.
+    groups, expiring = _client.run_concurrently(
+        functools.partial(
+            _client.get_stats, ASSET_TABLE, query=base_q, group_by=["install_status"], sum_fields=["cost"]
+        ),
+        functools.partial(_client.count_records, CONTRACT_TABLE, query=contract_q),
+    )
+
+    buckets: Counter[str | None] = Counter()
+    for g in groups:
+        buckets[STATUS_BUCKETS.get((g["group"].get("install_status") or "").lower())] += g["count"]
+    total_assets = buckets.total()
+    total_value = math.fsum(g["sum"].get("cost", 0.0) for g in groups)
+
+    metrics = AssetHealthMetric(
+        total_assets=total_assets,
+        active_assets=buckets["active"],
+        retired_assets=buckets["retired"],
+        missing_assets=buckets["missing"],
+        in_stock_assets=buckets["in_stock"],
+        expiring_contracts_30d=expiring,
+        total_asset_value=round(total_value, 2),
+    )
+    return {"metrics": metrics.model_dump(mode="json")}
@@ -6,20 +6,17 @@ the asset has been in its current stage.
 
 from __future__ import annotations
 
-import logging
-from datetime import date, datetime
-from typing import Any
+from datetime import date
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
+from snow_asset_agent._parsing import _parse_date
+from snow_asset_agent.cache import ttl_cached
 from snow_asset_agent.models import AssetLifecycle
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 TABLE = "alm_asset"
 
@@ -36,19 +33,18 @@ STAGE_MAP: dict[str, str] = {
     "Disposed": "Disposed",
     "Absent": "Missing",
 }
+# Case-insensitive view: instances differ in how they capitalise labels.
+_STAGE_MAP_LC: dict[str, str] = {k.lower(): v for k, v in STAGE_MAP.items()}
 
 
 def _days_since(date_str: str | None) -> int | None:
     """Return number of days since a ServiceNow date string, or None."""
-    if not date_str:
-        return None
-    try:
-        dt = datetime.strptime(date_str[:10], "%Y-%m-%d").date()
-        return (date.today() - dt).days
-    except (ValueError, TypeError):
-        return None
+    dt = _parse_date(date_str)
+    return (date.today() - dt).days if dt else None
 
 
+@_sn_tool
+@ttl_cached()
 def get_asset_lifecycle(
     *,
     sys_id: str | None = None,
@@ -59,31 +55,20 @@ def get_asset_lifecycle(
     if not sys_id and not asset_tag:
         return {"error": "Provide either sys_id or asset_tag", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
+    _client = client or _default_client()
 
-        if sys_id:
-            record = _client.get_record(TABLE, sys_id)
-        else:
-            records = _client.get_records(TABLE, query=f"asset_tag={asset_tag}", limit=1)
-            if not records:
-                return {"error": f"Asset not found: asset_tag={asset_tag}", "error_code": "SN_NOT_FOUND"}
-            record = records[0]
+    if sys_id:
+        record = _client.get_record(TABLE, sys_id, fields=AssetLifecycle.snow_fields())
+    else:
+        records = _client.get_records(
+            TABLE, query=f"asset_tag={asset_tag}", fields=AssetLifecycle.snow_fields(), limit=1
+        )
+        if not records:
+            return {"error": f"Asset not found: asset_tag={asset_tag}", "error_code": "SN_NOT_FOUND"}
+        record = records[0]
 
-        install_status = record.get("install_status", "")
-        stage = STAGE_MAP.get(install_status, install_status or "Unknown")
-        days_in_stage = _days_since(record.get("sys_updated_on"))
-        lifecycle = AssetLifecycle.from_snow_record(record, stage=stage, days_in_stage=days_in_stage)
-        return {"lifecycle": lifecycle.model_dump(mode="json")}
-    except ServiceNowAuthError as exc:
-        logger.exception("get_asset_lifecycle failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("get_asset_lifecycle failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("get_asset_lifecycle failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("get_asset_lifecycle failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+    install_status = record.get("install_status") or ""
+    stage = _STAGE_MAP_LC.get(install_status.lower(), install_status or "Unknown")
+    days_in_stage = _days_since(record.get("sys_updated_on"))
+    lifecycle = AssetLifecycle.from_snow_record(record, stage=stage, days_in_stage=days_in_stage)
+    return {"lifecycle": lifecycle.model_dump(mode="json")}
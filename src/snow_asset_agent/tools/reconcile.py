@@ -1,28 +1,32 @@
 """MCP tool: reconcile_assets_to_cis.
 
 Compares ``alm_hardware`` records against ``cmdb_ci`` to find
-assets with no matching configuration item.
+assets with no matching configuration item, and CIs with no asset.
 """
 
 from __future__ import annotations
 
-import logging
-from typing import Any
+import functools
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
+from snow_asset_agent._parsing import _value
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 ASSET_TABLE = "alm_hardware"
 CI_TABLE = "cmdb_ci"
 
+# Linked assets dot-walk to the CI name, so the CI table is never joined
+# client-side.  A ``ci`` pointing at a deleted CI dot-walks to an empty name.
+LINKED_FIELDS = ["sys_id", "asset_tag", "display_name", "ci", "ci.name"]
+UNLINKED_FIELDS = ["sys_id", "asset_tag", "display_name"]
+CI_FIELDS = ["sys_id", "name"]
 
+
+@_sn_tool
 def reconcile_assets_to_cis(
     *,
     model_category: str | None = None,
@@ -31,78 +35,56 @@ def reconcile_assets_to_cis(
 ) -> dict[str, Any]:
     """Reconcile hardware assets against CMDB CIs.
 
-    Returns matched, unmatched-assets (no CI), and unmatched-CIs (no asset).
+    Returns matched assets, unmatched assets (no ``ci``, or a ``ci`` that
+    no longer resolves to a CI) and unmatched CIs.  Unmatched CIs are
+    those whose own ``asset`` reference is empty; a CI referenced only
+    from an asset's ``ci`` field is still listed.  Each group is one
+    server-side filtered query, so *limit* bounds each group rather than
+    the raw tables being joined.
     """
     if limit < 1:
         return {"error": "limit must be >= 1", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
-
-        asset_query = f"model_category={model_category}" if model_category else ""
-        assets = _client.get_records(ASSET_TABLE, query=asset_query, limit=limit)
-        cis = _client.get_records(CI_TABLE, limit=limit)
-
-        # Build lookup: CI sys_id -> CI record
-        ci_by_id: dict[str, dict[str, Any]] = {}
-        for ci in cis:
-            sid = ci.get("sys_id")
-            if sid:
-                ci_by_id[sid] = ci
-
-        matched: list[dict[str, Any]] = []
-        unmatched_assets: list[dict[str, Any]] = []
-
-        seen_ci_ids: set[str] = set()
-
-        for asset in assets:
-            ci_ref = asset.get("ci")
+    _client = client or _default_client()
+
+    scope = f"model_category={model_category}^" if model_category else ""
+    linked, unlinked, orphans = _client.run_concurrently(
+        functools.partial(
+            _client.get_records, ASSET_TABLE, query=f"{scope}ciISNOTEMPTY", fields=LINKED_FIELDS, limit=limit
+        ),
+        functools.partial(
+            _client.get_records, ASSET_TABLE, query=f"{scope}ciISEMPTY", fields=UNLINKED_FIELDS, limit=limit
+        ),
+        functools.partial(_client.get_records, CI_TABLE, query="assetISEMPTY", fields=CI_FIELDS, limit=limit),
+    )
+
+    matched = [
+        {
+            "asset_sys_id": asset.get("sys_id"),
+            "asset_tag": asset.get("asset_tag"),
             # ci might be a dict with 'value' key or a plain string
-            if isinstance(ci_ref, dict):
-                ci_id = ci_ref.get("value") or ""
-            else:
-                ci_id = ci_ref or ""
-
-            if ci_id and ci_id in ci_by_id:
-                matched.append(
-                    {
-                        "asset_sys_id": asset.get("sys_id"),
-                        "asset_tag": asset.get("asset_tag"),
-                        "ci_sys_id": ci_id,
-                        "ci_name": ci_by_id[ci_id].get("name"),
-                    }
-                )
-                seen_ci_ids.add(ci_id)
-            else:
-                unmatched_assets.append(
-                    {
-                        "sys_id": asset.get("sys_id"),
-                        "asset_tag": asset.get("asset_tag"),
-                        "display_name": asset.get("display_name"),
-                    }
-                )
-
-        unmatched_cis = [
-            {"sys_id": ci.get("sys_id"), "name": ci.get("name")} for ci in cis if ci.get("sys_id") not in seen_ci_ids
-        ]
-
-        return {
-            "matched": matched,
-            "matched_count": len(matched),
-            "unmatched_assets": unmatched_assets,
-            "unmatched_assets_count": len(unmatched_assets),
-            "unmatched_cis": unmatched_cis,
-            "unmatched_cis_count": len(unmatched_cis),
+            "ci_sys_id": _value(asset.get("ci")),
+            "ci_name": asset.get("ci.name"),
+        }
+        for asset in linked
+        if asset.get("ci.name")
+    ]
+    dangling = [asset for asset in linked if not asset.get("ci.name")]
+    unmatched_assets = [
+        {
+            "sys_id": asset.get("sys_id"),
+            "asset_tag": asset.get("asset_tag"),
+            "display_name": asset.get("display_name"),
         }
-    except ServiceNowAuthError as exc:
-        logger.exception("reconcile_assets_to_cis failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("reconcile_assets_to_cis failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("reconcile_assets_to_cis failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("reconcile_assets_to_cis failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+        for asset in (*unlinked, *dangling)
+    ]
+    unmatched_cis = [{"sys_id": ci.get("sys_id"), "name": ci.get("name")} for ci in orphans]
+
+    return {
+        "matched": matched,
+        "matched_count": len(matched),
+        "unmatched_assets": unmatched_assets,
+        "unmatched_assets_count": len(unmatched_assets),
+        "unmatched_cis": unmatched_cis,
+        "unmatched_cis_count": len(unmatched_cis),
+    }
@@ -5,23 +5,22 @@ Searches and filters software licenses from the ``alm_license`` table.
 
 from __future__ import annotations
 
-import logging
 from datetime import date, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
+from snow_asset_agent.cache import ttl_cached
 from snow_asset_agent.models import SoftwareLicense
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 TABLE = "alm_license"
 
+# Drops ``^`` (the clause separator) from user-supplied filter values.
+_ESC = str.maketrans({"^": None})
+
 
 def _build_query(
     *,
@@ -30,19 +29,25 @@ def _build_query(
     expiring_soon: int | None = None,
 ) -> str:
     """Build an encoded ServiceNow query string."""
-    parts: list[str] = []
-    if vendor:
-        parts.append(f"vendorLIKE{vendor}")
-    if product:
-        parts.append(f"software_modelLIKE{product}")
+    window = None
     if expiring_soon is not None and expiring_soon > 0:
-        today = date.today().isoformat()
-        future = (date.today() + timedelta(days=expiring_soon)).isoformat()
-        parts.append(f"end_date>={today}")
-        parts.append(f"end_date<={future}")
-    return "^".join(parts)
+        today = date.today()
+        future = today + timedelta(days=expiring_soon)
+        window = f"end_date>={today.isoformat()}^end_date<={future.isoformat()}"
+    return "^".join(
+        filter(
+            None,
+            (
+                vendor and f"vendorLIKE{vendor.translate(_ESC)}",
+                product and f"software_modelLIKE{product.translate(_ESC)}",
+                window,
+            ),
+        )
+    )
 
 
+@_sn_tool
+@ttl_cached()
 def query_software_licenses(
     *,
     vendor: str | None = None,
@@ -58,21 +63,8 @@ def query_software_licenses(
     if limit < 1:
         return {"error": "limit must be >= 1", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
-        query = _build_query(vendor=vendor, product=product, expiring_soon=expiring_soon)
-        records = _client.get_records(TABLE, query=query, limit=limit)
-        licenses = [SoftwareLicense.from_snow_record(r).model_dump(mode="json") for r in records]
-        return {"licenses": licenses, "count": len(licenses)}
-    except ServiceNowAuthError as exc:
-        logger.exception("query_software_licenses failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("query_software_licenses failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("query_software_licenses failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("query_software_licenses failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+    _client = client or _default_client()
+    query = _build_query(vendor=vendor, product=product, expiring_soon=expiring_soon)
+    records = _client.iter_records_paged(TABLE, query=query, fields=SoftwareLicense.snow_fields(), limit=limit)
+    licenses = SoftwareLicense.dump_snow_records(records)
+    return {"licenses": licenses, "count": len(licenses)}
@@ -6,32 +6,22 @@ configurable threshold of days) or are unassigned while marked as "in use".
 
 from __future__ import annotations
 
-import logging
+import functools
 from datetime import date, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
+from snow_asset_agent._parsing import _safe_float
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 TABLE = "alm_hardware"
+FIELDS = ["sys_id", "asset_tag", "display_name", "install_status", "assigned_to", "sys_updated_on", "cost"]
 
 
-def _safe_float(val: Any) -> float:
-    if val is None or val == "":
-        return 0.0
-    try:
-        return float(val)
-    except (ValueError, TypeError):
-        return 0.0
-
-
+@_sn_tool
 def find_underutilized_assets(
     *,
     days_threshold: int = 90,
@@ -41,58 +31,41 @@ def find_underutilized_assets(
     """Find hardware assets whose ``sys_updated_on`` is older than
     *days_threshold* days or that have no ``assigned_to`` while
     marked as in-use.
+
+    ``estimated_waste_cost`` is summed server-side over every matching
+    asset, not just the *limit* returned.
     """
     if limit < 1:
         return {"error": "limit must be >= 1", "error_code": "SN_VALIDATION_ERROR"}
     if days_threshold < 1:
         return {"error": "days_threshold must be >= 1", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
-
-        cutoff = (date.today() - timedelta(days=days_threshold)).isoformat()
-        # Assets marked in-use but not updated recently
-        query = f"install_statusINIn use,Installed^sys_updated_on<{cutoff}"
-        records = _client.get_records(TABLE, query=query, limit=limit)
-
-        items: list[dict[str, Any]] = []
-        total_waste = 0.0
-
-        for rec in records:
-            cost = _safe_float(rec.get("cost"))
-            assigned = rec.get("assigned_to")
-            reason = "inactive"
-            if not assigned or assigned == "":
-                reason = "unassigned"
-
-            total_waste += cost
-            items.append(
-                {
-                    "sys_id": rec.get("sys_id"),
-                    "asset_tag": rec.get("asset_tag"),
-                    "display_name": rec.get("display_name"),
-                    "install_status": rec.get("install_status"),
-                    "assigned_to": assigned,
-                    "sys_updated_on": rec.get("sys_updated_on"),
-                    "cost": round(cost, 2),
-                    "reason": reason,
-                }
-            )
-
-        return {
-            "underutilized_assets": items,
-            "count": len(items),
-            "estimated_waste_cost": round(total_waste, 2),
+    _client = client or _default_client()
+
+    cutoff = (date.today() - timedelta(days=days_threshold)).isoformat()
+    # Assets marked in-use but not updated recently
+    query = f"install_statusINIn use,Installed^sys_updated_on<{cutoff}"
+    records, (totals,) = _client.run_concurrently(
+        functools.partial(_client.get_records, TABLE, query=query, fields=FIELDS, limit=limit),
+        functools.partial(_client.get_stats, TABLE, query=query, sum_fields=["cost"]),
+    )
+
+    items = [
+        {
+            "sys_id": rec.get("sys_id"),
+            "asset_tag": rec.get("asset_tag"),
+            "display_name": rec.get("display_name"),
+            "install_status": rec.get("install_status"),
+            "assigned_to": (assigned := rec.get("assigned_to")),
+            "sys_updated_on": rec.get("sys_updated_on"),
+            "cost": round(_safe_float(rec.get("cost")), 2),
+            "reason": "inactive" if assigned else "unassigned",
         }
-    except ServiceNowAuthError as exc:
-        logger.exception("find_underutilized_assets failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("find_underutilized_assets failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("find_underutilized_assets failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("find_underutilized_assets failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+        for rec in records
+    ]
+
+    return {
+        "underutilized_assets": items,
+        "count": len(items),
+        "estimated_waste_cost": round(totals["sum"].get("cost", 0.0), 2),
+    }
@@ -5,31 +5,23 @@ Calculates usage/entitlement ratios for software licences.
 
 from __future__ import annotations
 
-import logging
-from typing import Any
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
-from snow_asset_agent.client import ServiceNowClient
-from snow_asset_agent.config import get_config
-from snow_asset_agent.exceptions import (
-    ServiceNowAuthError,
-    ServiceNowError,
-    ServiceNowRateLimitError,
-)
+from snow_asset_agent._parsing import _ref, _safe_int
+from snow_asset_agent.cache import ttl_cached
+from snow_asset_agent.tools._base import _sn_tool
+from snow_asset_agent.tools._client import _default_client
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from snow_asset_agent.client import ServiceNowClient
 
 LICENSE_TABLE = "alm_license"
+LICENSE_FIELDS = ["sys_id", "software_model", "rights", "allocated"]
 
 
-def _safe_int(val: Any) -> int:
-    if val is None or val == "":
-        return 0
-    try:
-        return int(float(val))
-    except (ValueError, TypeError):
-        return 0
-
-
+@_sn_tool
+@ttl_cached()
 def get_license_utilization(
     *,
     product: str | None = None,
@@ -44,49 +36,29 @@ def get_license_utilization(
     if limit < 1:
         return {"error": "limit must be >= 1", "error_code": "SN_VALIDATION_ERROR"}
 
-    try:
-        _client = client or ServiceNowClient(get_config())
-
-        parts: list[str] = []
-        if product:
-            parts.append(f"software_modelLIKE{product}")
-        if vendor:
-            parts.append(f"vendorLIKE{vendor}")
-        query = "^".join(parts)
-
-        records = _client.get_records(LICENSE_TABLE, query=query, limit=limit)
-
-        items: list[dict[str, Any]] = []
-        for rec in records:
-            rights = _safe_int(rec.get("rights"))
-            allocated = _safe_int(rec.get("allocated"))
-            utilization_pct = round((allocated / rights) * 100, 1) if rights > 0 else 0.0
-
-            items.append(
-                {
-                    "sys_id": rec.get("sys_id"),
-                    "product": rec.get("software_model")
-                    if isinstance(rec.get("software_model"), str)
-                    else (rec.get("software_model", {}) or {}).get("display_value"),
-                    "rights": rights,
-                    "allocated": allocated,
-                    "utilization_pct": utilization_pct,
-                }
-            )
-
-        # Sort by utilization descending
-        items.sort(key=lambda x: x["utilization_pct"], reverse=True)
-
-        return {"utilization": items, "count": len(items)}
-    except ServiceNowAuthError as exc:
-        logger.exception("get_license_utilization failed: auth error")
-        return {"error": str(exc), "error_code": "SN_AUTH_ERROR"}
-    except ServiceNowRateLimitError as exc:
-        logger.exception("get_license_utilization failed: rate limited")
-        return {"error": str(exc), "error_code": "SN_RATE_LIMIT"}
-    except ServiceNowError as exc:
-        logger.exception("get_license_utilization failed")
-        return {"error": str(exc), "error_code": getattr(exc, 'error_code', 'SN_QUERY_ERROR') or "SN_QUERY_ERROR"}
-    except Exception as exc:
-        logger.exception("get_license_utilization failed")
-        return {"error": str(exc), "error_code": "SN_QUERY_ERROR"}
+    _client = client or _default_client()
+
+    query = "^".join(filter(None, (product and f"software_modelLIKE{product}", vendor and f"vendorLIKE{vendor}")))
+
+    records = _client.get_records(LICENSE_TABLE, query=query, fields=LICENSE_FIELDS, limit=limit)
+
+    items: list[dict[str, Any]] = []
+    for rec in records:
+        rights = _safe_int(rec.get("rights"))
+        allocated = _safe_int(rec.get("allocated"))
+        utilization_pct = round((allocated / rights) * 100, 1) if rights > 0 else 0.0
+
+        items.append(
+            {
+                "sys_id": rec.get("sys_id"),
+                "product": _ref(rec, "software_model"),
+                "rights": rights,
+                "allocated": allocated,
+                "utilization_pct": utilization_pct,
+            }
+        )
+
+    # Sort by utilization descending
+    items.sort(key=itemgetter("utilization_pct"), reverse=True)
+
+    return {"utilization": items, "count": len(items)}
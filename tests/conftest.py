@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from snow_asset_agent.cache import clear_tool_cache
 from snow_asset_agent.client import ServiceNowClient
 from snow_asset_agent.config import AssetAgentConfig, reset_config, set_config
 
@@ -34,6 +35,12 @@ def test_config() -> AssetAgentConfig:
     reset_config()
 
 
+@pytest.fixture(autouse=True)
+def _clear_tool_cache() -> None:
+    """Keep memoised tool results from leaking between tests."""
+    clear_tool_cache()
+
+
 # ------------------------------------------------------------------
 # HTTP mock helpers
 # ------------------------------------------------------------------
@@ -50,7 +57,12 @@ def mock_session(test_config: AssetAgentConfig) -> MagicMock:
 
 @pytest.fixture()
 def client_with_mock_session(test_config: AssetAgentConfig, mock_session: MagicMock) -> ServiceNowClient:
-    """Return a ServiceNowClient whose internal session is mocked."""
-    client = ServiceNowClient(test_config)
-    client._session = mock_session
-    return client
+    """Return a ServiceNowClient whose internal session is mocked.
+
+    Function-scoped on purpose: a client carries per-test state (record
+    cache, in-flight map, config overrides).  It is closed afterwards so
+    idle worker threads do not pile up across the suite.
+    """
+    with ServiceNowClient(test_config) as client:
+        client._session = mock_session
+        yield client  # type: ignore[misc]
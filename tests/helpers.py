@@ -6,106 +6,166 @@ Import as: ``from tests.helpers import make_hardware_record, ...``
 
 from __future__ import annotations
 
-from typing import Any
-from unittest.mock import MagicMock
+import json
+from typing import TYPE_CHECKING, Any
 
 import requests
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 # ------------------------------------------------------------------
 # HTTP mock helpers
 # ------------------------------------------------------------------
 
 
+class _FakeResp:
+    """Minimal stand-in for ``requests.Response``.
+
+    Carries only the attributes the client reads; far cheaper to build
+    than a ``MagicMock`` and, having no call tracking, safe to share.
+    """
+
+    __slots__ = ("content", "headers", "ok", "status_code", "text")
+
+    def __init__(self, *, status_code: int, ok: bool, text: str, content: bytes) -> None:
+        self.status_code = status_code
+        self.ok = ok
+        self.text = text
+        self.content = content
+        self.headers: dict[str, str] = {}
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)  # type: ignore[arg-type]
+
+
 def make_mock_response(
     *,
     status_code: int = 200,
     json_data: Any = None,
     text: str = "",
     ok: bool | None = None,
-) -> MagicMock:
-    """Build a ``requests.Response``-like mock."""
-    resp = MagicMock(spec=requests.Response)
-    resp.status_code = status_code
-    resp.ok = ok if ok is not None else (200 <= status_code < 400)
-    resp.text = text or ""
-    resp.json.return_value = json_data if json_data is not None else {"result": []}
-    return resp
+) -> Any:
+    """Build a ``requests.Response``-like stub."""
+    payload = json_data if json_data is not None else {"result": []}
+    return _FakeResp(
+        status_code=status_code,
+        ok=ok if ok is not None else (200 <= status_code < 400),
+        text=text or "",
+        content=json.dumps(payload).encode(),
+    )
+
+
+# Shared stubs for the most common responses.  The client only reads
+# ``status_code``/``ok``/``content``/``text``, so these are safe to reuse
+# across tests as long as no test mutates them.
+EMPTY_LIST_RESPONSE = make_mock_response(json_data={"result": []})
+NOT_FOUND_RESPONSE = make_mock_response(status_code=404, ok=False, json_data={"error": {"message": "not found"}})
+UNAUTHORIZED_RESPONSE = make_mock_response(status_code=401, ok=False, json_data={"error": {"message": "unauth"}})
+SERVER_ERROR_RESPONSE = make_mock_response(status_code=500, ok=False, json_data={"error": {"message": "internal"}})
+
+# Transport failures for ``side_effect``; the client only wraps them.
+CONN_ERR = requests.ConnectionError("refused")
+TIMEOUT_ERR = requests.Timeout("timed out")
+
+
+def route_by_table(**responses: Any) -> Callable[..., Any]:
+    """Build a ``session.get`` side effect that answers by table name.
+
+    Lets tests stub tools that query several tables concurrently, where
+    call order is not deterministic.
+    """
+
+    def _get(url: str, *args: Any, **kwargs: Any) -> Any:
+        table = url.split("/api/now/", 1)[1].split("/")[1]
+        return responses[table]
+
+    return _get
 
 
 # ------------------------------------------------------------------
 # Sample ServiceNow records
 # ------------------------------------------------------------------
 
+# Factories merge overrides into these templates.  Every value is a
+# string, so the shallow copy never shares mutable state between tests.
+_HARDWARE_RECORD: dict[str, Any] = {
+    "sys_id": "abc123",
+    "asset_tag": "P1000479",
+    "display_name": "Dell Latitude 5520",
+    "model": "Latitude 5520",
+    "model_category": "Computer",
+    "serial_number": "SN12345",
+    "assigned_to": "John Doe",
+    "location": "New York",
+    "install_status": "In use",
+    "substatus": "In use",
+    "cost": "1200.00",
+    "purchase_date": "2023-06-15",
+    "warranty_expiration": "2026-06-15",
+    "ci": "ci_sys_001",
+    "sys_updated_on": "2025-12-01 10:00:00",
+}
+
 
 def make_hardware_record(**overrides: Any) -> dict[str, Any]:
     """Factory for a realistic ``alm_hardware`` record."""
-    base: dict[str, Any] = {
-        "sys_id": "abc123",
-        "asset_tag": "P1000479",
-        "display_name": "Dell Latitude 5520",
-        "model": "Latitude 5520",
-        "model_category": "Computer",
-        "serial_number": "SN12345",
-        "assigned_to": "John Doe",
-        "location": "New York",
-        "install_status": "In use",
-        "substatus": "In use",
-        "cost": "1200.00",
-        "purchase_date": "2023-06-15",
-        "warranty_expiration": "2026-06-15",
-        "ci": "ci_sys_001",
-        "sys_updated_on": "2025-12-01 10:00:00",
-    }
-    base.update(overrides)
-    return base
+    return {**_HARDWARE_RECORD, **overrides}
+
+
+_LICENSE_RECORD: dict[str, Any] = {
+    "sys_id": "lic001",
+    "asset_tag": "L2000100",
+    "display_name": "Microsoft Office 365 E3",
+    "software_model": "Office 365 E3",
+    "vendor": "Microsoft",
+    "license_key": "XXXXX-XXXXX",
+    "rights": "100",
+    "allocated": "85",
+    "cost": "3600.00",
+    "start_date": "2024-01-01",
+    "end_date": "2025-12-31",
+    "sys_updated_on": "2025-11-01 08:00:00",
+}
 
 
 def make_license_record(**overrides: Any) -> dict[str, Any]:
     """Factory for a realistic ``alm_license`` record."""
-    base: dict[str, Any] = {
-        "sys_id": "lic001",
-        "asset_tag": "L2000100",
-        "display_name": "Microsoft Office 365 E3",
-        "software_model": "Office 365 E3",
-        "vendor": "Microsoft",
-        "license_key": "XXXXX-XXXXX",
-        "rights": "100",
-        "allocated": "85",
-        "cost": "3600.00",
-        "start_date": "2024-01-01",
-        "end_date": "2025-12-31",
-        "sys_updated_on": "2025-11-01 08:00:00",
-    }
-    base.update(overrides)
-    return base
+    return {**_LICENSE_RECORD, **overrides}
+
+
+_CONTRACT_RECORD: dict[str, Any] = {
+    "sys_id": "con001",
+    "number": "CNT0001234",
+    "short_description": "Annual hardware support",
+    "vendor": "Dell",
+    "starts": "2024-01-01",
+    "ends": "2025-12-31",
+    "cost": "5000.00",
+    "payment_amount": "416.67",
+    "state": "Active",
+    "sys_updated_on": "2025-10-01 12:00:00",
+}
 
 
 def make_contract_record(**overrides: Any) -> dict[str, Any]:
     """Factory for a realistic ``ast_contract`` record."""
-    base: dict[str, Any] = {
-        "sys_id": "con001",
-        "number": "CNT0001234",
-        "short_description": "Annual hardware support",
-        "vendor": "Dell",
-        "starts": "2024-01-01",
-        "ends": "2025-12-31",
-        "cost": "5000.00",
-        "payment_amount": "416.67",
-        "state": "Active",
-        "sys_updated_on": "2025-10-01 12:00:00",
-    }
-    base.update(overrides)
-    return base
+    return {**_CONTRACT_RECORD, **overrides}
+
+
+_CI_RECORD: dict[str, Any] = {
+    "sys_id": "ci_sys_001",
+    "name": "dell-lat-5520-jdoe",
+    "asset": "abc123",
+    "serial_number": "SN12345",
+    "ip_address": "10.0.0.42",
+}
 
 
 def make_ci_record(**overrides: Any) -> dict[str, Any]:
     """Factory for a realistic ``cmdb_ci`` record."""
-    base: dict[str, Any] = {
-        "sys_id": "ci_sys_001",
-        "name": "dell-lat-5520-jdoe",
-        "asset": "abc123",
-        "serial_number": "SN12345",
-        "ip_address": "10.0.0.42",
-    }
-    base.update(overrides)
-    return base
+    return {**_CI_RECORD, **overrides}
@@ -0,0 +1,106 @@
+"""Tests for snow_asset_agent.cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from snow_asset_agent.cache import TTLCache, clear_tool_cache, ttl_cached
+from snow_asset_agent.config import set_config
+
+
+class TestTTLCache:
+    def test_get_returns_stored_value(self):
+        cache = TTLCache()
+        cache.set("k", 1)
+        assert cache.get("k") == 1
+
+    def test_missing_key_returns_default(self):
+        cache = TTLCache()
+        assert cache.get("missing") is None
+        assert cache.get("missing", "x") == "x"
+
+    def test_expired_entry_is_dropped(self):
+        cache = TTLCache(ttl=0)
+        cache.set("k", 1)
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_overrides_default(self):
+        cache = TTLCache(ttl=0)
+        cache.set("k", 1, ttl=60)
+        assert cache.get("k") == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_discard_if(self):
+        cache = TTLCache()
+        cache.set(("t", "1"), "x")
+        cache.set(("t", "2"), "y")
+        cache.discard_if(lambda key: key[1] == "1")
+        assert cache.get(("t", "1")) is None
+        assert cache.get(("t", "2")) == "y"
+
+    def test_clear(self):
+        cache = TTLCache()
+        cache.set("k", 1)
+        cache.clear()
+        assert len(cache) == 0
+
+
+@pytest.mark.usefixtures("test_config")
+class TestTTLCached:
+    @staticmethod
+    def _counting(result=None):
+        calls = []
+
+        @ttl_cached()
+        def tool(*, limit=50, client=None):
+            calls.append(limit)
+            return dict(result or {"limit": limit})
+
+        return tool, calls
+
+    def test_repeat_call_is_served_from_cache(self):
+        tool, calls = self._counting()
+        assert tool(limit=5) == tool(limit=5) == {"limit": 5}
+        assert calls == [5]
+
+    def test_different_args_are_cached_separately(self):
+        tool, calls = self._counting()
+        tool(limit=5)
+        tool(limit=6)
+        assert calls == [5, 6]
+
+    def test_injected_client_bypasses_cache(self):
+        tool, calls = self._counting()
+        tool(limit=5, client=object())
+        tool(limit=5, client=object())
+        assert calls == [5, 5]
+
+    def test_error_results_are_not_cached(self):
+        tool, calls = self._counting({"error": "boom"})
+        tool(limit=5)
+        tool(limit=5)
+        assert calls == [5, 5]
+
+    def test_clear_tool_cache(self):
+        tool, calls = self._counting()
+        tool(limit=5)
+        assert clear_tool_cache() == 1
+        tool(limit=5)
+        assert calls == [5, 5]
+
+    def test_zero_ttl_disables_cache(self, test_config):
+        set_config(test_config.model_copy(update={"tool_cache_ttl_seconds": 0}))
+        tool, calls = self._counting()
+        tool(limit=5)
+        tool(limit=5)
+        assert calls == [5, 5]
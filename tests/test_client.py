@@ -6,10 +6,15 @@ This is the only acceptable use of mocking per project policy.
 
 from __future__ import annotations
 
+import base64
+import json
+import threading
+import time
+from typing import Any
+
 import pytest
-import requests
 
-from snow_asset_agent.client import ServiceNowClient
+from snow_asset_agent.client import BatchOp, ServiceNowClient
 from snow_asset_agent.exceptions import (
     ServiceNowAPIError,
     ServiceNowAuthError,
@@ -18,7 +23,8 @@ from snow_asset_agent.exceptions import (
     ServiceNowPermissionError,
     ServiceNowRateLimitError,
 )
-from tests.helpers import make_mock_response
+from snow_asset_agent.models import AssetContract
+from tests.helpers import CONN_ERR, EMPTY_LIST_RESPONSE, NOT_FOUND_RESPONSE, TIMEOUT_ERR, make_mock_response
 
 # ------------------------------------------------------------------
 # Client initialisation
@@ -26,14 +32,71 @@ from tests.helpers import make_mock_response
 
 
 class TestClientInit:
-    def test_base_url(self, test_config, mock_session):
+    def test_init(self, test_config, mock_session):
         client = ServiceNowClient(test_config)
         assert client._base_url == "https://test.service-now.com/api/now"
+        assert client._session is mock_session
+
+    def test_timeout_passed_to_requests(self, client_with_mock_session, test_config):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response()
+        client.get_records("alm_asset")
+        assert client._session.get.call_args.kwargs["timeout"] == test_config.servicenow_timeout
+
+    def test_adapter_pool_size(self, test_config):
+        client = ServiceNowClient(test_config.model_copy(update={"servicenow_pool_size": 48}))
+        adapter = client._session.get_adapter("https://test.service-now.com")
+        assert adapter._pool_maxsize == 48
+        assert client._session.headers["Connection"] == "keep-alive"
+
+    def test_no_warm_up_by_default(self, test_config, mock_session):
+        client = ServiceNowClient(test_config)
+        client._pool.shutdown(wait=True)
+        mock_session.get.assert_not_called()
+
+    def test_warm_up_pings_in_background(self, test_config, mock_session):
+        mock_session.get.return_value = EMPTY_LIST_RESPONSE
+        client = ServiceNowClient(test_config.model_copy(update={"servicenow_warm_up": True}))
+        client._pool.shutdown(wait=True)
+        assert "sys_properties" in mock_session.get.call_args.args[0]
+
+    def test_close_releases_pool_and_session(self, test_config, mock_session):
+        with ServiceNowClient(test_config) as client:
+            pass
+        mock_session.close.assert_called_once_with()
+        with pytest.raises(RuntimeError):
+            client.run_concurrently(lambda: None)
+
+    def test_requests_compressed_responses(self, test_config):
+        client = ServiceNowClient(test_config)
+        assert client._session.headers["Accept-Encoding"] == "gzip, deflate"
 
-    def test_session_created(self, test_config, mock_session):
+    def test_retry_policy(self, test_config):
         client = ServiceNowClient(test_config)
-        # Session should exist
-        assert client._session is not None
+        retry = client._session.get_adapter("https://test.service-now.com").max_retries
+        assert retry.total == test_config.servicenow_max_retries
+        assert retry.backoff_jitter == 0.5
+        assert retry.respect_retry_after_header is True
+        assert retry.raise_on_status is False
+        assert 429 in retry.status_forcelist
+
+
+# ------------------------------------------------------------------
+# run_concurrently
+# ------------------------------------------------------------------
+
+
+class TestRunConcurrently:
+    def test_results_in_argument_order(self, client_with_mock_session):
+        results = client_with_mock_session.run_concurrently(lambda: "a", lambda: "b", lambda: "c")
+        assert results == ["a", "b", "c"]
+
+    def test_reraises_failure(self, client_with_mock_session):
+        def _fail():
+            raise ServiceNowAPIError("boom")
+
+        with pytest.raises(ServiceNowAPIError):
+            client_with_mock_session.run_concurrently(lambda: "ok", _fail)
 
 
 # ------------------------------------------------------------------
@@ -48,119 +111,468 @@ class TestGetRecords:
         records = client.get_records("alm_hardware")
         assert len(records) == 2
         assert records[0]["sys_id"] == "1"
+        assert client._session.get.call_args[0][0] == "https://test.service-now.com/api/now/table/alm_hardware"
 
     def test_empty_result(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         records = client.get_records("alm_hardware")
         assert records == []
 
+    def test_excludes_reference_links(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        client.get_records("alm_hardware")
+        assert client._session.get.call_args.kwargs["params"]["sysparm_exclude_reference_link"] == "true"
+
     def test_query_param(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         client.get_records("alm_hardware", query="install_status=In use", limit=10)
-        _, kwargs = client._session.get.call_args
-        assert "install_status=In use" in str(kwargs.get("params", {}))
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_query"] == "install_status=In use"
+        assert params["sysparm_limit"] == 10
 
     def test_fields_param(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         client.get_records("alm_hardware", fields=["sys_id", "asset_tag"])
-        _, kwargs = client._session.get.call_args
-        assert "sys_id,asset_tag" in str(kwargs.get("params", {}))
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_fields"] == "sys_id,asset_tag"
 
-    def test_connection_error(self, client_with_mock_session):
+    @pytest.mark.parametrize("error", [CONN_ERR, TIMEOUT_ERR])
+    def test_transport_error(self, client_with_mock_session, error):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("refused")
+        client._session.get.side_effect = error
         with pytest.raises(ServiceNowConnectionError):
             client.get_records("alm_hardware")
 
-    def test_timeout_error(self, client_with_mock_session):
+    @pytest.mark.parametrize(
+        ("status", "exc"),
+        [
+            (401, ServiceNowAuthError),
+            (403, ServiceNowPermissionError),
+            (404, ServiceNowNotFoundError),
+            (429, ServiceNowRateLimitError),
+            (500, ServiceNowAPIError),
+        ],
+    )
+    def test_http_error_mapping(self, client_with_mock_session, status, exc):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
-        with pytest.raises(ServiceNowConnectionError):
+        client._session.get.return_value = make_mock_response(
+            status_code=status, ok=False, json_data={"error": {"message": "x"}}
+        )
+        with pytest.raises(exc, match="x"):
             client.get_records("alm_hardware")
 
-    def test_401_raises_auth_error(self, client_with_mock_session):
+    def test_non_json_error_body(self, client_with_mock_session):
+        client = client_with_mock_session
+        resp = make_mock_response(status_code=502, ok=False, text="Bad Gateway")
+        resp.content = b"Bad Gateway"
+        client._session.get.return_value = resp
+        with pytest.raises(ServiceNowAPIError, match="Bad Gateway"):
+            client.get_records("alm_hardware")
+
+
+# ------------------------------------------------------------------
+# get_record
+# ------------------------------------------------------------------
+
+
+class TestGetRecordsCoalescing:
+    def _blocking_get(self, release: threading.Event, payload: Any) -> Any:
+        def _get(url: str, params: dict[str, Any], timeout: Any = None) -> Any:
+            release.wait(5)
+            return make_mock_response(json_data=payload)
+
+        return _get
+
+    def test_concurrent_identical_calls_share_one_request(self, client_with_mock_session):
+        client = client_with_mock_session
+        release = threading.Event()
+        client._session.get.side_effect = self._blocking_get(release, {"result": [{"sys_id": "1"}]})
+        results: list[Any] = []
+        ready = threading.Barrier(5)
+
+        def call() -> None:
+            ready.wait()
+            results.append(client.get_records("alm_asset", query="a=1"))
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for t in threads:
+            t.start()
+        ready.wait()
+        time.sleep(0.1)  # let every caller join the in-flight request
+        release.set()
+        for t in threads:
+            t.join(5)
+        assert client._session.get.call_count == 1
+        assert results == [[{"sys_id": "1"}]] * 4
+        assert len({id(r) for r in results}) == 4
+        assert client._inflight == {}
+
+    def test_followers_see_leader_error(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.side_effect = CONN_ERR
+        with pytest.raises(ServiceNowConnectionError):
+            client.get_records("alm_asset")
+        assert client._inflight == {}
+
+    def test_sequential_calls_are_not_coalesced(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        client.get_records("alm_asset")
+        client.get_records("alm_asset")
+        assert client._session.get.call_count == 2
+
+
+class TestGetRecord:
+    def test_returns_single_dict(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "abc"}})
+        record = client.get_record("alm_hardware", "abc")
+        assert record["sys_id"] == "abc"
+        assert client._session.get.call_args[0][0] == "https://test.service-now.com/api/now/table/alm_hardware/abc"
+
+    def test_not_found(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = NOT_FOUND_RESPONSE
+        with pytest.raises(ServiceNowNotFoundError):
+            client.get_record("alm_hardware", "badid")
+
+    def test_excludes_reference_links(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "abc"}})
+        client.get_record("alm_hardware", "abc")
+        assert client._session.get.call_args.kwargs["params"]["sysparm_exclude_reference_link"] == "true"
+
+    def test_not_cached_by_default(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "abc"}})
+        client.get_record("alm_hardware", "abc")
+        client.get_record("alm_hardware", "abc")
+        assert client._session.get.call_count == 2
+
+    def test_repeat_lookup_served_from_cache(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "abc"}})
+        first = client.get_record("cmdb_model", "abc", fields=["name"], cache=True)
+        second = client.get_record("cmdb_model", "abc", fields=["name"], cache=True)
+        assert first == second
+        assert client._session.get.call_count == 1
+
+    def test_cache_key_includes_fields_and_display_value(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "abc"}})
+        client.get_record("cmdb_model", "abc", cache=True)
+        client.get_record("cmdb_model", "abc", fields=["name"], cache=True)
+        client.get_record("cmdb_model", "abc", display_value="true", cache=True)
+        assert client._session.get.call_count == 3
+
+    def test_update_invalidates_cached_record(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "abc"}})
+        client._session.patch.return_value = make_mock_response(json_data={"result": {"sys_id": "abc"}})
+        client.get_record("cmdb_model", "abc", cache=True)
+        client.update_record("cmdb_model", "abc", {"name": "new"})
+        client.get_record("cmdb_model", "abc", cache=True)
+        assert client._session.get.call_count == 2
+
+    def test_delete_invalidates_cached_record(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "abc"}})
+        client._session.delete.return_value = make_mock_response(status_code=204)
+        client.get_record("cmdb_model", "abc", cache=True)
+        client.delete_record("cmdb_model", "abc")
+        client.get_record("cmdb_model", "abc", cache=True)
+        assert client._session.get.call_count == 2
+
+
+# ------------------------------------------------------------------
+# get_records_by_ids
+# ------------------------------------------------------------------
+
+
+class TestGetRecordsByIds:
+    def test_single_query_for_small_batch(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": [{"sys_id": "a"}, {"sys_id": "b"}]})
+        records = client.get_records_by_ids("alm_hardware", ["a", "b"])
+        assert len(records) == 2
+        assert client._session.get.call_count == 1
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_query"] == "sys_idINa,b"
+        assert params["sysparm_limit"] == 2
+
+    def test_chunks_on_count(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        client.get_records_by_ids("alm_hardware", [f"id{i}" for i in range(5)], chunk_size=2)
+        assert client._session.get.call_count == 3
+
+    def test_chunks_on_query_length(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        sys_ids = [f"{i:032x}" for i in range(60)]
+        client.get_records_by_ids("alm_hardware", sys_ids)
+        assert client._session.get.call_count > 1
+        for call in client._session.get.call_args_list:
+            assert len(call.kwargs["params"]["sysparm_query"]) <= 1024
+
+    def test_skips_empty_and_duplicate_ids(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        client.get_records_by_ids("alm_hardware", ["a", "", "a", "b"])
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_query"] == "sys_idINa,b"
+
+    def test_no_ids_no_request(self, client_with_mock_session):
+        client = client_with_mock_session
+        assert client.get_records_by_ids("alm_hardware", []) == []
+        client._session.get.assert_not_called()
+
+
+# ------------------------------------------------------------------
+# count_records / iter_all_records
+# ------------------------------------------------------------------
+
+
+def _page_by_offset(pages: dict[int, list[dict[str, Any]]]) -> Any:
+    """``session.get`` side effect answering each page request by its offset."""
+
+    def _get(url: str, params: dict[str, Any], timeout: Any = None) -> Any:
+        return make_mock_response(json_data={"result": pages.get(params["sysparm_offset"], [])})
+
+    return _get
+
+
+class TestGetRecordsPaged:
+    def test_small_limit_is_single_request(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": [{"sys_id": "1"}]})
+        records = client.get_records_paged("alm_asset", limit=50, page_size=100)
+        assert records == [{"sys_id": "1"}]
+        assert client._session.get.call_count == 1
+        assert "sysparm_query" not in client._session.get.call_args.kwargs["params"]
+
+    def test_large_limit_fetches_pages_in_order(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.side_effect = _page_by_offset(
+            {0: [{"sys_id": "a"}, {"sys_id": "b"}], 2: [{"sys_id": "c"}, {"sys_id": "d"}], 4: [{"sys_id": "e"}]}
+        )
+        records = client.get_records_paged("alm_asset", limit=5, page_size=2)
+        assert [r["sys_id"] for r in records] == ["a", "b", "c", "d", "e"]
+        params = [c.kwargs["params"] for c in client._session.get.call_args_list]
+        assert sorted((p["sysparm_offset"], p["sysparm_limit"]) for p in params) == [(0, 2), (2, 2), (4, 1)]
+        assert all(p["sysparm_query"] == "ORDERBYsys_id" for p in params)
+
+    def test_stops_at_first_short_page(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.side_effect = _page_by_offset({0: [{"sys_id": "a"}, {"sys_id": "b"}], 2: [{"sys_id": "c"}]})
+        records = client.get_records_paged("alm_asset", limit=6, page_size=2)
+        assert [r["sys_id"] for r in records] == ["a", "b", "c"]
+
+    def test_caller_ordering_gets_sys_id_tiebreak(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.side_effect = _page_by_offset({})
+        client.get_records_paged("alm_asset", query="ORDERBYends", limit=4, page_size=2)
+        queries = {c.kwargs["params"]["sysparm_query"] for c in client._session.get.call_args_list}
+        assert queries == {"ORDERBYends^ORDERBYsys_id"}
+
+
+class TestIterRecordsPaged:
+    def test_is_lazy(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.side_effect = _page_by_offset({0: [{"sys_id": "a"}]})
+        records = client.iter_records_paged("alm_asset", limit=10, page_size=2)
+        assert client._session.get.call_count == 0
+        assert [r["sys_id"] for r in records] == ["a"]
+
+    def test_bounds_pages_in_flight(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._config = client._config.model_copy(update={"servicenow_max_workers": 2})
+        pages = {off: [{"sys_id": str(off + i)} for i in range(2)] for off in range(0, 20, 2)}
+        client._session.get.side_effect = _page_by_offset(pages)
+        records = client.iter_records_paged("alm_asset", limit=20, page_size=2)
+        assert next(records)["sys_id"] == "0"
+        assert client._session.get.call_count <= 3
+        assert len(list(records)) == 19
+
+
+class TestGetRecordsForModel:
+    def test_defaults_fields_to_model_plan(self, client_with_mock_session):
         client = client_with_mock_session
         client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "bad creds"}}
+            json_data={"result": [{"sys_id": "c1", "number": "CNT001"}]}
         )
-        with pytest.raises(ServiceNowAuthError):
-            client.get_records("alm_hardware")
+        contracts = client.get_records_for_model(AssetContract, "ast_contract")
+        assert isinstance(contracts[0], AssetContract)
+        assert contracts[0].contract_number == "CNT001"
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_fields"] == ",".join(AssetContract.snow_fields())
 
-    def test_403_raises_permission_error(self, client_with_mock_session):
+    def test_explicit_fields_win(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        client.get_records_for_model(AssetContract, "ast_contract", fields=["sys_id"])
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_fields"] == "sys_id"
+
+
+class TestIterRecordsForModel:
+    def test_yields_models_lazily(self, client_with_mock_session):
         client = client_with_mock_session
         client._session.get.return_value = make_mock_response(
-            status_code=403, ok=False, json_data={"error": {"message": "forbidden"}}
+            json_data={"result": [{"sys_id": "c1", "number": "CNT001"}]}
         )
-        with pytest.raises(ServiceNowPermissionError):
-            client.get_records("alm_hardware")
+        contracts = client.iter_records_for_model(AssetContract, "ast_contract")
+        assert client._session.get.call_count == 0
+        assert [c.contract_number for c in contracts] == ["CNT001"]
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_fields"] == ",".join(AssetContract.snow_fields())
 
-    def test_404_raises_not_found(self, client_with_mock_session):
+    def test_large_limit_is_paged(self, client_with_mock_session):
+        client = client_with_mock_session
+        pages = {0: [{"sys_id": "0"}, {"sys_id": "1"}], 2: [{"sys_id": "2"}]}
+        client._session.get.side_effect = _page_by_offset(pages)
+        client._config = client._config.model_copy(update={"servicenow_page_size": 2})
+        contracts = list(client.iter_records_for_model(AssetContract, "ast_contract", limit=10))
+        assert [c.sys_id for c in contracts] == ["0", "1", "2"]
+
+
+class TestGetStats:
+    def test_ungrouped(self, client_with_mock_session):
         client = client_with_mock_session
         client._session.get.return_value = make_mock_response(
-            status_code=404, ok=False, json_data={"error": {"message": "not found"}}
+            json_data={"result": {"stats": {"count": "3", "sum": {"cost": "150.50"}}}}
         )
-        with pytest.raises(ServiceNowNotFoundError):
-            client.get_records("alm_hardware")
+        groups = client.get_stats("alm_asset", sum_fields=["cost"])
+        assert groups == [{"count": 3, "sum": {"cost": 150.5}, "group": {}}]
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_sum_fields"] == "cost"
+        assert "sysparm_group_by" not in params
 
-    def test_429_raises_rate_limit(self, client_with_mock_session):
+    def test_grouped(self, client_with_mock_session):
         client = client_with_mock_session
         client._session.get.return_value = make_mock_response(
-            status_code=429, ok=False, json_data={"error": {"message": "rate limited"}}
+            json_data={
+                "result": [
+                    {"stats": {"count": "2"}, "groupby_fields": [{"field": "install_status", "value": "1"}]},
+                    {"stats": {"count": "5"}, "groupby_fields": [{"field": "install_status", "value": "7"}]},
+                ]
+            }
         )
-        with pytest.raises(ServiceNowRateLimitError):
-            client.get_records("alm_hardware")
+        groups = client.get_stats("alm_asset", group_by=["install_status"], having="count^sys_id^>^1")
+        assert [(g["group"]["install_status"], g["count"]) for g in groups] == [("1", 2), ("7", 5)]
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_group_by"] == "install_status"
+        assert params["sysparm_having"] == "count^sys_id^>^1"
 
-    def test_500_raises_api_error(self, client_with_mock_session):
+    def test_prefers_display_value_for_groups(self, client_with_mock_session):
         client = client_with_mock_session
         client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
+            json_data={
+                "result": [
+                    {
+                        "stats": {"count": "2"},
+                        "groupby_fields": [{"field": "install_status", "value": "1", "display_value": "In use"}],
+                    }
+                ]
+            }
         )
-        with pytest.raises(ServiceNowAPIError):
-            client.get_records("alm_hardware")
+        groups = client.get_stats("alm_asset", group_by=["install_status"], display_value="true")
+        assert groups[0]["group"] == {"install_status": "In use"}
 
-    def test_non_json_error_body(self, client_with_mock_session):
+
+class TestCountRecords:
+    def test_returns_count(self, client_with_mock_session):
         client = client_with_mock_session
-        resp = make_mock_response(status_code=502, ok=False, text="Bad Gateway")
-        resp.json.side_effect = ValueError("no json")
-        client._session.get.return_value = resp
-        with pytest.raises(ServiceNowAPIError):
-            client.get_records("alm_hardware")
+        client._session.get.return_value = make_mock_response(json_data={"result": {"stats": {"count": "42"}}})
+        assert client.count_records("alm_hardware", query="install_status=1") == 42
+        url = client._session.get.call_args[0][0]
+        assert url == "https://test.service-now.com/api/now/stats/alm_hardware"
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_count"] == "true"
+        assert params["sysparm_query"] == "install_status=1"
 
+    def test_empty_stats_is_zero(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        assert client.count_records("alm_hardware") == 0
 
-# ------------------------------------------------------------------
-# get_record
-# ------------------------------------------------------------------
+    def test_connection_error(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.side_effect = CONN_ERR
+        with pytest.raises(ServiceNowConnectionError):
+            client.count_records("alm_hardware")
 
 
-class TestGetRecord:
-    def test_returns_single_dict(self, client_with_mock_session):
+class TestIterRecords:
+    def test_pages_until_short_page(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "abc"}})
-        record = client.get_record("alm_hardware", "abc")
-        assert record["sys_id"] == "abc"
+        client._session.get.side_effect = [
+            make_mock_response(json_data={"result": [{"sys_id": "1"}, {"sys_id": "2"}]}),
+            make_mock_response(json_data={"result": [{"sys_id": "3"}]}),
+        ]
+        records = list(client.iter_records("alm_asset", page_size=2))
+        assert [r["sys_id"] for r in records] == ["1", "2", "3"]
+        offsets = [c.kwargs["params"]["sysparm_offset"] for c in client._session.get.call_args_list]
+        assert offsets == [0, 2]
+
+    def test_is_lazy(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": [{"sys_id": "1"}]})
+        it = client.iter_records("alm_asset", page_size=1)
+        assert client._session.get.call_count == 0
+        next(it)
+        assert client._session.get.call_count == 1
 
-    def test_not_found(self, client_with_mock_session):
+    def test_empty_table(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=404, ok=False, json_data={"error": {"message": "not found"}}
-        )
-        with pytest.raises(ServiceNowNotFoundError):
-            client.get_record("alm_hardware", "badid")
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        assert list(client.iter_records("alm_asset")) == []
+        assert client._session.get.call_count == 1
 
-    def test_connection_error(self, client_with_mock_session):
+
+class TestIterAllRecords:
+    @staticmethod
+    def _route(total):
+        def _get(url, params=None, timeout=None):
+            if "/stats/" in url:
+                return make_mock_response(json_data={"result": {"stats": {"count": str(total)}}})
+            offset = params["sysparm_offset"]
+            rows = [{"sys_id": str(i)} for i in range(offset, min(offset + params["sysparm_limit"], total))]
+            return make_mock_response(json_data={"result": rows})
+
+        return _get
+
+    def test_yields_all_pages_in_order(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
-        with pytest.raises(ServiceNowConnectionError):
-            client.get_record("alm_hardware", "abc")
+        client._session.get.side_effect = self._route(25)
+        records = list(client.iter_all_records("alm_hardware", page_size=10, max_workers=2))
+        assert [r["sys_id"] for r in records] == [str(i) for i in range(25)]
+        # 1 count request + 3 page requests
+        assert client._session.get.call_count == 4
 
-    def test_timeout_error(self, client_with_mock_session):
+    def test_orders_by_sys_id(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("fail")
-        with pytest.raises(ServiceNowConnectionError):
-            client.get_record("alm_hardware", "abc")
+        client._session.get.side_effect = self._route(5)
+        list(client.iter_all_records("alm_hardware", query="install_status=1", page_size=10))
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_query"] == "install_status=1^ORDERBYsys_id"
+
+    def test_caller_ordering_gets_sys_id_tiebreak(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.side_effect = self._route(5)
+        list(client.iter_all_records("alm_hardware", query="ORDERBYends", page_size=10))
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_query"] == "ORDERBYends^ORDERBYsys_id"
+
+    def test_empty_table(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.side_effect = self._route(0)
+        assert list(client.iter_all_records("alm_hardware")) == []
+        assert client._session.get.call_count == 1
 
 
 # ------------------------------------------------------------------
@@ -175,18 +587,6 @@ class TestCreateRecord:
         result = client.create_record("alm_hardware", {"asset_tag": "NEW"})
         assert result["sys_id"] == "new1"
 
-    def test_connection_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.post.side_effect = requests.ConnectionError("fail")
-        with pytest.raises(ServiceNowConnectionError):
-            client.create_record("alm_hardware", {})
-
-    def test_timeout_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.post.side_effect = requests.Timeout("fail")
-        with pytest.raises(ServiceNowConnectionError):
-            client.create_record("alm_hardware", {})
-
 
 # ------------------------------------------------------------------
 # update_record
@@ -202,18 +602,6 @@ class TestUpdateRecord:
         result = client.update_record("alm_hardware", "u1", {"asset_tag": "UPDATED"})
         assert result["asset_tag"] == "UPDATED"
 
-    def test_connection_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.patch.side_effect = requests.ConnectionError("fail")
-        with pytest.raises(ServiceNowConnectionError):
-            client.update_record("alm_hardware", "u1", {})
-
-    def test_timeout_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.patch.side_effect = requests.Timeout("fail")
-        with pytest.raises(ServiceNowConnectionError):
-            client.update_record("alm_hardware", "u1", {})
-
 
 # ------------------------------------------------------------------
 # delete_record
@@ -228,17 +616,33 @@ class TestDeleteRecord:
 
     def test_not_found(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.delete.return_value = make_mock_response(
-            status_code=404, ok=False, json_data={"error": {"message": "not found"}}
-        )
+        client._session.delete.return_value = NOT_FOUND_RESPONSE
         with pytest.raises(ServiceNowNotFoundError):
             client.delete_record("alm_hardware", "bad")
 
-    def test_connection_error(self, client_with_mock_session):
+
+# ------------------------------------------------------------------
+# Transport errors on single-record CRUD
+# ------------------------------------------------------------------
+
+
+class TestCrudTransportErrors:
+    @pytest.mark.parametrize(
+        ("verb", "call"),
+        [
+            ("get", lambda c: c.get_record("alm_hardware", "abc")),
+            ("post", lambda c: c.create_record("alm_hardware", {})),
+            ("patch", lambda c: c.update_record("alm_hardware", "u1", {})),
+            ("delete", lambda c: c.delete_record("alm_hardware", "d1")),
+        ],
+        ids=["get_record", "create_record", "update_record", "delete_record"],
+    )
+    @pytest.mark.parametrize("error", [CONN_ERR, TIMEOUT_ERR])
+    def test_wrapped_as_connection_error(self, client_with_mock_session, verb, call, error):
         client = client_with_mock_session
-        client._session.delete.side_effect = requests.ConnectionError("fail")
+        getattr(client._session, verb).side_effect = error
         with pytest.raises(ServiceNowConnectionError):
-            client.delete_record("alm_hardware", "d1")
+            call(client)
 
 
 # ------------------------------------------------------------------
@@ -246,6 +650,85 @@ class TestDeleteRecord:
 # ------------------------------------------------------------------
 
 
+def _batch_response(*subs: tuple[int, Any]) -> Any:
+    """Build a Batch API response with one serviced request per ``(status, body)``."""
+    serviced = [
+        {
+            "id": str(i),
+            "status_code": status,
+            "body": base64.b64encode(json.dumps(body).encode()).decode() if body is not None else "",
+        }
+        for i, (status, body) in enumerate(subs)
+    ]
+    return make_mock_response(json_data={"batch_request_id": "x", "serviced_requests": serviced})
+
+
+class TestBatch:
+    def test_envelope(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.post.return_value = _batch_response((201, {"result": {"sys_id": "n1"}}))
+        client.batch([BatchOp("POST", "alm_license", data={"rights": "5"})])
+        url = client._session.post.call_args.args[0]
+        body = client._session.post.call_args.kwargs["json"]
+        assert url == "https://test.service-now.com/api/now/v1/batch"
+        sub = body["rest_requests"][0]
+        assert sub["method"] == "POST"
+        assert sub["url"] == "/api/now/table/alm_license"
+        assert json.loads(base64.b64decode(sub["body"])) == {"rights": "5"}
+
+    def test_results_in_op_order(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.post.return_value = _batch_response(
+            (200, {"result": {"sys_id": "a"}}),
+            (204, None),
+        )
+        results = client.batch(
+            [BatchOp("PATCH", "alm_license", "a", {"rights": "1"}), BatchOp("DELETE", "alm_license", "b")]
+        )
+        assert [r.status_code for r in results] == [200, 204]
+        assert results[0].result == {"sys_id": "a"}
+        assert all(r.ok for r in results)
+
+    def test_sub_request_error_is_mapped(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.post.return_value = _batch_response((404, {"error": {"message": "gone"}}))
+        (result,) = client.batch([BatchOp("DELETE", "alm_license", "missing")])
+        assert not result.ok
+        assert isinstance(result.error, ServiceNowNotFoundError)
+        assert "gone" in str(result.error)
+
+    def test_unserviced_request(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.post.return_value = make_mock_response(json_data={"serviced_requests": []})
+        (result,) = client.batch([BatchOp("DELETE", "alm_license", "a")])
+        assert isinstance(result.error, ServiceNowAPIError)
+
+    def test_splits_into_batches_of_100(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.post.side_effect = [
+            _batch_response(*[(204, None)] * 100),
+            _batch_response(*[(204, None)] * 50),
+        ]
+        results = client.batch([BatchOp("DELETE", "alm_license", str(i)) for i in range(150)])
+        assert len(results) == 150
+        assert client._session.post.call_count == 2
+
+    def test_invalidates_cached_records(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "a"}})
+        client._session.post.return_value = _batch_response((200, {"result": {"sys_id": "a"}}))
+        client.get_record("alm_license", "a", cache=True)
+        client.batch([BatchOp("PATCH", "alm_license", "a", {"rights": "1"})])
+        client.get_record("alm_license", "a", cache=True)
+        assert client._session.get.call_count == 2
+
+    def test_batch_call_failure_raises(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.post.side_effect = CONN_ERR
+        with pytest.raises(ServiceNowConnectionError):
+            client.batch([BatchOp("DELETE", "alm_license", "a")])
+
+
 class TestPing:
     def test_ping_success(self, client_with_mock_session):
         client = client_with_mock_session
@@ -262,24 +745,3 @@ class TestPing:
         result = client.ping()
         assert result["status"] == "error"
         assert "response_time_s" in result
-
-
-# ------------------------------------------------------------------
-# URL construction
-# ------------------------------------------------------------------
-
-
-class TestURLConstruction:
-    def test_table_url(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
-        client.get_records("alm_hardware")
-        url = client._session.get.call_args[0][0]
-        assert url == "https://test.service-now.com/api/now/table/alm_hardware"
-
-    def test_record_url(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": {}})
-        client.get_record("alm_hardware", "abc123")
-        url = client._session.get.call_args[0][0]
-        assert url == "https://test.service-now.com/api/now/table/alm_hardware/abc123"
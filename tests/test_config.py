@@ -3,13 +3,42 @@
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 
 from snow_asset_agent.config import AssetAgentConfig, get_config, reset_config, set_config
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
+
+@pytest.fixture(autouse=True, scope="module")
+def _isolated_env() -> Iterator[None]:
+    """Construct configs against an empty environment and no ``.env`` file.
+
+    pydantic-settings reads both on every construction; emptying them keeps
+    that cheap on CI runners with large environments and stops a
+    developer's own ``SERVICENOW_*`` variables leaking into the default
+    and missing-field checks.  Tests that exercise env loading patch in
+    their own variables.
+    """
+    with patch.dict(os.environ, clear=True), patch.dict(AssetAgentConfig.model_config, {"env_file": None}):
+        yield
+
+
+@pytest.fixture(scope="module")
+def default_cfg() -> AssetAgentConfig:
+    """A config with only the required fields set, shared by read-only tests."""
+    return AssetAgentConfig(
+        servicenow_instance="https://x.service-now.com",
+        servicenow_username="u",
+        servicenow_password="p",
+    )
+
+
+@pytest.mark.fast
 class TestAssetAgentConfig:
     """Test configuration loading, defaults, and validation."""
 
@@ -18,42 +47,30 @@ class TestAssetAgentConfig:
         assert test_config.servicenow_username == "test_user"
         assert test_config.servicenow_password == "test_pass"
 
-    def test_defaults(self):
-        cfg = AssetAgentConfig(
-            servicenow_instance="https://x.service-now.com",
-            servicenow_username="u",
-            servicenow_password="p",
-        )
-        assert cfg.servicenow_timeout == 30
-        assert cfg.servicenow_max_retries == 3
-        assert cfg.log_level == "INFO"
-
-    def test_custom_timeout(self):
-        cfg = AssetAgentConfig(
-            servicenow_instance="https://x.service-now.com",
-            servicenow_username="u",
-            servicenow_password="p",
-            servicenow_timeout=60,
-        )
-        assert cfg.servicenow_timeout == 60
-
-    def test_custom_max_retries(self):
-        cfg = AssetAgentConfig(
-            servicenow_instance="https://x.service-now.com",
-            servicenow_username="u",
-            servicenow_password="p",
-            servicenow_max_retries=5,
-        )
-        assert cfg.servicenow_max_retries == 5
-
-    def test_log_level_override(self):
+    def test_defaults(self, default_cfg):
+        assert default_cfg.servicenow_timeout == 30
+        assert default_cfg.servicenow_max_retries == 3
+        assert default_cfg.servicenow_max_workers == 8
+        assert default_cfg.servicenow_pool_size == 32
+        assert default_cfg.servicenow_page_size == 100
+        assert default_cfg.servicenow_warm_up is False
+        assert default_cfg.cache_ttl_seconds == 300
+        assert default_cfg.tool_cache_ttl_seconds == 30
+        assert default_cfg.log_level == "INFO"
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [("servicenow_timeout", 60), ("servicenow_max_retries", 5), ("log_level", "DEBUG")],
+    )
+    def test_field_override(self, field, value):
+        # Constructed rather than model_copy()'d: keyword population is what is under test.
         cfg = AssetAgentConfig(
             servicenow_instance="https://x.service-now.com",
             servicenow_username="u",
             servicenow_password="p",
-            log_level="DEBUG",
+            **{field: value},
         )
-        assert cfg.log_level == "DEBUG"
+        assert getattr(cfg, field) == value
 
     def test_base_url_strips_trailing_slash(self):
         cfg = AssetAgentConfig(
@@ -63,17 +80,21 @@ class TestAssetAgentConfig:
         )
         assert cfg.base_url == "https://x.service-now.com/api/now"
 
-    def test_base_url_no_trailing_slash(self):
-        cfg = AssetAgentConfig(
-            servicenow_instance="https://x.service-now.com",
-            servicenow_username="u",
-            servicenow_password="p",
-        )
-        assert cfg.base_url == "https://x.service-now.com/api/now"
+    def test_base_url_no_trailing_slash(self, default_cfg):
+        assert default_cfg.base_url == "https://x.service-now.com/api/now"
 
     def test_auth_tuple(self, test_config):
         assert test_config.auth == ("test_user", "test_pass")
 
+    def test_base_url_computed_once(self, test_config):
+        assert test_config.base_url is test_config.base_url
+
+    def test_model_copy_recomputes_derived_values(self, test_config):
+        assert test_config.base_url == "https://test.service-now.com/api/now"
+        copied = test_config.model_copy(update={"servicenow_instance": "https://other.service-now.com"})
+        assert copied.base_url == "https://other.service-now.com/api/now"
+        assert "base_url" not in copied.model_dump()
+
     def test_missing_instance_raises(self):
         with pytest.raises((ValueError, TypeError)):
             AssetAgentConfig(
@@ -123,27 +144,35 @@ class TestAssetAgentConfig:
 class TestGetConfig:
     """Test the singleton config accessor."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _reset(self) -> Iterator[None]:
         reset_config()
-
-    def teardown_method(self):
+        yield
         reset_config()
 
-    def test_set_and_get(self):
-        cfg = AssetAgentConfig(
+    @pytest.fixture(scope="class")
+    @classmethod
+    def cfg(cls) -> AssetAgentConfig:
+        return AssetAgentConfig(
             servicenow_instance="https://singleton.service-now.com",
             servicenow_username="u",
             servicenow_password="p",
         )
+
+    def test_set_and_get(self, cfg):
         set_config(cfg)
         assert get_config().servicenow_instance == "https://singleton.service-now.com"
 
-    def test_reset_clears(self):
-        cfg = AssetAgentConfig(
-            servicenow_instance="https://resettable.service-now.com",
-            servicenow_username="u",
-            servicenow_password="p",
-        )
+    def test_returns_same_instance(self, test_config):
+        assert get_config() is get_config()
+
+    def test_set_after_get_takes_effect(self, test_config):
+        get_config()
+        cfg = test_config.model_copy(update={"servicenow_timeout": 5})
+        set_config(cfg)
+        assert get_config() is cfg
+
+    def test_reset_clears(self, cfg):
         set_config(cfg)
         reset_config()
         # After reset, calling get_config without env vars should fail
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from datetime import date
 
+import pytest
+
+from snow_asset_agent._parsing import _safe_float, _safe_int
 from snow_asset_agent.models import (
     AssetBase,
     AssetContract,
@@ -11,16 +14,33 @@ from snow_asset_agent.models import (
     AssetLifecycle,
     HardwareAsset,
     SoftwareLicense,
+    _AssetContractRow,
     _parse_date,
     _parse_float,
     _parse_int,
+    _ref,
 )
+from tests.helpers import make_contract_record, make_hardware_record, make_license_record
 
 # ------------------------------------------------------------------
 # Parsing helpers
 # ------------------------------------------------------------------
 
 
+class TestRef:
+    def test_plain_value(self):
+        assert _ref({"vendor": "Dell"}, "vendor") == "Dell"
+
+    def test_reference_dict_display_value(self):
+        assert _ref({"vendor": {"value": "v1", "display_value": "Dell"}}, "vendor") == "Dell"
+
+    def test_reference_dict_sub_key(self):
+        assert _ref({"ci": {"value": "ci1", "display_value": "host"}}, "ci", "value") == "ci1"
+
+    def test_missing_key(self):
+        assert _ref({}, "vendor") is None
+
+
 class TestParseDate:
     def test_valid_date_string(self):
         assert _parse_date("2024-06-15") == date(2024, 6, 15)
@@ -41,6 +61,12 @@ class TestParseDate:
         d = date(2024, 1, 1)
         assert _parse_date(d) == d
 
+    def test_out_of_range_date(self):
+        assert _parse_date("2024-13-45") is None
+
+    def test_unpadded_date(self):
+        assert _parse_date("2024-6-5") == date(2024, 6, 5)
+
 
 class TestParseFloat:
     def test_valid_float_string(self):
@@ -75,6 +101,29 @@ class TestParseInt:
     def test_invalid(self):
         assert _parse_int("abc") is None
 
+    def test_non_finite(self):
+        assert _parse_int("inf") is None
+
+
+class TestSafeNumbers:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(1.5, 1.5), (3, 3.0), ("2.25", 2.25), (None, 0.0), ("", 0.0), ("1,234", 0.0), (True, 1.0)],
+    )
+    def test_safe_float(self, value, expected):
+        assert _safe_float(value) == expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(7, 7), ("42", 42), ("42.7", 42), (9.9, 9), (None, 0), ("", 0), ("abc", 0)],
+    )
+    def test_safe_int(self, value, expected):
+        assert _safe_int(value) == expected
+
+    @pytest.mark.parametrize("value", ["nan", "inf", "-inf", "1e400", float("nan"), float("inf")])
+    def test_safe_int_non_finite(self, value):
+        assert _safe_int(value) == 0
+
 
 # ------------------------------------------------------------------
 # AssetBase
@@ -250,6 +299,44 @@ class TestAssetContract:
         assert c.contract_number is None
 
 
+class TestAssetContractRow:
+    RECORD = {
+        "sys_id": "c1",
+        "number": "CNT001",
+        "short_description": "Support",
+        "vendor": {"display_value": "Dell", "value": "v1"},
+        "starts": "2024-01-01",
+        "ends": "2025-01-01 00:00:00",
+        "cost": "5000",
+        "payment_amount": "416.67",
+        "state": "Active",
+        "sys_updated_on": "2024-06-01 12:00:00",
+    }
+
+    def test_fields_follow_model_plan(self):
+        assert list(_AssetContractRow.__slots__) == [dest for dest, _src, _fn in AssetContract._SNOW_FIELDS]
+
+    def test_to_dict_matches_model_dump(self):
+        for record in (self.RECORD, {}):
+            (row,) = _AssetContractRow.from_snow_records([record])
+            assert row.to_dict() == AssetContract.from_snow_record(record).model_dump(mode="json")
+
+
+class TestDumpSnowRecords:
+    @pytest.mark.parametrize(
+        ("model", "record"),
+        [(HardwareAsset, make_hardware_record()), (SoftwareLicense, make_license_record())],
+    )
+    def test_matches_model_dump(self, model, record):
+        for rec in (record, {}):
+            (dumped,) = model.dump_snow_records([rec])
+            assert dumped == model.from_snow_record(rec).model_dump(mode="json")
+
+    @pytest.mark.parametrize("model", [HardwareAsset, SoftwareLicense])
+    def test_plan_covers_every_field_in_order(self, model):
+        assert [dest for dest, _src, _fn in model._SNOW_FIELDS] == list(model.model_fields)
+
+
 # ------------------------------------------------------------------
 # AssetLifecycle
 # ------------------------------------------------------------------
@@ -306,3 +393,44 @@ class TestAssetHealthMetric:
         m = AssetHealthMetric(total_assets=10)
         data = m.model_dump()
         assert "total_assets" in data
+
+
+# ------------------------------------------------------------------
+# model_construct
+# ------------------------------------------------------------------
+
+
+class TestFromSnowRecordSkipsValidation:
+    @pytest.mark.parametrize("model", [AssetBase, HardwareAsset, SoftwareLicense, AssetContract, AssetLifecycle])
+    def test_field_plan_targets_model_fields(self, model):
+        dests = {dest for dest, _src, _fn in model._SNOW_FIELDS}
+        assert dests <= set(model.model_fields)
+
+    @pytest.mark.parametrize(
+        ("model", "record"),
+        [
+            (AssetBase, make_hardware_record()),
+            (HardwareAsset, make_hardware_record()),
+            (SoftwareLicense, make_license_record()),
+            (AssetContract, make_contract_record()),
+            (AssetLifecycle, make_hardware_record()),
+        ],
+        ids=["AssetBase", "HardwareAsset", "SoftwareLicense", "AssetContract", "AssetLifecycle"],
+    )
+    def test_parsed_values_pass_validation(self, model, record):
+        """The parsers must already produce what validation would accept."""
+        built = model.from_snow_record(record)
+        assert model.model_validate(built.model_dump()) == built
+
+    def test_bulk_matches_single(self):
+        records = [make_license_record(), make_license_record(sys_id="lic002", rights="5")]
+        bulk = SoftwareLicense.from_snow_records(records)
+        assert bulk == [SoftwareLicense.from_snow_record(r) for r in records]
+
+    def test_snow_fields_use_source_keys(self):
+        assert "software_model" in SoftwareLicense.snow_fields()
+        assert "product" not in SoftwareLicense.snow_fields()
+
+    def test_unexpected_types_are_kept(self):
+        asset = AssetBase.from_snow_record({"sys_id": 123})
+        assert asset.sys_id == 123
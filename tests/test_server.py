@@ -5,58 +5,110 @@ Verifies server initialisation and that all expected tools are registered.
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
 import pytest
 
-from snow_asset_agent.server import mcp
+from snow_asset_agent.client import ServiceNowClient
+from tests.helpers import make_hardware_record, make_mock_response
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+EXPECTED_TOOLS = (
+    "health_check",
+    "clear_cache",
+    "tool_query_hardware_assets",
+    "tool_query_software_licenses",
+    "tool_get_asset_details",
+    "tool_get_asset_lifecycle",
+    "tool_get_asset_contracts",
+    "tool_calculate_asset_costs",
+    "tool_check_license_compliance",
+    "tool_get_license_utilization",
+    "tool_track_asset_depreciation",
+    "tool_find_underutilized_assets",
+    "tool_reconcile_assets_to_cis",
+    "tool_get_asset_health_metrics",
+    "tool_find_expiring_contracts",
+)
+
+
+@pytest.fixture(scope="module")
+def server() -> ModuleType:
+    """Import the server on first use rather than at collection.
+
+    Importing it loads FastMCP and registers every tool, which each
+    xdist worker would otherwise pay while collecting this file.
+    """
+    return importlib.import_module("snow_asset_agent.server")
 
 
 class TestServerInit:
     """Verify the FastMCP server is configured correctly."""
 
-    def test_server_name(self):
-        assert mcp.name == "snow-asset-agent"
-
-    def test_server_has_tools(self):
-        """All 14 tools (13 asset tools + health check) should be importable."""
-        # Importing server registers all tools; we just verify the module loads
-        from snow_asset_agent import server
+    def test_server_name(self, server):
+        assert server.mcp.name == "snow-asset-agent"
 
+    def test_server_has_tools(self, server):
+        """All 15 tools (13 asset tools + health check + cache clear) should be importable."""
         assert server.mcp is not None
 
 
 class TestToolRegistration:
     """Verify that all expected tool functions exist on the server module."""
 
-    EXPECTED_TOOLS = [
-        "health_check",
-        "tool_query_hardware_assets",
-        "tool_query_software_licenses",
-        "tool_get_asset_details",
-        "tool_get_asset_lifecycle",
-        "tool_get_asset_contracts",
-        "tool_calculate_asset_costs",
-        "tool_check_license_compliance",
-        "tool_get_license_utilization",
-        "tool_track_asset_depreciation",
-        "tool_find_underutilized_assets",
-        "tool_reconcile_assets_to_cis",
-        "tool_get_asset_health_metrics",
-        "tool_find_expiring_contracts",
-    ]
-
-    @pytest.mark.parametrize("tool_name", EXPECTED_TOOLS)
-    def test_tool_function_exists(self, tool_name):
-        from snow_asset_agent import server
-
-        assert hasattr(server, tool_name), f"Missing tool function: {tool_name}"
-        obj = getattr(server, tool_name)
-        # FastMCP @mcp.tool() wraps functions into FunctionTool objects;
-        # they are not plain callables but do have a .fn attribute.
-        assert obj is not None
+    def test_all_tool_functions_exist(self, server):
+        missing = [name for name in EXPECTED_TOOLS if getattr(server, name, None) is None]
+        assert not missing, f"Missing tool functions: {missing}"
 
     def test_total_tool_count(self):
-        """Sanity check: we expect exactly 14 tool functions."""
-        assert len(self.EXPECTED_TOOLS) == 14
+        """Sanity check: we expect exactly 15 tool functions."""
+        assert len(EXPECTED_TOOLS) == 15
+
+    def test_registered_tools_hide_client_injection(self, server):
+        """The shims exist so the ``client`` test seam never reaches MCP clients."""
+        tools = asyncio.run(server.mcp.list_tools())
+        assert sorted(t.name for t in tools) == sorted(EXPECTED_TOOLS)
+        assert all("client" not in t.parameters.get("properties", {}) for t in tools)
+
+
+class TestHealthCheck:
+    def test_pings_through_shared_client(self, server, test_config, mock_session):
+        from snow_asset_agent.tools._client import _default_client
+
+        with patch.object(ServiceNowClient, "ping", autospec=True, return_value={"status": "ok"}) as ping:
+            first = server.health_check()
+            server.health_check()
+        assert first["status"] == "ok"
+        assert first["instance"] == test_config.servicenow_instance
+        assert [c.args[0] for c in ping.call_args_list] == [_default_client()] * 2
+
+
+class TestClearCache:
+    def test_cached_record_refetched_after_clear(self, server, test_config, mock_session):
+        from snow_asset_agent.tools._client import _default_client
+
+        mock_session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "m1", "name": "Dell"}})
+        client = _default_client()
+        client.get_record("cmdb_model", "m1", cache=True)
+        mock_session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "m1", "name": "HP"}})
+        assert server.clear_cache() == {"cleared": 1}
+        assert client.get_record("cmdb_model", "m1", cache=True)["name"] == "HP"
+
+    def test_asset_details_see_backend_changes(self, server, test_config, mock_session):
+        def _asset(status: str) -> Any:
+            return make_mock_response(json_data={"result": make_hardware_record(sys_id="a1", install_status=status)})
+
+        mock_session.get.return_value = _asset("In use")
+        assert server.tool_get_asset_details(sys_id="a1")["asset"]["install_status"] == "In use"
+        server.clear_cache()
+        mock_session.get.return_value = _asset("Retired")
+        assert server.tool_get_asset_details(sys_id="a1")["asset"]["install_status"] == "Retired"
+        assert mock_session.get.call_count == 2
 
 
 class TestImports:
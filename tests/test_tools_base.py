@@ -0,0 +1,54 @@
+"""Tests for snow_asset_agent.tools._base."""
+
+from __future__ import annotations
+
+import pytest
+
+from snow_asset_agent.exceptions import (
+    ServiceNowAuthError,
+    ServiceNowError,
+    ServiceNowNotFoundError,
+    ServiceNowRateLimitError,
+)
+from snow_asset_agent.tools._base import _sn_tool
+
+
+def _raising(exc: Exception):
+    @_sn_tool
+    def tool(**kwargs):
+        raise exc
+
+    return tool
+
+
+class TestSnTool:
+    def test_passes_result_through(self):
+        @_sn_tool
+        def tool(*, limit=1):
+            return {"count": limit}
+
+        assert tool(limit=3) == {"count": 3}
+        assert tool.__name__ == "tool"
+
+    @pytest.mark.parametrize(
+        ("exc", "code"),
+        [
+            (ServiceNowAuthError("denied"), "SN_AUTH_ERROR"),
+            (ServiceNowRateLimitError("slow down"), "SN_RATE_LIMIT"),
+            (ServiceNowError("bad query"), "SN_QUERY_ERROR"),
+            (RuntimeError("boom"), "SN_QUERY_ERROR"),
+        ],
+    )
+    def test_maps_exceptions_to_envelope(self, exc, code):
+        assert _raising(exc)() == {"error": str(exc), "error_code": code}
+
+    def test_uses_exception_error_code_when_present(self):
+        exc = ServiceNowNotFoundError("gone")
+        exc.error_code = "SN_NOT_FOUND"  # type: ignore[attr-defined]
+        assert _raising(exc)()["error_code"] == "SN_NOT_FOUND"
+
+    def test_logs_against_tool_module(self, caplog):
+        with caplog.at_level("ERROR"):
+            _raising(ServiceNowError("bad"))()
+        assert caplog.records[0].name == __name__
+        assert caplog.records[0].getMessage() == "tool failed"
@@ -0,0 +1,38 @@
+"""Tests for snow_asset_agent.tools._client."""
+
+from __future__ import annotations
+
+from snow_asset_agent.config import set_config
+from snow_asset_agent.tools._client import _clear_default_client_cache, _default_client
+from tests.helpers import make_mock_response
+
+
+class TestDefaultClient:
+    def test_reused_across_calls(self, test_config, mock_session):
+        assert _default_client() is _default_client()
+
+    def test_uses_config_singleton(self, test_config, mock_session):
+        assert _default_client()._config is test_config
+
+    def test_rebuilt_when_config_changes(self, test_config, mock_session):
+        first = _default_client()
+        set_config(test_config.model_copy(update={"servicenow_timeout": 7}))
+        second = _default_client()
+        assert second is not first
+        assert first._timeout == 5
+        assert second._timeout == 7
+
+    def test_replaced_client_is_closed(self, test_config, mock_session):
+        first = _default_client()
+        set_config(test_config.model_copy())
+        _default_client()
+        mock_session.close.assert_called_once_with()
+        assert first._pool._shutdown
+
+    def test_clear_cache_empties_shared_record_cache(self, test_config, mock_session):
+        mock_session.get.return_value = make_mock_response(json_data={"result": {"sys_id": "m1"}})
+        client = _default_client()
+        client.get_record("cmdb_model", "m1", cache=True)
+        assert _clear_default_client_cache() == 1
+        client.get_record("cmdb_model", "m1", cache=True)
+        assert mock_session.get.call_count == 2
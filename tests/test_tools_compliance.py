@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-import requests
+import pytest
 
 from snow_asset_agent.tools.compliance import _safe_int, check_license_compliance
-from tests.helpers import make_license_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    EMPTY_LIST_RESPONSE,
+    SERVER_ERROR_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_license_record,
+    make_mock_response,
+)
 
 
 class TestSafeInt:
@@ -54,7 +62,14 @@ class TestCheckLicenseCompliance:
         client = client_with_mock_session
         rec = make_license_record(rights="0", allocated="0")
         client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
-        result = check_license_compliance(client=client)
+        result = check_license_compliance(client=client, include_unknown=True)
+        assert result["compliance_results"][0]["status"] == "unknown"
+
+    def test_non_finite_counts_treated_as_zero(self, client_with_mock_session):
+        client = client_with_mock_session
+        rec = make_license_record(rights="inf", allocated="nan")
+        client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
+        result = check_license_compliance(client=client, include_unknown=True)
         assert result["compliance_results"][0]["status"] == "unknown"
 
     def test_gap_calculation(self, client_with_mock_session):
@@ -66,49 +81,41 @@ class TestCheckLicenseCompliance:
 
     def test_empty_results(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = check_license_compliance(client=client)
         assert result["count"] == 0
         assert result["compliant"] == 0
 
     def test_product_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         check_license_compliance(client=client, product="Office")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Office" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Office" in params["sysparm_query"]
 
     def test_vendor_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         check_license_compliance(client=client, vendor="Adobe")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Adobe" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Adobe" in params["sysparm_query"]
 
     def test_invalid_limit(self, client_with_mock_session):
         result = check_license_compliance(client=client_with_mock_session, limit=0)
         assert "error" in result
         assert result["error_code"] == "SN_VALIDATION_ERROR"
 
-    def test_connection_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
-        result = check_license_compliance(client=client)
-        assert "error" in result
-
-    def test_401_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
-        result = check_license_compliance(client=client)
-        assert "error" in result
-
-    def test_500_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
-        )
+    @pytest.mark.parametrize(
+        "stub",
+        [CONN_ERR, TIMEOUT_ERR, UNAUTHORIZED_RESPONSE, SERVER_ERROR_RESPONSE],
+        ids=["connection", "timeout", "401", "500"],
+    )
+    def test_error_paths(self, client_with_mock_session, stub):
+        client = client_with_mock_session
+        if isinstance(stub, Exception):
+            client._session.get.side_effect = stub
+        else:
+            client._session.get.return_value = stub
         result = check_license_compliance(client=client)
         assert "error" in result
 
@@ -147,12 +154,6 @@ class TestCheckLicenseCompliance:
         assert result["compliant"] == 1
         assert result["non_compliant"] == 1
 
-    def test_timeout_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
-        result = check_license_compliance(client=client)
-        assert "error" in result
-
     def test_software_model_as_dict(self, client_with_mock_session):
         client = client_with_mock_session
         rec = make_license_record()
@@ -170,6 +171,63 @@ class TestCheckLicenseCompliance:
         rec = make_license_record()
         rec.pop("rights")
         client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
-        result = check_license_compliance(client=client)
+        result = check_license_compliance(client=client, include_unknown=True)
         # rights defaults to 0 -> status should be "unknown"
         assert result["compliance_results"][0]["status"] == "unknown"
+
+    def test_requests_only_needed_fields(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        check_license_compliance(client=client)
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_fields"] == "sys_id,software_model,rights,allocated"
+
+    def test_unknown_filtered_server_side_by_default(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        check_license_compliance(client=client)
+        assert client._session.get.call_args.kwargs["params"]["sysparm_query"] == "rights>0"
+
+    def test_include_unknown_drops_rights_filter(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        check_license_compliance(client=client, include_unknown=True)
+        assert "sysparm_query" not in client._session.get.call_args.kwargs["params"]
+
+
+def _stats_group(rights: str, allocated: str, count: int) -> dict:
+    return {
+        "stats": {"count": str(count)},
+        "groupby_fields": [{"field": "rights", "value": rights}, {"field": "allocated", "value": allocated}],
+    }
+
+
+class TestComplianceSummary:
+    def test_counts_from_grouped_stats(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(
+            json_data={
+                "result": [
+                    _stats_group("100", "60", 3),  # compliant
+                    _stats_group("100", "20", 2),  # under-utilised
+                    _stats_group("50", "80", 4),  # over-allocated
+                    _stats_group("0", "5", 1),  # unknown
+                ]
+            }
+        )
+        result = check_license_compliance(client=client, detail=False, include_unknown=True)
+        assert result["count"] == 10
+        assert result["compliant"] == 5
+        assert result["under_utilised"] == 2
+        assert result["non_compliant"] == 4
+        assert result["compliance_results"] == []
+
+    def test_uses_aggregate_api(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        check_license_compliance(client=client, vendor="Microsoft", detail=False)
+        url = client._session.get.call_args.args[0]
+        params = client._session.get.call_args.kwargs["params"]
+        assert "/stats/alm_license" in url
+        assert params["sysparm_group_by"] == "rights,allocated"
+        assert params["sysparm_query"] == "vendorLIKEMicrosoft^rights>0"
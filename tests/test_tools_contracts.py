@@ -2,30 +2,34 @@
 
 from __future__ import annotations
 
-import requests
+import pytest
 
 from snow_asset_agent.tools.contracts import _build_query, get_asset_contracts
-from tests.helpers import make_contract_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    EMPTY_LIST_RESPONSE,
+    SERVER_ERROR_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_contract_record,
+    make_mock_response,
+)
 
 
 class TestBuildQuery:
-    def test_empty(self):
-        assert _build_query() == ""
-
-    def test_asset_sys_id(self):
-        assert _build_query(asset_sys_id="a1") == "asset=a1"
-
-    def test_vendor(self):
-        assert _build_query(vendor="Dell") == "vendorLIKEDell"
-
-    def test_state(self):
-        assert _build_query(state="Active") == "state=Active"
-
-    def test_combined(self):
-        q = _build_query(asset_sys_id="a1", vendor="Dell", state="Active")
-        assert "asset=a1" in q
-        assert "vendorLIKEDell" in q
-        assert "state=Active" in q
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, ""),
+            ({"asset_sys_id": "a1"}, "asset=a1"),
+            ({"vendor": "Dell"}, "vendorLIKEDell"),
+            ({"state": "Active"}, "state=Active"),
+            ({"asset_sys_id": "a1", "vendor": "Dell", "state": "Active"}, "asset=a1^vendorLIKEDell^state=Active"),
+        ],
+        ids=["empty", "asset_sys_id", "vendor", "state", "combined"],
+    )
+    def test_build_query(self, kwargs, expected):
+        assert _build_query(**kwargs) == expected
 
 
 class TestGetAssetContracts:
@@ -38,56 +42,48 @@ class TestGetAssetContracts:
 
     def test_empty_results(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = get_asset_contracts(client=client)
         assert result["contracts"] == []
         assert result["count"] == 0
 
     def test_vendor_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         get_asset_contracts(client=client, vendor="HP")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "HP" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "HP" in params["sysparm_query"]
 
     def test_state_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         get_asset_contracts(client=client, state="Expired")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Expired" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Expired" in params["sysparm_query"]
 
     def test_asset_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         get_asset_contracts(client=client, asset_sys_id="asset1")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "asset1" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "asset1" in params["sysparm_query"]
 
     def test_invalid_limit(self, client_with_mock_session):
         result = get_asset_contracts(client=client_with_mock_session, limit=0)
         assert "error" in result
         assert result["error_code"] == "SN_VALIDATION_ERROR"
 
-    def test_connection_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
-        result = get_asset_contracts(client=client)
-        assert "error" in result
-
-    def test_401_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
-        result = get_asset_contracts(client=client)
-        assert "error" in result
-
-    def test_500_error(self, client_with_mock_session):
+    @pytest.mark.parametrize(
+        "stub",
+        [CONN_ERR, TIMEOUT_ERR, UNAUTHORIZED_RESPONSE, SERVER_ERROR_RESPONSE],
+        ids=["connection", "timeout", "401", "500"],
+    )
+    def test_error_paths(self, client_with_mock_session, stub):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
-        )
+        if isinstance(stub, Exception):
+            client._session.get.side_effect = stub
+        else:
+            client._session.get.return_value = stub
         result = get_asset_contracts(client=client)
         assert "error" in result
 
@@ -107,12 +103,6 @@ class TestGetAssetContracts:
         result = get_asset_contracts(client=client)
         assert result["count"] == 4
 
-    def test_timeout_error(self, client_with_mock_session):
-        client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
-        result = get_asset_contracts(client=client)
-        assert "error" in result
-
     def test_cost_parsed(self, client_with_mock_session):
         client = client_with_mock_session
         client._session.get.return_value = make_mock_response(
@@ -127,6 +117,6 @@ class TestGetAssetContracts:
 
     def test_no_filters(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = get_asset_contracts(client=client)
         assert result["count"] == 0
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-import requests
-
 from snow_asset_agent.tools.costs import _safe_float, calculate_asset_costs
-from tests.helpers import make_hardware_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    EMPTY_LIST_RESPONSE,
+    SERVER_ERROR_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_hardware_record,
+    make_mock_response,
+)
 
 
 class TestSafeFloat:
@@ -38,7 +44,7 @@ class TestCalculateAssetCosts:
 
     def test_empty_results(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = calculate_asset_costs(client=client)
         assert result["total_purchase_cost"] == 0.0
         assert result["asset_count"] == 0
@@ -70,17 +76,17 @@ class TestCalculateAssetCosts:
 
     def test_department_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         calculate_asset_costs(client=client, department="IT")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "IT" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "IT" in params["sysparm_query"]
 
     def test_model_category_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         calculate_asset_costs(client=client, model_category="Server")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Server" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Server" in params["sysparm_query"]
 
     def test_invalid_limit(self, client_with_mock_session):
         result = calculate_asset_costs(client=client_with_mock_session, limit=0)
@@ -89,7 +95,7 @@ class TestCalculateAssetCosts:
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = calculate_asset_costs(client=client)
         assert "error" in result
 
@@ -120,26 +126,29 @@ class TestCalculateAssetCosts:
 
     def test_401_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
+        client._session.get.return_value = UNAUTHORIZED_RESPONSE
         result = calculate_asset_costs(client=client)
         assert "error" in result
 
     def test_500_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
-        )
+        client._session.get.return_value = SERVER_ERROR_RESPONSE
         result = calculate_asset_costs(client=client)
         assert "error" in result
 
     def test_timeout_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = calculate_asset_costs(client=client)
         assert "error" in result
 
     def test_negative_limit(self, client_with_mock_session):
         result = calculate_asset_costs(client=client_with_mock_session, limit=-1)
         assert "error" in result
+
+    def test_requests_only_needed_fields(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        calculate_asset_costs(client=client)
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_fields"] == "sys_id,asset_tag,display_name,cost"
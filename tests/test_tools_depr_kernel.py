@@ -0,0 +1,36 @@
+"""Tests for snow_asset_agent.tools._depr_kernel."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from snow_asset_agent.tools._depr_kernel import compute
+
+TODAY = date(2026, 1, 1).toordinal()
+
+
+class TestCompute:
+    def test_partial_depreciation(self):
+        purchased = TODAY - 365  # just under one year
+        years, annual, accumulated, current, remaining = compute([1200.0], [purchased], [3], TODAY)
+        assert years[0] == pytest.approx(365 / 365.25)
+        assert annual[0] == 400.0
+        assert accumulated[0] == pytest.approx(400.0 * years[0])
+        assert current[0] == pytest.approx(1200.0 - accumulated[0])
+        assert remaining[0] == pytest.approx(3 - years[0])
+
+    def test_fully_depreciated_is_capped(self):
+        _, _, accumulated, current, remaining = compute([1000.0], [TODAY - 3653], [4], TODAY)
+        assert accumulated[0] == 1000.0
+        assert current[0] == 0.0
+        assert remaining[0] == 0.0
+
+    def test_columns_align_with_inputs(self):
+        columns = compute([100.0, 200.0], [TODAY, TODAY], [2, 4], TODAY)
+        assert all(len(col) == 2 for col in columns)
+        assert columns[1] == [50.0, 50.0]
+
+    def test_empty(self):
+        assert compute([], [], [], TODAY) == ([], [], [], [], [])
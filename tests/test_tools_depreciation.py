@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
-import requests
-
 from snow_asset_agent.tools.depreciation import (
     DEFAULT_USEFUL_LIFE,
     FALLBACK_USEFUL_LIFE,
@@ -13,7 +11,7 @@ from snow_asset_agent.tools.depreciation import (
     _safe_float,
     track_asset_depreciation,
 )
-from tests.helpers import make_hardware_record, make_mock_response
+from tests.helpers import CONN_ERR, EMPTY_LIST_RESPONSE, TIMEOUT_ERR, make_hardware_record, make_mock_response
 
 
 class TestSafeFloat:
@@ -70,9 +68,16 @@ class TestTrackAssetDepreciation:
         assert asset["cost"] == 3000.0
         assert asset["useful_life_years"] == 3
 
+    def test_cost_echoed_as_parsed(self, client_with_mock_session):
+        client = client_with_mock_session
+        rec = make_hardware_record(cost="1234.567", purchase_date="2024-01-01")
+        client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
+        asset = track_asset_depreciation(client=client)["assets"][0]
+        assert asset["cost"] == 1234.567
+
     def test_empty_results(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = track_asset_depreciation(client=client)
         assert result["count"] == 0
 
@@ -100,10 +105,10 @@ class TestTrackAssetDepreciation:
 
     def test_model_category_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         track_asset_depreciation(client=client, model_category="Server")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Server" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Server" in params["sysparm_query"]
 
     def test_current_value_not_negative(self, client_with_mock_session):
         client = client_with_mock_session
@@ -127,7 +132,7 @@ class TestTrackAssetDepreciation:
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = track_asset_depreciation(client=client)
         assert "error" in result
 
@@ -170,7 +175,7 @@ class TestTrackAssetDepreciation:
 
     def test_timeout_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = track_asset_depreciation(client=client)
         assert "error" in result
 
@@ -185,3 +190,17 @@ class TestTrackAssetDepreciation:
         client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
         result = track_asset_depreciation(client=client)
         assert result["assets"][0]["remaining_useful_life_years"] >= 0
+
+    def test_requests_only_needed_fields(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        track_asset_depreciation(client=client)
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_fields"] == "sys_id,asset_tag,cost,purchase_date,model_category"
+
+    def test_prefilters_unusable_rows_server_side(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        track_asset_depreciation(client=client, model_category="Server")
+        query = client._session.get.call_args.kwargs["params"]["sysparm_query"]
+        assert query == "model_category=Server^purchase_dateISNOTEMPTY^cost>0"
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-import requests
-
 from snow_asset_agent.tools.details import get_asset_details
-from tests.helpers import make_hardware_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    EMPTY_LIST_RESPONSE,
+    NOT_FOUND_RESPONSE,
+    SERVER_ERROR_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_hardware_record,
+    make_mock_response,
+)
 
 
 class TestGetAssetDetails:
@@ -31,30 +38,26 @@ class TestGetAssetDetails:
 
     def test_asset_not_found_by_tag(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = get_asset_details(asset_tag="MISSING", client=client)
         assert "error" in result
         assert result["error_code"] == "SN_NOT_FOUND"
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = get_asset_details(sys_id="abc", client=client)
         assert "error" in result
 
     def test_401_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
+        client._session.get.return_value = UNAUTHORIZED_RESPONSE
         result = get_asset_details(sys_id="abc", client=client)
         assert "error" in result
 
     def test_500_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
-        )
+        client._session.get.return_value = SERVER_ERROR_RESPONSE
         result = get_asset_details(sys_id="abc", client=client)
         assert "error" in result
 
@@ -68,15 +71,13 @@ class TestGetAssetDetails:
 
     def test_404_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=404, ok=False, json_data={"error": {"message": "not found"}}
-        )
+        client._session.get.return_value = NOT_FOUND_RESPONSE
         result = get_asset_details(sys_id="badid", client=client)
         assert "error" in result
 
     def test_timeout_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = get_asset_details(sys_id="abc", client=client)
         assert "error" in result
 
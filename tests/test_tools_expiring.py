@@ -4,10 +4,16 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
-import requests
-
 from snow_asset_agent.tools.expiring import _urgency, find_expiring_contracts
-from tests.helpers import make_contract_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    EMPTY_LIST_RESPONSE,
+    SERVER_ERROR_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_contract_record,
+    make_mock_response,
+)
 
 
 class TestUrgency:
@@ -38,6 +44,9 @@ class TestUrgency:
     def test_zero(self):
         assert _urgency(0) == "critical"
 
+    def test_first_day_of_each_band(self):
+        assert [_urgency(d) for d in (-1, 31, 61, 91)] == ["expired", "warning", "notice", "info"]
+
 
 class TestFindExpiringContracts:
     def _make_expiring_contract(self, days_from_now=30):
@@ -54,7 +63,7 @@ class TestFindExpiringContracts:
 
     def test_empty_results(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = find_expiring_contracts(client=client)
         assert result["count"] == 0
 
@@ -85,6 +94,16 @@ class TestFindExpiringContracts:
         days = [c["days_remaining"] for c in result["contracts"]]
         assert days == sorted(days)
 
+    def test_contract_without_ends_sorted_last(self, client_with_mock_session):
+        client = client_with_mock_session
+        undated = make_contract_record()
+        undated.pop("ends")
+        records = [undated, self._make_expiring_contract(45), self._make_expiring_contract(5)]
+        client._session.get.return_value = make_mock_response(json_data={"result": records})
+        result = find_expiring_contracts(client=client)
+        days = [c["days_remaining"] for c in result["contracts"]]
+        assert days == [5, 45, None]
+
     def test_total_value_at_risk(self, client_with_mock_session):
         client = client_with_mock_session
         rec = self._make_expiring_contract(30)
@@ -94,27 +113,42 @@ class TestFindExpiringContracts:
 
     def test_vendor_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         find_expiring_contracts(client=client, vendor="Dell")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Dell" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Dell" in params["sysparm_query"]
 
     def test_include_expired(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         find_expiring_contracts(client=client, include_expired=True)
-        params = client._session.get.call_args[1].get("params", {})
+        params = client._session.get.call_args.kwargs["params"]
         # Should include dates in the past
         query = str(params)
         assert "ends>=" in query
 
+    def test_ordered_by_end_date_server_side(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        find_expiring_contracts(client=client, vendor="Dell")
+        query = client._session.get.call_args.kwargs["params"]["sysparm_query"]
+        assert query.endswith("^vendorLIKEDell^ORDERBYends")
+
+    def test_paged_fetch_breaks_end_date_ties_by_sys_id(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._config = client._config.model_copy(update={"servicenow_page_size": 2})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        find_expiring_contracts(client=client, limit=5)
+        query = client._session.get.call_args.kwargs["params"]["sysparm_query"]
+        assert query.endswith("^ORDERBYends^ORDERBYsys_id")
+
     def test_custom_days_ahead(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         find_expiring_contracts(client=client, days_ahead=180)
-        params = client._session.get.call_args[1].get("params", {})
+        params = client._session.get.call_args.kwargs["params"]
         future_date = (date.today() + timedelta(days=180)).isoformat()
-        assert future_date in str(params)
+        assert future_date in params["sysparm_query"]
 
     def test_invalid_limit(self, client_with_mock_session):
         result = find_expiring_contracts(client=client_with_mock_session, limit=0)
@@ -127,23 +161,19 @@ class TestFindExpiringContracts:
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = find_expiring_contracts(client=client)
         assert "error" in result
 
     def test_401_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
+        client._session.get.return_value = UNAUTHORIZED_RESPONSE
         result = find_expiring_contracts(client=client)
         assert "error" in result
 
     def test_500_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
-        )
+        client._session.get.return_value = SERVER_ERROR_RESPONSE
         result = find_expiring_contracts(client=client)
         assert "error" in result
 
@@ -171,7 +201,7 @@ class TestFindExpiringContracts:
 
     def test_timeout_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = find_expiring_contracts(client=client)
         assert "error" in result
 
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-import requests
-
 from snow_asset_agent.tools.hardware import _build_query, query_hardware_assets
-from tests.helpers import make_hardware_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    EMPTY_LIST_RESPONSE,
+    SERVER_ERROR_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_hardware_record,
+    make_mock_response,
+)
 
 
 class TestBuildQuery:
@@ -30,6 +36,9 @@ class TestBuildQuery:
     def test_location(self):
         assert _build_query(location="NYC") == "locationLIKENYC"
 
+    def test_caret_in_value_cannot_add_clauses(self):
+        assert _build_query(location="NYC^ORinstall_status=Retired") == "locationLIKENYCORinstall_status=Retired"
+
     def test_combined(self):
         q = _build_query(status="In use", department="IT")
         assert "install_status=In use" in q
@@ -48,7 +57,7 @@ class TestQueryHardwareAssets:
 
     def test_empty_results(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = query_hardware_assets(client=client)
         assert result["assets"] == []
         assert result["count"] == 0
@@ -62,10 +71,10 @@ class TestQueryHardwareAssets:
 
     def test_status_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         query_hardware_assets(client=client, status="Retired")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Retired" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Retired" in params["sysparm_query"]
 
     def test_invalid_limit(self, client_with_mock_session):
         result = query_hardware_assets(client=client_with_mock_session, limit=0)
@@ -78,24 +87,20 @@ class TestQueryHardwareAssets:
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = query_hardware_assets(client=client)
         assert "error" in result
         assert result["error_code"] == "SN_QUERY_ERROR"
 
     def test_401_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
+        client._session.get.return_value = UNAUTHORIZED_RESPONSE
         result = query_hardware_assets(client=client)
         assert "error" in result
 
     def test_500_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
-        )
+        client._session.get.return_value = SERVER_ERROR_RESPONSE
         result = query_hardware_assets(client=client)
         assert "error" in result
 
@@ -111,24 +116,24 @@ class TestQueryHardwareAssets:
 
     def test_department_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         query_hardware_assets(client=client, department="Finance")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Finance" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Finance" in params["sysparm_query"]
 
     def test_model_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         query_hardware_assets(client=client, model="Latitude")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Latitude" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Latitude" in params["sysparm_query"]
 
     def test_location_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         query_hardware_assets(client=client, location="Chicago")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Chicago" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Chicago" in params["sysparm_query"]
 
     def test_cost_is_float(self, client_with_mock_session):
         client = client_with_mock_session
@@ -148,13 +153,13 @@ class TestQueryHardwareAssets:
 
     def test_no_filters(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = query_hardware_assets(client=client)
         assert result["count"] == 0
 
     def test_all_filters(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         query_hardware_assets(
             client=client,
             status="In use",
@@ -164,7 +169,7 @@ class TestQueryHardwareAssets:
             assigned_to="John",
             location="NYC",
         )
-        params = client._session.get.call_args[1].get("params", {})
+        params = client._session.get.call_args.kwargs["params"]
         query_str = str(params)
         assert "In use" in query_str
         assert "IT" in query_str
@@ -172,6 +177,6 @@ class TestQueryHardwareAssets:
 
     def test_timeout_returns_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = query_hardware_assets(client=client)
         assert "error" in result
@@ -2,37 +2,57 @@
 
 from __future__ import annotations
 
-import requests
-
-from snow_asset_agent.tools.health import _safe_float, get_asset_health_metrics
-from tests.helpers import make_contract_record, make_hardware_record, make_mock_response
-
-
-class TestSafeFloat:
-    def test_valid(self):
-        assert _safe_float("100") == 100.0
-
-    def test_none(self):
-        assert _safe_float(None) == 0.0
+from collections import defaultdict
+from typing import Any
+
+from snow_asset_agent.tools.health import get_asset_health_metrics
+from tests.helpers import (
+    CONN_ERR,
+    SERVER_ERROR_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_mock_response,
+    route_by_table,
+)
+
+
+def _asset_stats(*assets: tuple[str, str | None]) -> Any:
+    """Aggregate API response grouping ``(install_status, cost)`` pairs."""
+    counts: dict[str, int] = defaultdict(int)
+    sums: dict[str, float] = defaultdict(float)
+    for status, cost in assets:
+        counts[status] += 1
+        sums[status] += float(cost or 0)
+    return make_mock_response(
+        json_data={
+            "result": [
+                {
+                    "stats": {"count": str(counts[s]), "sum": {"cost": str(sums[s])}},
+                    "groupby_fields": [{"field": "install_status", "value": s, "display_value": s}],
+                }
+                for s in counts
+            ]
+        }
+    )
+
+
+def _contract_count(n: int) -> Any:
+    return make_mock_response(json_data={"result": {"stats": {"count": str(n)}}})
 
 
 class TestGetAssetHealthMetrics:
-    def _make_asset(self, status, cost="1000"):
-        rec = make_hardware_record(install_status=status, cost=cost)
-        return rec
+    def _route(self, client, *assets: tuple[str, str | None], contracts: int = 0) -> None:
+        client._session.get.side_effect = route_by_table(
+            alm_asset=_asset_stats(*assets),
+            ast_contract=_contract_count(contracts),
+        )
+
+    def _asset_params(self, client) -> dict[str, Any]:
+        return next(c.kwargs["params"] for c in client._session.get.call_args_list if "alm_asset" in c.args[0])
 
     def test_happy_path(self, client_with_mock_session):
         client = client_with_mock_session
-        assets = [
-            self._make_asset("In use"),
-            self._make_asset("Retired"),
-            self._make_asset("Missing"),
-            self._make_asset("In stock"),
-        ]
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": assets}),
-            make_mock_response(json_data={"result": []}),  # contracts
-        ]
+        self._route(client, ("In use", "1000"), ("Retired", "1000"), ("Missing", "1000"), ("In stock", "1000"))
         result = get_asset_health_metrics(client=client)
         assert "metrics" in result
         m = result["metrics"]
@@ -44,80 +64,65 @@ class TestGetAssetHealthMetrics:
 
     def test_empty_assets(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": []}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client)
         result = get_asset_health_metrics(client=client)
         assert result["metrics"]["total_assets"] == 0
 
     def test_total_value(self, client_with_mock_session):
         client = client_with_mock_session
-        assets = [self._make_asset("In use", "5000"), self._make_asset("In use", "3000")]
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": assets}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client, ("In use", "5000"), ("In use", "3000"))
         result = get_asset_health_metrics(client=client)
         assert result["metrics"]["total_asset_value"] == 8000.0
 
     def test_expiring_contracts(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": []}),
-            make_mock_response(json_data={"result": [make_contract_record(), make_contract_record()]}),
-        ]
+        self._route(client, contracts=2)
         result = get_asset_health_metrics(client=client)
         assert result["metrics"]["expiring_contracts_30d"] == 2
 
     def test_location_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": []}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client)
         get_asset_health_metrics(client=client, location="NYC")
-        params = client._session.get.call_args_list[0][1].get("params", {})
-        assert "NYC" in str(params)
+        assert "NYC" in self._asset_params(client)["sysparm_query"]
 
     def test_model_category_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": []}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client)
         get_asset_health_metrics(client=client, model_category="Server")
-        params = client._session.get.call_args_list[0][1].get("params", {})
-        assert "Server" in str(params)
+        assert "Server" in self._asset_params(client)["sysparm_query"]
+
+    def test_aggregated_server_side(self, client_with_mock_session):
+        client = client_with_mock_session
+        self._route(client)
+        get_asset_health_metrics(client=client)
+        urls = sorted(c.args[0] for c in client._session.get.call_args_list)
+        assert all("/stats/" in url for url in urls)
+        params = self._asset_params(client)
+        assert params["sysparm_group_by"] == "install_status"
+        assert params["sysparm_sum_fields"] == "cost"
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = get_asset_health_metrics(client=client)
         assert "error" in result
 
     def test_401_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
+        client._session.get.return_value = UNAUTHORIZED_RESPONSE
         result = get_asset_health_metrics(client=client)
         assert "error" in result
 
     def test_500_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
-        )
+        client._session.get.return_value = SERVER_ERROR_RESPONSE
         result = get_asset_health_metrics(client=client)
         assert "error" in result
 
     def test_output_structure(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": []}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client)
         result = get_asset_health_metrics(client=client)
         m = result["metrics"]
         for key in [
@@ -133,21 +138,13 @@ class TestGetAssetHealthMetrics:
 
     def test_installed_counted_as_active(self, client_with_mock_session):
         client = client_with_mock_session
-        assets = [self._make_asset("Installed")]
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": assets}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client, ("Installed", "1000"))
         result = get_asset_health_metrics(client=client)
         assert result["metrics"]["active_assets"] == 1
 
     def test_unknown_status(self, client_with_mock_session):
         client = client_with_mock_session
-        assets = [self._make_asset("Custom Status")]
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": assets}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client, ("Custom Status", "1000"))
         result = get_asset_health_metrics(client=client)
         # Should still count total but not any specific category
         assert result["metrics"]["total_assets"] == 1
@@ -155,18 +152,19 @@ class TestGetAssetHealthMetrics:
 
     def test_timeout_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = get_asset_health_metrics(client=client)
         assert "error" in result
 
     def test_missing_cost_field(self, client_with_mock_session):
         client = client_with_mock_session
-        rec = make_hardware_record()
-        rec.pop("cost")
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": [rec]}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client, ("In use", None))
         result = get_asset_health_metrics(client=client)
         # Should not crash, value treated as 0
         assert result["metrics"]["total_asset_value"] == 0.0
+
+    def test_status_labels_case_insensitive(self, client_with_mock_session):
+        client = client_with_mock_session
+        self._route(client, ("IN USE", "1"), ("In Stock", "1"), ("Custom", "1"))
+        m = get_asset_health_metrics(client=client)["metrics"]
+        assert (m["active_assets"], m["in_stock_assets"], m["total_assets"]) == (1, 1, 3)
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
-import requests
+from datetime import date, timedelta
+from unittest.mock import patch
 
+from snow_asset_agent.models import AssetLifecycle
 from snow_asset_agent.tools.lifecycle import STAGE_MAP, _days_since, get_asset_lifecycle
-from tests.helpers import make_hardware_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    EMPTY_LIST_RESPONSE,
+    SERVER_ERROR_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_hardware_record,
+    make_mock_response,
+)
 
 
 class TestStageMap:
@@ -46,6 +56,10 @@ class TestDaysSince:
     def test_invalid_format(self):
         assert _days_since("not-a-date") is None
 
+    def test_datetime_string(self):
+        today = date.today()
+        assert _days_since(f"{today - timedelta(days=3)} 08:15:00") == 3
+
 
 class TestGetAssetLifecycle:
     def test_by_sys_id(self, client_with_mock_session):
@@ -72,17 +86,25 @@ class TestGetAssetLifecycle:
 
     def test_not_found_by_tag(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = get_asset_lifecycle(asset_tag="MISSING", client=client)
         assert "error" in result
         assert result["error_code"] == "SN_NOT_FOUND"
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = get_asset_lifecycle(sys_id="abc", client=client)
         assert "error" in result
 
+    def test_status_case_insensitive(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(
+            json_data={"result": make_hardware_record(install_status="in use")}
+        )
+        result = get_asset_lifecycle(sys_id="abc", client=client)
+        assert result["lifecycle"]["stage"] == "Active/Deployed"
+
     def test_unknown_status_uses_raw(self, client_with_mock_session):
         client = client_with_mock_session
         client._session.get.return_value = make_mock_response(
@@ -112,15 +134,13 @@ class TestGetAssetLifecycle:
 
     def test_500_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
-        )
+        client._session.get.return_value = SERVER_ERROR_RESPONSE
         result = get_asset_lifecycle(sys_id="abc", client=client)
         assert "error" in result
 
     def test_timeout_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = get_asset_lifecycle(sys_id="abc", client=client)
         assert "error" in result
 
@@ -141,9 +161,7 @@ class TestGetAssetLifecycle:
 
     def test_401_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
+        client._session.get.return_value = UNAUTHORIZED_RESPONSE
         result = get_asset_lifecycle(sys_id="abc", client=client)
         assert "error" in result
 
@@ -154,3 +172,29 @@ class TestGetAssetLifecycle:
     def test_empty_strings(self, client_with_mock_session):
         result = get_asset_lifecycle(sys_id="", asset_tag="", client=client_with_mock_session)
         assert "error" in result
+
+    def test_requests_only_model_fields(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": [make_hardware_record()]})
+        get_asset_lifecycle(client=client, asset_tag="P1000479")
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_fields"] == ",".join(AssetLifecycle.snow_fields())
+
+    def test_repeat_lookup_served_from_cache(self, client_with_mock_session, test_config):
+        client = client_with_mock_session
+        client._session.get.return_value = make_mock_response(json_data={"result": [make_hardware_record()]})
+        with patch("snow_asset_agent.tools.lifecycle._default_client", return_value=client):
+            first = get_asset_lifecycle(asset_tag="P1000479")
+            second = get_asset_lifecycle(asset_tag="P1000479")
+            get_asset_lifecycle(asset_tag="P1000480")
+        assert first == second
+        assert client._session.get.call_count == 2
+
+    def test_not_found_is_not_cached(self, client_with_mock_session, test_config):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        with patch("snow_asset_agent.tools.lifecycle._default_client", return_value=client):
+            get_asset_lifecycle(asset_tag="nope")
+            result = get_asset_lifecycle(asset_tag="nope")
+        assert result["error_code"] == "SN_NOT_FOUND"
+        assert client._session.get.call_count == 2
@@ -2,76 +2,91 @@
 
 from __future__ import annotations
 
-import requests
+import threading
+from typing import Any
 
 from snow_asset_agent.tools.reconcile import reconcile_assets_to_cis
-from tests.helpers import make_ci_record, make_hardware_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    EMPTY_LIST_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_ci_record,
+    make_hardware_record,
+    make_mock_response,
+)
+
+
+def _linked(sys_id: str = "a1", ci: Any = "ci1", ci_name: str = "server-1") -> dict[str, Any]:
+    record = make_hardware_record(sys_id=sys_id, ci=ci)
+    record["ci.name"] = ci_name
+    return record
 
 
 class TestReconcileAssetsToCis:
+    def _route(
+        self,
+        client,
+        *,
+        linked: list[dict[str, Any]] | None = None,
+        unlinked: list[dict[str, Any]] | None = None,
+        orphans: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Answer each of the three reconcile queries with its own result set."""
+
+        def side_effect(url: str, **kwargs: Any) -> Any:
+            query = kwargs["params"]["sysparm_query"]
+            if url.endswith("/cmdb_ci"):
+                rows = orphans
+            elif "ciISNOTEMPTY" in query:
+                rows = linked
+            else:
+                rows = unlinked
+            return make_mock_response(json_data={"result": rows or []})
+
+        client._session.get.side_effect = side_effect
+
     def test_fully_matched(self, client_with_mock_session):
         client = client_with_mock_session
-        asset = make_hardware_record(sys_id="a1", ci="ci1")
-        ci = make_ci_record(sys_id="ci1", name="server-1")
-        # First call: assets, second: CIs
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": [asset]}),
-            make_mock_response(json_data={"result": [ci]}),
-        ]
+        self._route(client, linked=[_linked()])
         result = reconcile_assets_to_cis(client=client)
         assert result["matched_count"] == 1
         assert result["unmatched_assets_count"] == 0
+        assert result["matched"][0]["ci_name"] == "server-1"
 
     def test_unmatched_asset(self, client_with_mock_session):
         client = client_with_mock_session
-        asset = make_hardware_record(sys_id="a1", ci="")
-        ci = make_ci_record(sys_id="ci1")
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": [asset]}),
-            make_mock_response(json_data={"result": [ci]}),
-        ]
+        self._route(client, unlinked=[make_hardware_record(sys_id="a1", ci="")])
         result = reconcile_assets_to_cis(client=client)
         assert result["unmatched_assets_count"] == 1
         assert result["matched_count"] == 0
 
     def test_unmatched_ci(self, client_with_mock_session):
         client = client_with_mock_session
-        asset = make_hardware_record(sys_id="a1", ci="ci1")
-        ci1 = make_ci_record(sys_id="ci1")
-        ci2 = make_ci_record(sys_id="ci2", name="orphan-ci")
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": [asset]}),
-            make_mock_response(json_data={"result": [ci1, ci2]}),
-        ]
+        self._route(client, linked=[_linked()], orphans=[make_ci_record(sys_id="ci2", name="orphan-ci")])
         result = reconcile_assets_to_cis(client=client)
         assert result["unmatched_cis_count"] == 1
+        assert result["unmatched_cis"][0] == {"sys_id": "ci2", "name": "orphan-ci"}
 
-    def test_empty_assets(self, client_with_mock_session):
+    def test_empty_cis(self, client_with_mock_session):
+        """An asset whose ci no longer resolves to a CI is unmatched."""
         client = client_with_mock_session
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": []}),
-            make_mock_response(json_data={"result": [make_ci_record()]}),
-        ]
+        self._route(client, linked=[_linked(ci="ci1", ci_name="")])
         result = reconcile_assets_to_cis(client=client)
         assert result["matched_count"] == 0
-        assert result["unmatched_cis_count"] == 1
+        assert result["unmatched_assets_count"] == 1
+        assert result["unmatched_assets"][0]["sys_id"] == "a1"
 
-    def test_empty_cis(self, client_with_mock_session):
+    def test_empty_assets(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": [make_hardware_record(ci="ci1")]}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client, orphans=[make_ci_record()])
         result = reconcile_assets_to_cis(client=client)
         assert result["matched_count"] == 0
-        assert result["unmatched_assets_count"] == 1
+        assert result["unmatched_cis_count"] == 1
 
     def test_both_empty(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": []}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client)
         result = reconcile_assets_to_cis(client=client)
         assert result["matched_count"] == 0
         assert result["unmatched_assets_count"] == 0
@@ -79,25 +94,52 @@ class TestReconcileAssetsToCis:
 
     def test_ci_as_dict(self, client_with_mock_session):
         client = client_with_mock_session
-        asset = make_hardware_record(sys_id="a1")
-        asset["ci"] = {"value": "ci1", "display_value": "Server A"}
-        ci = make_ci_record(sys_id="ci1")
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": [asset]}),
-            make_mock_response(json_data={"result": [ci]}),
-        ]
+        self._route(client, linked=[_linked(ci={"value": "ci1", "display_value": "Server A"})])
         result = reconcile_assets_to_cis(client=client)
         assert result["matched_count"] == 1
+        assert result["matched"][0]["ci_sys_id"] == "ci1"
 
     def test_model_category_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": []}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client)
         reconcile_assets_to_cis(client=client, model_category="Computer")
-        first_call_params = client._session.get.call_args_list[0][1].get("params", {})
-        assert "Computer" in str(first_call_params)
+        asset_queries = [
+            c.kwargs["params"]["sysparm_query"]
+            for c in client._session.get.call_args_list
+            if c.args[0].endswith("/alm_hardware")
+        ]
+        assert len(asset_queries) == 2
+        assert all("model_category=Computer" in q for q in asset_queries)
+
+    def test_queries_filtered_server_side(self, client_with_mock_session):
+        client = client_with_mock_session
+        self._route(client)
+        reconcile_assets_to_cis(client=client, limit=50)
+        params = {
+            (c.args[0].rsplit("/", 1)[1], c.kwargs["params"]["sysparm_query"]): c.kwargs["params"]
+            for c in client._session.get.call_args_list
+        }
+        assert set(params) == {
+            ("alm_hardware", "ciISNOTEMPTY"),
+            ("alm_hardware", "ciISEMPTY"),
+            ("cmdb_ci", "assetISEMPTY"),
+        }
+        assert "ci.name" in params[("alm_hardware", "ciISNOTEMPTY")]["sysparm_fields"]
+        assert all(p["sysparm_limit"] == 50 for p in params.values())
+
+    def test_queries_run_concurrently(self, client_with_mock_session):
+        client = client_with_mock_session
+        # Every query waits for the other two; a sequential tool would time out.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def side_effect(url: str, **kwargs: Any) -> Any:
+            barrier.wait()
+            return EMPTY_LIST_RESPONSE
+
+        client._session.get.side_effect = side_effect
+        result = reconcile_assets_to_cis(client=client)
+        assert "error" not in result
+        assert client._session.get.call_count == 3
 
     def test_invalid_limit(self, client_with_mock_session):
         result = reconcile_assets_to_cis(client=client_with_mock_session, limit=0)
@@ -105,24 +147,19 @@ class TestReconcileAssetsToCis:
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = reconcile_assets_to_cis(client=client)
         assert "error" in result
 
     def test_401_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
+        client._session.get.return_value = UNAUTHORIZED_RESPONSE
         result = reconcile_assets_to_cis(client=client)
         assert "error" in result
 
     def test_output_structure(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": []}),
-            make_mock_response(json_data={"result": []}),
-        ]
+        self._route(client)
         result = reconcile_assets_to_cis(client=client)
         for key in [
             "matched",
@@ -136,12 +173,7 @@ class TestReconcileAssetsToCis:
 
     def test_matched_item_structure(self, client_with_mock_session):
         client = client_with_mock_session
-        asset = make_hardware_record(sys_id="a1", ci="ci1")
-        ci = make_ci_record(sys_id="ci1")
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": [asset]}),
-            make_mock_response(json_data={"result": [ci]}),
-        ]
+        self._route(client, linked=[_linked()])
         result = reconcile_assets_to_cis(client=client)
         m = result["matched"][0]
         assert "asset_sys_id" in m
@@ -149,20 +181,12 @@ class TestReconcileAssetsToCis:
 
     def test_multiple_assets_and_cis(self, client_with_mock_session):
         client = client_with_mock_session
-        assets = [
-            make_hardware_record(sys_id="a1", ci="ci1"),
-            make_hardware_record(sys_id="a2", ci="ci2"),
-            make_hardware_record(sys_id="a3", ci=""),
-        ]
-        cis = [
-            make_ci_record(sys_id="ci1"),
-            make_ci_record(sys_id="ci2"),
-            make_ci_record(sys_id="ci3"),
-        ]
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": assets}),
-            make_mock_response(json_data={"result": cis}),
-        ]
+        self._route(
+            client,
+            linked=[_linked("a1", "ci1"), _linked("a2", "ci2")],
+            unlinked=[make_hardware_record(sys_id="a3", ci="")],
+            orphans=[make_ci_record(sys_id="ci3")],
+        )
         result = reconcile_assets_to_cis(client=client)
         assert result["matched_count"] == 2
         assert result["unmatched_assets_count"] == 1
@@ -170,20 +194,10 @@ class TestReconcileAssetsToCis:
 
     def test_timeout_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = reconcile_assets_to_cis(client=client)
         assert "error" in result
 
     def test_negative_limit(self, client_with_mock_session):
         result = reconcile_assets_to_cis(client=client_with_mock_session, limit=-1)
         assert "error" in result
-
-    def test_none_ci_field(self, client_with_mock_session):
-        client = client_with_mock_session
-        asset = make_hardware_record(sys_id="a1", ci=None)
-        client._session.get.side_effect = [
-            make_mock_response(json_data={"result": [asset]}),
-            make_mock_response(json_data={"result": []}),
-        ]
-        result = reconcile_assets_to_cis(client=client)
-        assert result["unmatched_assets_count"] == 1
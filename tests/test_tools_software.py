@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-import requests
-
 from snow_asset_agent.tools.software import _build_query, query_software_licenses
-from tests.helpers import make_license_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    EMPTY_LIST_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_license_record,
+    make_mock_response,
+)
 
 
 class TestBuildQuery:
@@ -18,6 +23,9 @@ class TestBuildQuery:
     def test_product(self):
         assert _build_query(product="Office") == "software_modelLIKEOffice"
 
+    def test_caret_stripped_from_values(self):
+        assert _build_query(vendor="Adobe^NQ", product="^Office") == "vendorLIKEAdobeNQ^software_modelLIKEOffice"
+
     def test_expiring_soon(self):
         q = _build_query(expiring_soon=30)
         assert "end_date>=" in q
@@ -39,31 +47,31 @@ class TestQuerySoftwareLicenses:
 
     def test_empty_results(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = query_software_licenses(client=client)
         assert result["licenses"] == []
         assert result["count"] == 0
 
     def test_vendor_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         query_software_licenses(client=client, vendor="Microsoft")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Microsoft" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Microsoft" in params["sysparm_query"]
 
     def test_product_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         query_software_licenses(client=client, product="Office")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Office" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Office" in params["sysparm_query"]
 
     def test_expiring_soon_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         query_software_licenses(client=client, expiring_soon=60)
-        params = client._session.get.call_args[1].get("params", {})
-        assert "end_date" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "end_date" in params["sysparm_query"]
 
     def test_invalid_limit(self, client_with_mock_session):
         result = query_software_licenses(client=client_with_mock_session, limit=0)
@@ -76,16 +84,14 @@ class TestQuerySoftwareLicenses:
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = query_software_licenses(client=client)
         assert "error" in result
         assert result["error_code"] == "SN_QUERY_ERROR"
 
     def test_401_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
+        client._session.get.return_value = UNAUTHORIZED_RESPONSE
         result = query_software_licenses(client=client)
         assert "error" in result
 
@@ -121,12 +127,12 @@ class TestQuerySoftwareLicenses:
 
     def test_timeout_returns_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = query_software_licenses(client=client)
         assert "error" in result
 
     def test_no_filters(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = query_software_licenses(client=client)
         assert result["count"] == 0
@@ -2,10 +2,37 @@
 
 from __future__ import annotations
 
-import requests
+from typing import Any
 
 from snow_asset_agent.tools.underutilized import _safe_float, find_underutilized_assets
-from tests.helpers import make_hardware_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    SERVER_ERROR_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_hardware_record,
+    make_mock_response,
+)
+
+
+def _respond(client: Any, records: list[dict[str, Any]], *, total: float | None = None) -> None:
+    """Answer the row query with *records* and the Aggregate query with a cost sum.
+
+    The sum defaults to the cost of *records*; pass *total* to model matches
+    beyond the returned page.
+    """
+    if total is None:
+        total = sum(float(r.get("cost") or 0) for r in records)
+    stats = {"stats": {"count": str(len(records)), "sum": {"cost": str(total)}}}
+
+    def _get(url: str, *args: Any, **kwargs: Any) -> Any:
+        return make_mock_response(json_data={"result": stats if "/stats/" in url else records})
+
+    client._session.get.side_effect = _get
+
+
+def _table_params(client: Any) -> dict[str, Any]:
+    return next(c.kwargs["params"] for c in client._session.get.call_args_list if "/table/" in c.args[0])
 
 
 class TestSafeFloat:
@@ -23,44 +50,43 @@ class TestFindUnderutilizedAssets:
     def test_happy_path(self, client_with_mock_session):
         client = client_with_mock_session
         rec = make_hardware_record(sys_updated_on="2020-01-01 00:00:00")
-        client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
+        _respond(client, [rec])
         result = find_underutilized_assets(client=client)
         assert "underutilized_assets" in result
         assert result["count"] == 1
 
     def test_empty_results(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        _respond(client, [])
         result = find_underutilized_assets(client=client)
         assert result["count"] == 0
 
     def test_unassigned_reason(self, client_with_mock_session):
         client = client_with_mock_session
         rec = make_hardware_record(assigned_to="", sys_updated_on="2020-01-01 00:00:00")
-        client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
+        _respond(client, [rec])
         result = find_underutilized_assets(client=client)
         assert result["underutilized_assets"][0]["reason"] == "unassigned"
 
     def test_inactive_reason(self, client_with_mock_session):
         client = client_with_mock_session
         rec = make_hardware_record(assigned_to="John", sys_updated_on="2020-01-01 00:00:00")
-        client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
+        _respond(client, [rec])
         result = find_underutilized_assets(client=client)
         assert result["underutilized_assets"][0]["reason"] == "inactive"
 
     def test_waste_cost(self, client_with_mock_session):
         client = client_with_mock_session
         rec = make_hardware_record(cost="2000")
-        client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
+        _respond(client, [rec])
         result = find_underutilized_assets(client=client)
         assert result["estimated_waste_cost"] == 2000.0
 
     def test_custom_threshold(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        _respond(client, [])
         find_underutilized_assets(client=client, days_threshold=30)
-        params = client._session.get.call_args[1].get("params", {})
-        assert "sys_updated_on" in str(params)
+        assert "sys_updated_on" in _table_params(client)["sysparm_query"]
 
     def test_invalid_limit(self, client_with_mock_session):
         result = find_underutilized_assets(client=client_with_mock_session, limit=0)
@@ -72,30 +98,26 @@ class TestFindUnderutilizedAssets:
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = find_underutilized_assets(client=client)
         assert "error" in result
 
     def test_401_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
+        client._session.get.return_value = UNAUTHORIZED_RESPONSE
         result = find_underutilized_assets(client=client)
         assert "error" in result
 
     def test_500_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
-        )
+        client._session.get.return_value = SERVER_ERROR_RESPONSE
         result = find_underutilized_assets(client=client)
         assert "error" in result
 
     def test_output_structure(self, client_with_mock_session):
         client = client_with_mock_session
         rec = make_hardware_record()
-        client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
+        _respond(client, [rec])
         result = find_underutilized_assets(client=client)
         assert "underutilized_assets" in result
         assert "count" in result
@@ -104,7 +126,7 @@ class TestFindUnderutilizedAssets:
     def test_asset_item_structure(self, client_with_mock_session):
         client = client_with_mock_session
         rec = make_hardware_record()
-        client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
+        _respond(client, [rec])
         result = find_underutilized_assets(client=client)
         item = result["underutilized_assets"][0]
         for key in ["sys_id", "asset_tag", "display_name", "reason", "cost"]:
@@ -113,14 +135,14 @@ class TestFindUnderutilizedAssets:
     def test_multiple_assets(self, client_with_mock_session):
         client = client_with_mock_session
         records = [make_hardware_record(sys_id=f"a{i}", cost=f"{i * 1000}") for i in range(1, 4)]
-        client._session.get.return_value = make_mock_response(json_data={"result": records})
+        _respond(client, records)
         result = find_underutilized_assets(client=client)
         assert result["count"] == 3
         assert result["estimated_waste_cost"] == 6000.0
 
     def test_timeout_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = find_underutilized_assets(client=client)
         assert "error" in result
 
@@ -136,6 +158,31 @@ class TestFindUnderutilizedAssets:
         client = client_with_mock_session
         rec = make_hardware_record()
         rec.pop("cost")
-        client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
+        _respond(client, [rec])
         result = find_underutilized_assets(client=client)
         assert result["underutilized_assets"][0]["cost"] == 0.0
+
+    def test_requests_only_needed_fields(self, client_with_mock_session):
+        client = client_with_mock_session
+        _respond(client, [])
+        find_underutilized_assets(client=client)
+        fields = _table_params(client)["sysparm_fields"].split(",")
+        assert set(fields) == {
+            "sys_id",
+            "asset_tag",
+            "display_name",
+            "install_status",
+            "assigned_to",
+            "sys_updated_on",
+            "cost",
+        }
+
+    def test_waste_cost_summed_server_side(self, client_with_mock_session):
+        client = client_with_mock_session
+        _respond(client, [make_hardware_record(cost="100")], total=12345.678)
+        result = find_underutilized_assets(client=client, limit=1)
+        assert result["count"] == 1
+        assert result["estimated_waste_cost"] == 12345.68
+        stats_params = next(c.kwargs["params"] for c in client._session.get.call_args_list if "/stats/" in c.args[0])
+        assert stats_params["sysparm_sum_fields"] == "cost"
+        assert stats_params["sysparm_query"] == _table_params(client)["sysparm_query"]
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-import requests
+import pytest
 
 from snow_asset_agent.tools.utilization import _safe_int, get_license_utilization
-from tests.helpers import make_license_record, make_mock_response
+from tests.helpers import (
+    CONN_ERR,
+    EMPTY_LIST_RESPONSE,
+    SERVER_ERROR_RESPONSE,
+    TIMEOUT_ERR,
+    UNAUTHORIZED_RESPONSE,
+    make_license_record,
+    make_mock_response,
+)
 
 
 class TestSafeInt:
@@ -50,23 +58,23 @@ class TestGetLicenseUtilization:
 
     def test_empty_results(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         result = get_license_utilization(client=client)
         assert result["count"] == 0
 
     def test_product_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         get_license_utilization(client=client, product="Office")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Office" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Office" in params["sysparm_query"]
 
     def test_vendor_filter(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(json_data={"result": []})
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
         get_license_utilization(client=client, vendor="Microsoft")
-        params = client._session.get.call_args[1].get("params", {})
-        assert "Microsoft" in str(params)
+        params = client._session.get.call_args.kwargs["params"]
+        assert "Microsoft" in params["sysparm_query"]
 
     def test_invalid_limit(self, client_with_mock_session):
         result = get_license_utilization(client=client_with_mock_session, limit=0)
@@ -75,23 +83,19 @@ class TestGetLicenseUtilization:
 
     def test_connection_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.ConnectionError("fail")
+        client._session.get.side_effect = CONN_ERR
         result = get_license_utilization(client=client)
         assert "error" in result
 
     def test_401_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=401, ok=False, json_data={"error": {"message": "unauth"}}
-        )
+        client._session.get.return_value = UNAUTHORIZED_RESPONSE
         result = get_license_utilization(client=client)
         assert "error" in result
 
     def test_500_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.return_value = make_mock_response(
-            status_code=500, ok=False, json_data={"error": {"message": "internal"}}
-        )
+        client._session.get.return_value = SERVER_ERROR_RESPONSE
         result = get_license_utilization(client=client)
         assert "error" in result
 
@@ -116,7 +120,7 @@ class TestGetLicenseUtilization:
 
     def test_timeout_error(self, client_with_mock_session):
         client = client_with_mock_session
-        client._session.get.side_effect = requests.Timeout("timed out")
+        client._session.get.side_effect = TIMEOUT_ERR
         result = get_license_utilization(client=client)
         assert "error" in result
 
@@ -128,6 +132,19 @@ class TestGetLicenseUtilization:
         result = get_license_utilization(client=client)
         assert result["utilization"][0]["product"] == "AutoCAD"
 
+    @pytest.mark.parametrize(
+        "models",
+        [[{"display_value": "AutoCAD", "value": "ac1"}, ""], ["", {"display_value": "AutoCAD", "value": "ac1"}]],
+        ids=["dict_first", "empty_first"],
+    )
+    def test_mixed_software_model_shapes(self, client_with_mock_session, models):
+        """Empty references come back as "" alongside dicts for filled ones."""
+        client = client_with_mock_session
+        records = [make_license_record(sys_id=f"lic{i}", software_model=m) for i, m in enumerate(models)]
+        client._session.get.return_value = make_mock_response(json_data={"result": records})
+        result = get_license_utilization(client=client)
+        assert sorted(item["product"] for item in result["utilization"]) == ["", "AutoCAD"]
+
     def test_negative_limit(self, client_with_mock_session):
         result = get_license_utilization(client=client_with_mock_session, limit=-1)
         assert "error" in result
@@ -145,3 +162,10 @@ class TestGetLicenseUtilization:
         client._session.get.return_value = make_mock_response(json_data={"result": [rec]})
         result = get_license_utilization(client=client)
         assert result["utilization"][0]["utilization_pct"] == 150.0
+
+    def test_requests_only_needed_fields(self, client_with_mock_session):
+        client = client_with_mock_session
+        client._session.get.return_value = EMPTY_LIST_RESPONSE
+        get_license_utilization(client=client)
+        params = client._session.get.call_args.kwargs["params"]
+        assert params["sysparm_fields"] == "sys_id,software_model,rights,allocated"